@@ -12,9 +12,35 @@ Audit CLI tool version numbers.
 
 __all__ = ["validate", "process_tools", "read_config", "check_tool_availability", "models", "__version__", "__about__"]
 
+import importlib
+
 import cli_tool_audit.__about__ as __about__
-import cli_tool_audit.models as models
 from cli_tool_audit.__about__ import __version__
-from cli_tool_audit.call_tools import check_tool_availability
-from cli_tool_audit.config_reader import read_config
-from cli_tool_audit.views import process_tools, validate
+
+# Loaded on first use so that light modules such as the client don't import the whole package.
+_LAZY_EXPORTS = {
+    "validate": "cli_tool_audit.views",
+    "process_tools": "cli_tool_audit.views",
+    "read_config": "cli_tool_audit.config_reader",
+    "check_tool_availability": "cli_tool_audit.call_tools",
+    "models": "cli_tool_audit.models",
+}
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import a public name on first access.
+
+    Args:
+        name (str): The attribute.
+
+    Returns:
+        object: The function or module.
+
+    Raises:
+        AttributeError: If name is not exported.
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_EXPORTS[name])
+    return module if module.__name__.endswith(f".{name}") else getattr(module, name)
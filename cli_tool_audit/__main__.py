@@ -1,26 +1,21 @@
 """
 Argument parsing code.
+
+Only the parser is built at import. Each handler imports what its subcommand needs, so `--version`
+loads no subsystem and `audit --format json` never loads the table, color and progress bar libraries.
 """
 
+# pylint: disable=import-outside-toplevel
 import argparse
 import logging
-import logging.config
 import sys
 from collections.abc import Sequence
 from dataclasses import fields
 from pathlib import Path
 from typing import Any
 
-import cli_tool_audit.config_manager as config_manager
-import cli_tool_audit.discover as discover
 import cli_tool_audit.freeze as freeze
-import cli_tool_audit.interactive as interactive
-import cli_tool_audit.logging_config as logging_config
 import cli_tool_audit.models as models
-import cli_tool_audit.view_npm_stress_test as demo_npm
-import cli_tool_audit.view_pipx_stress_test as demo_pipx
-import cli_tool_audit.view_venv_stress_test as demo_venv
-import cli_tool_audit.views as views
 from cli_tool_audit.__about__ import __description__, __version__
 
 logger = logging.getLogger(__name__)
@@ -32,6 +27,8 @@ def handle_read(args: argparse.Namespace) -> None:
     Args:
         args: The args from the command line.
     """
+    import cli_tool_audit.config_manager as config_manager
+
     manager = config_manager.ConfigManager(Path(args.config))
     manager.read_config()
     for tool, config in manager.tools.items():
@@ -47,6 +44,8 @@ def handle_create(args: argparse.Namespace) -> None:
     Args:
         args: The args from the command line.
     """
+    import cli_tool_audit.config_manager as config_manager
+
     kwargs = reduce_args_tool_cli_tool_config_args(args)
 
     manager = config_manager.ConfigManager(Path(args.config))
@@ -73,6 +72,8 @@ def reduce_args_tool_cli_tool_config_args(args: argparse.Namespace) -> dict[str,
 
 
 def handle_update(args: argparse.Namespace) -> None:
+    import cli_tool_audit.config_manager as config_manager
+
     kwargs = reduce_args_tool_cli_tool_config_args(args)
     manager = config_manager.ConfigManager(Path(args.config))
     manager.update_tool_config(args.tool, {k: v for k, v in kwargs.items() if k != "tool"})
@@ -85,6 +86,8 @@ def handle_delete(args: argparse.Namespace) -> None:
     Args:
         args: The args from the command line.
     """
+    import cli_tool_audit.config_manager as config_manager
+
     manager = config_manager.ConfigManager(Path(args.config))
     manager.delete_tool_config(args.tool)
     print(f"Tool {args.tool} deleted.")
@@ -96,6 +99,9 @@ def handle_interactive(args: argparse.Namespace) -> None:
     Args:
         args: The args from the command line.
     """
+    import cli_tool_audit.config_manager as config_manager
+    import cli_tool_audit.interactive as interactive
+
     manager = config_manager.ConfigManager(Path(args.config))
     interactive.interactive_config_manager(manager)
 
@@ -128,6 +134,8 @@ def handle_discover(args: argparse.Namespace) -> None:
     Args:
         args: The args from the command line.
     """
+    import cli_tool_audit.discover as discover
+
     root = Path(args.root) if args.root else None
     sources = discover.discover_tools(root)
     if not sources:
@@ -174,14 +182,24 @@ def handle_freeze(args: argparse.Namespace) -> None:
     freeze.freeze_to_screen(tool_names, args.schema)
 
 
-def handle_audit(args: argparse.Namespace) -> None:
+def handle_audit(args: argparse.Namespace) -> int | None:
     """
     Audit environment with current configuration.
 
     Args:
         args: The args from the command line.
+
+    Returns:
+        Optional[int]: With --watch, 1 if the last state fails policy, else 0.
     """
-    views.report_from_pyproject_toml(
+    if args.watch:
+        # Imported here, only watch mode needs it.
+        import cli_tool_audit.watch as watch
+
+        return watch.watch(Path(args.config), tags=args.tags, interval=args.interval)
+    import cli_tool_audit.views as views
+
+    return views.report_from_pyproject_toml(
         file_path=Path(args.config),
         exit_code_on_failure=not args.never_fail,
         file_format=args.format,
@@ -190,9 +208,181 @@ def handle_audit(args: argparse.Namespace) -> None:
         only_errors=args.only_errors,
         quiet=args.quiet,
         show_fix=args.fix,
+        stale_ok=args.stale_ok,
+        all_instances=args.all_instances,
+        locked=args.locked,
+        verify_hash=args.verify_hash,
     )
 
 
+def positive_float(value: str) -> float:
+    """
+    Parse a number of seconds that must be more than zero.
+
+    Args:
+        value (str): The argument.
+
+    Returns:
+        float: The number.
+
+    Raises:
+        argparse.ArgumentTypeError: If the argument is not a number or not positive.
+    """
+    try:
+        number = float(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}") from error
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be more than 0: {value!r}")
+    return number
+
+
+def handle_lock(args: argparse.Namespace) -> None:
+    """
+    Check every configured tool and record the results and executables in a lock file.
+
+    Args:
+        args: The args from the command line.
+    """
+    import cli_tool_audit.config_reader as config_reader
+    import cli_tool_audit.lockfile as lockfile
+    import cli_tool_audit.views as views
+
+    config_path = Path(args.config)
+    results = views.process_tools(config_reader.read_config(config_path), no_cache=True, disable_progress_bar=True)
+    lock_path = lockfile.lock_path_for(config_path)
+    lockfile.write_lock(results, lock_path, config_path)
+    print(f"Locked {len(results)} tools in {lock_path}")
+
+
+def handle_cache_stats(args: argparse.Namespace) -> None:
+    """
+    Report cache contents and hit and miss ratios.
+
+    Args:
+        args: The args from the command line.
+    """
+    import cli_tool_audit.audit_cache as audit_cache
+    import cli_tool_audit.cache_admin as cache_admin
+
+    print(cache_admin.stats_report(audit_cache.AuditFacade(), last_runs=getattr(args, "runs", 10)))
+
+
+def handle_cache_clear(_args: argparse.Namespace) -> None:
+    """
+    Remove every cache entry.
+
+    Args:
+        _args: The args from the command line.
+    """
+    import cli_tool_audit.audit_cache as audit_cache
+
+    removed = audit_cache.AuditFacade().clear()
+    print(f"Removed {removed} cache entries.")
+
+
+def handle_cache_prune(_args: argparse.Namespace) -> None:
+    """
+    Remove expired, unreadable and out of date cache entries.
+
+    Args:
+        _args: The args from the command line.
+    """
+    import cli_tool_audit.audit_cache as audit_cache
+
+    removed = audit_cache.AuditFacade().prune()
+    print(f"Pruned {removed} cache entries.")
+
+
+def handle_cache_inspect(args: argparse.Namespace) -> None:
+    """
+    Show the cache entries for one tool.
+
+    Args:
+        args: The args from the command line.
+    """
+    import cli_tool_audit.audit_cache as audit_cache
+    import cli_tool_audit.cache_admin as cache_admin
+
+    print(cache_admin.inspect_report(audit_cache.AuditFacade(), args.tool))
+
+
+def handle_cache_export(args: argparse.Namespace) -> None:
+    """
+    Write the cache to a bundle that another machine can import.
+
+    Args:
+        args: The args from the command line.
+    """
+    import cli_tool_audit.audit_cache as audit_cache
+
+    exported = audit_cache.AuditFacade().export_bundle(Path(args.bundle))
+    print(f"Exported {exported} cache entries to {args.bundle}.")
+
+
+def handle_cache_import(args: argparse.Namespace) -> None:
+    """
+    Load the entries of a bundle that match the executables on this machine.
+
+    Args:
+        args: The args from the command line.
+    """
+    import cli_tool_audit.audit_cache as audit_cache
+
+    try:
+        imported, skipped = audit_cache.AuditFacade().import_bundle(Path(args.bundle))
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}")
+        return
+    print(f"Imported {imported} cache entries, skipped {skipped} that are expired, malformed or for another machine.")
+
+
+def handle_cache_warm(args: argparse.Namespace) -> None:
+    """
+    Fill the cache for the configured tools, or the tools of a PATH category, at low priority.
+
+    Args:
+        args: The args from the command line.
+    """
+    import cli_tool_audit.audit_cache as audit_cache
+    import cli_tool_audit.config_reader as config_reader
+
+    if args.from_path is not None:
+        category = args.from_path if args.from_path else None  # "" -> None (all categories)
+        tool_configs = [models.CliToolConfig(name=tool) for tool in freeze.infer_tools_from_path(category)]
+    else:
+        tool_configs = list(config_reader.read_config(Path(args.config)).values())
+    if not tool_configs:
+        print("No tools to warm.")
+        return
+    facade = audit_cache.AuditFacade()
+    if args.background:
+        if facade.refresh_in_background(tool_configs, warm=True):
+            print(f"Warming the cache for {len(tool_configs)} tools in the background.")
+        else:
+            print("A background cache refresh is already running.")
+        return
+    audit_cache.lower_priority()
+    stats = facade.warm(tool_configs)
+    print(f"Warmed the cache for {len(tool_configs)} tools: {stats.misses} called, {stats.hits} already cached.")
+
+
+def handle_serve(args: argparse.Namespace) -> int:
+    """
+    Run the resident audit server.
+
+    Args:
+        args: The args from the command line.
+
+    Returns:
+        int: The exit code.
+    """
+    # Imported here, only the server needs socketserver.
+    import cli_tool_audit.server as server
+
+    return server.serve(Path(args.socket) if args.socket else None)
+
+
 def handle_single(args):
     """
     Audit environment with current configuration.
@@ -200,6 +390,8 @@ def handle_single(args):
     Args:
         args: The args from the command line.
     """
+    import cli_tool_audit.views as views
+
     config = models.CliToolConfig(
         name=args.tool, version=args.version, version_switch=args.version_switch, schema=args.schema, if_os=args.if_os
     )
@@ -340,8 +532,51 @@ def main(argv: Sequence[str] | None = None) -> int:
         action="store_true",
         help="Print install commands and documentation for failed tools.",
     )
+    audit_parser.add_argument(
+        "--stale-ok",
+        action="store_true",
+        help="Answer from cache at once, even if expired, and refresh expired entries in the background.",
+    )
+    audit_parser.add_argument(
+        "--all-instances",
+        action="store_true",
+        help="Check every copy of each tool on the PATH and report copies that shadow a passing one.",
+    )
+    audit_parser.add_argument(
+        "--locked",
+        action="store_true",
+        help="Answer tools unchanged since `lock` from cli-tools.lock without running them.",
+    )
+    audit_parser.add_argument(
+        "--verify-hash",
+        action="store_true",
+        help="With --locked, also compare a hash of each executable's contents.",
+    )
+    audit_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running, checking again only tools whose config or executable changed.",
+    )
+    audit_parser.add_argument(
+        "--interval",
+        type=positive_float,
+        default=2.0,
+        help="Seconds between checks for changes with --watch. (default is %(default)s)",
+    )
     audit_parser.set_defaults(func=handle_audit)
 
+    # Lock file
+    lock_parser = subparsers.add_parser("lock", help="Record checked tools and their executables in cli-tools.lock")
+    add_config_to_subparser(lock_parser)
+    lock_parser.set_defaults(func=handle_lock)
+
+    # Resident server
+    serve_parser = subparsers.add_parser("serve", help="Answer audits from memory over a Unix socket")
+    serve_parser.add_argument(
+        "--socket", help="Socket to listen on. (default is .cli_tool_audit_cache/audit.sock or CLI_TOOL_AUDIT_SOCKET)"
+    )
+    serve_parser.set_defaults(func=handle_serve)
+
     # Single audit
     single_parser = subparsers.add_parser("single", help="Audit one tool without configuration file")
     single_parser.add_argument("tool", help="Name of the tool")
@@ -352,6 +587,55 @@ def main(argv: Sequence[str] | None = None) -> int:
     single_parser.add_argument("--if-os", help="Check only on this os.")
     single_parser.set_defaults(func=handle_single)
 
+    # Cache maintenance
+    cache_parser = subparsers.add_parser("cache", help="Inspect and maintain the result cache")
+    cache_parser.set_defaults(func=handle_cache_stats)
+    cache_subparsers = cache_parser.add_subparsers(help="Cache subcommands.")
+    cache_stats_parser = cache_subparsers.add_parser("stats", help="Show cache contents and hit ratio")
+    cache_stats_parser.add_argument(
+        "--runs", type=int, default=10, help="Number of recent audits to summarize. (default is %(default)s)"
+    )
+    cache_stats_parser.set_defaults(func=handle_cache_stats)
+    cache_clear_parser = cache_subparsers.add_parser("clear", help="Remove every cache entry")
+    cache_clear_parser.set_defaults(func=handle_cache_clear)
+    cache_prune_parser = cache_subparsers.add_parser("prune", help="Remove expired and out of date cache entries")
+    cache_prune_parser.set_defaults(func=handle_cache_prune)
+    cache_inspect_parser = cache_subparsers.add_parser("inspect", help="Show the cache entries for one tool")
+    cache_inspect_parser.add_argument("tool", help="Name of the tool")
+    cache_inspect_parser.set_defaults(func=handle_cache_inspect)
+    cache_export_parser = cache_subparsers.add_parser("export", help="Write the cache to a portable bundle")
+    cache_export_parser.add_argument(
+        "bundle",
+        nargs="?",
+        default="cli-tool-audit-cache.json.gz",
+        help="Path of the bundle to write. (default is %(default)s)",
+    )
+    cache_export_parser.set_defaults(func=handle_cache_export)
+    cache_import_parser = cache_subparsers.add_parser(
+        "import", help="Load the entries of a bundle that match the executables on this machine"
+    )
+    cache_import_parser.add_argument("bundle", help="Path of the bundle to read")
+    cache_import_parser.set_defaults(func=handle_cache_import)
+    cache_warm_parser = cache_subparsers.add_parser(
+        "warm", help="Call the tools without a fresh cache entry, at low priority, so the next audit is fast"
+    )
+    add_config_to_subparser(cache_warm_parser)
+    cache_warm_parser.add_argument(
+        "--from-path",
+        "--from_path",
+        nargs="?",
+        const="",
+        metavar="CATEGORY",
+        help=(
+            "Warm the tools present on PATH instead of the configured ones, optionally filtered by category. "
+            f"Known categories: {', '.join(freeze.list_path_categories())}"
+        ),
+    )
+    cache_warm_parser.add_argument(
+        "--background", action="store_true", help="Warm in a detached process and return at once."
+    )
+    cache_warm_parser.set_defaults(func=handle_cache_warm)
+
     # Read command
     read_parser = subparsers.add_parser("read", help="Read and list all tool configurations")
     add_config_to_subparser(read_parser)
@@ -382,10 +666,27 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     # Parse the arguments
     args = parser.parse_args(argv)
+    if getattr(args, "watch", False):
+        # Watch mode prints its own table and always checks live, these would be silently ignored.
+        ignored = [
+            option
+            for option, value in (
+                ("--format", args.format != "table"),
+                ("--locked", args.locked),
+                ("--stale-ok", args.stale_ok),
+            )
+            if value
+        ]
+        if ignored:
+            audit_parser.error(f"--watch cannot be combined with {', '.join(ignored)}")
 
     if args.verbose:
+        from logging.config import dictConfig
+
+        import cli_tool_audit.logging_config as logging_config
+
         config = logging_config.generate_config(level="DEBUG")
-        logging.config.dictConfig(config)
+        dictConfig(config)
     else:
         # Essentially, quiet mode
         logging.basicConfig(level=logging.FATAL)
@@ -398,22 +699,31 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     # Demos
     if args.demo and args.demo == "pipx":
+        import cli_tool_audit.view_pipx_stress_test as demo_pipx
+
         demo_pipx.report_for_pipx_tools()
         return 0
     if args.demo and args.demo == "venv":
+        import cli_tool_audit.view_venv_stress_test as demo_venv
+
         demo_venv.report_for_venv_tools()
         return 0
     if args.demo and args.demo == "npm":
+        import cli_tool_audit.view_npm_stress_test as demo_npm
+
         demo_npm.report_for_npm_tools()
         return 0
 
     if hasattr(args, "func"):
-        args.func(args)
-        return 0
+        # Most handlers return None, those that can fail return their exit code.
+        exit_code = args.func(args)
+        return 0 if exit_code is None else exit_code
 
     # Audit
 
     # Default behavior
+    import cli_tool_audit.views as views
+
     if not args.quiet:
         print("No command specified. Auditing environment with pyproject.toml configuration.")
     file_format = "quiet" if args.quiet else "table"
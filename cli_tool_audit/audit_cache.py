@@ -2,19 +2,61 @@
 This module provides a facade for the audit manager that caches results.
 """
 
+import base64
+import copy
 import datetime
+import gzip
 import json
 import logging
 import os
 import pathlib
+import re
+import shutil
+import subprocess  # nosec
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
 import cli_tool_audit.audit_manager as audit_manager
+import cli_tool_audit.cache_record as cache_record
+import cli_tool_audit.fingerprint as fingerprint
 import cli_tool_audit.json_utils as json_utils
 import cli_tool_audit.models as models
 
-__all__ = ["AuditFacade"]
+__all__ = ["AuditFacade", "CacheStats", "MemoryCache"]
+
+CACHE_ROOT_NAME = ".cli_tool_audit_cache"
+"""Directory, relative to the working directory, that holds all cache data."""
+SHARED_CACHE_NAME = "shared"
+"""Sub-directory of the cache root that is shared by every process."""
+GC_MARKER_NAME = ".last_gc"
+"""Marker file whose mtime records when garbage collection last ran."""
+REFRESH_MARKER_NAME = ".refreshing"
+"""Marker file that exists while a background refresh is running."""
+RECORD_SUFFIX = ".rec"
+"""Suffix of cache entries, see cache_record for the format."""
+LEGACY_SUFFIX = ".json"
+"""Suffix of cache entries written by older versions as indented JSON, removed by garbage collection."""
+HISTORY_NAME = "history.jsonl"
+"""One line of cache statistics per audit that used the cache."""
+HISTORY_LENGTH = 100
+EXPIRATION_DAYS = 30
+NEGATIVE_TTL_SECONDS = 300
+"""Default lifetime of a cached missing, broken or incompatible result."""
+MEMORY_CACHE_SIZE = 256
+"""Default number of results each process keeps in memory."""
+BUNDLE_FORMAT = "cli_tool_audit-cache-bundle"
+BUNDLE_VERSION = 4
+"""Version of the layout written by `cache export`, bumped on incompatible changes."""
+BUNDLE_KEY_PATTERN = re.compile(r"[\w+-]+_[0-9a-f]{32}")
+"""Form of an entry key in a bundle, the sanitized tool name and the config hash of get_cache_filename."""
 
 
 def custom_json_deserializer(data: dict[str, Any]) -> dict[str, Any]:
@@ -26,8 +68,9 @@ def custom_json_deserializer(data: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict[str,Any]: A JSON deserializable representation of the object.
     """
-    if "last_modified" in data and data["last_modified"]:
-        data["last_modified"] = datetime.datetime.fromisoformat(data["last_modified"])
+    for key in ("last_modified", "checked_at"):
+        if key in data and data[key]:
+            data[key] = datetime.datetime.fromisoformat(data[key])
     if "tool_config" in data and data["tool_config"]:
         for key, value in data["tool_config"].items():
             if isinstance(value, str) and key == "schema":
@@ -39,105 +82,819 @@ def custom_json_deserializer(data: dict[str, Any]) -> dict[str, Any]:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CacheStats:
+    """
+    Cache hits and misses for one audit, shared by the facades of every tool in it.
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    """Hits on expired entries, only possible with --stale-ok. Also counted in hits."""
+    misses: int = 0
+    saved_seconds: float = 0.0
+    """Sum of the original check durations of the cache hits."""
+    probe_seconds: float = 0.0
+    """Time spent checking tools on cache misses."""
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_hit(self, result: models.ToolCheckResult, stale: bool) -> None:
+        """
+        Count a cache hit.
+        Args:
+            result (models.ToolCheckResult): The cached result.
+            stale (bool): True if the entry had expired.
+        """
+        with self._lock:
+            self.hits += 1
+            self.stale_hits += int(stale)
+            self.saved_seconds += result.check_duration or 0.0
+
+    def record_miss(self, result: models.ToolCheckResult) -> None:
+        """
+        Count a cache miss.
+        Args:
+            result (models.ToolCheckResult): The freshly checked result.
+        """
+        with self._lock:
+            self.misses += 1
+            self.probe_seconds += result.check_duration or 0.0
+
+    @property
+    def lookups(self) -> int:
+        """Number of times the cache was consulted."""
+        return self.hits + self.misses
+
+    def summary(self) -> str:
+        """
+        Summarize for the end of an audit report.
+
+        Returns:
+            str: A single line, e.g. "Cache: 8 hits (1 stale), 2 misses, 80% hit ratio, 3.2s saved".
+        """
+        ratio = self.hits / self.lookups if self.lookups else 0.0
+        stale = f" ({self.stale_hits} stale)" if self.stale_hits else ""
+        return (
+            f"Cache: {self.hits} hits{stale}, {self.misses} misses, {ratio:.0%} hit ratio, "
+            f"{self.saved_seconds:.1f}s saved"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to a JSON serializable dict.
+
+        Returns:
+            dict[str, Any]: The counters.
+        """
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "saved_seconds": round(self.saved_seconds, 3),
+            "probe_seconds": round(self.probe_seconds, 3),
+        }
+
+
+class MemoryCache:
+    """
+    Results already seen by this process, for long-lived callers such as the GUI that audit repeatedly.
+
+    Entries are keyed by tool and configuration and remember the executable fingerprint they were
+    checked against; an entry is dropped as soon as the fingerprint changes. The least recently used
+    entries are evicted beyond CLI_TOOL_AUDIT_MEMORY_CACHE_SIZE.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple[str, str, str], tuple[str, models.ToolCheckResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def max_entries() -> int:
+        """
+        How many results to keep.
+
+        Returns:
+            int: The limit, 0 disables the cache.
+        """
+        return int(os.environ.get("CLI_TOOL_AUDIT_MEMORY_CACHE_SIZE", MEMORY_CACHE_SIZE))
+
+    def get(
+        self, cache_dir: Path, tool_config: models.CliToolConfig, executable_fingerprint: str
+    ) -> models.ToolCheckResult | None:
+        """
+        Look up a result.
+
+        Args:
+            cache_dir (Path): The disk cache the result belongs with.
+            tool_config (models.CliToolConfig): The tool.
+            executable_fingerprint (str): The current fingerprint of the executable.
+
+        Returns:
+            Optional[models.ToolCheckResult]: A copy of the result, or None if missing or the executable changed.
+        """
+        key = (str(cache_dir), tool_config.name, tool_config.cache_hash())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != executable_fingerprint:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.copy(entry[1])
+
+    def put(
+        self,
+        cache_dir: Path,
+        tool_config: models.CliToolConfig,
+        executable_fingerprint: str,
+        result: models.ToolCheckResult,
+    ) -> None:
+        """
+        Remember a result, evicting the least recently used beyond the limit.
+
+        Args:
+            cache_dir (Path): The disk cache the result belongs with.
+            tool_config (models.CliToolConfig): The tool.
+            executable_fingerprint (str): The fingerprint of the executable the result describes.
+            result (models.ToolCheckResult): The result.
+        """
+        limit = self.max_entries()
+        if limit <= 0:
+            return
+        key = (str(cache_dir), tool_config.name, tool_config.cache_hash())
+        with self._lock:
+            self._entries[key] = (executable_fingerprint, copy.copy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > limit:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget everything."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+MEMORY_CACHE = MemoryCache()
+"""The process-wide memory cache, shared by every AuditFacade."""
+
+
+def _is_abandoned_pid_dir(pid_dir: Path, now: float) -> bool:
+    """
+    Check if a per-process cache directory belongs to a process that has exited.
+
+    Args:
+        pid_dir (Path): A directory named after a process id.
+        now (float): The current time as a timestamp.
+
+    Returns:
+        bool: True if the directory can be deleted.
+    """
+    pid = int(pid_dir.name)
+    if pid == os.getpid():
+        return False
+    if os.name == "nt":
+        # os.kill(pid, 0) terminates the process on Windows, so fall back to age.
+        return now - pid_dir.stat().st_mtime > datetime.timedelta(days=1).total_seconds()
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        # Running, but owned by another user.
+        return False
+    return False
+
+
+def _bundle_entry(entry: Any) -> tuple[str, str, bytes]:
+    """
+    Read the key, fingerprint digest and record of a bundle entry.
+
+    Args:
+        entry (Any): An element of the bundle's entries.
+
+    Returns:
+        tuple[str, str, bytes]: The cache key, the fingerprint digest and the decoded record.
+
+    Raises:
+        ValueError: If the entry is not an object of strings or the record is not base64.
+    """
+    if not isinstance(entry, dict):
+        raise ValueError(f"entry is a {type(entry).__name__}, not an object")
+    key, digest, record = (entry.get(field) for field in ("key", "fingerprint", "record"))
+    if not isinstance(key, str) or not isinstance(digest, str) or not isinstance(record, str):
+        raise ValueError("entry needs a key, fingerprint and record")
+    return key, digest, base64.b64decode(record, validate=True)
+
+
 class AuditFacade:
-    def __init__(self, cache_dir: Path | None = None) -> None:
+    def __init__(self, cache_dir: Path | None = None, stats: CacheStats | None = None) -> None:
         """
         Initialize the facade.
         Args:
             cache_dir (Optional[str], optional): The directory to use for caching. Defaults to None.
+            stats (Optional[CacheStats], optional): Where to count hits and misses, share one across the
+                facades of an audit. Defaults to None.
         """
         self.audit_manager = audit_manager.AuditManager()
-        self.cache_dir = cache_dir if cache_dir else Path.cwd() / ".cli_tool_audit_cache" / str(os.getpid())
+        self.stats = stats if stats is not None else CacheStats()
+        self.cache_dir = cache_dir if cache_dir else Path.cwd() / CACHE_ROOT_NAME / SHARED_CACHE_NAME
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         gitignore = self.cache_dir.parent / ".gitignore"
         if not gitignore.exists():
             with open(gitignore, "w", encoding="utf-8") as file:
                 file.write("*\n!.gitignore\n")
 
-        self.clear_old_cache_files()
+        self.collect_garbage_if_due()
         self.cache_hit = False
+        self.cache_stale = False
+
+    def collect_garbage_if_due(self) -> bool:
+        """
+        Run clear_old_cache_files, but at most once per CLI_TOOL_AUDIT_CACHE_GC_INTERVAL seconds.
+
+        A facade is created for every tool, so the common path must cost no more than one stat of
+        the marker file, however large the cache is.
+
+        Returns:
+            bool: True if garbage collection ran.
+        """
+        interval = int(os.environ.get("CLI_TOOL_AUDIT_CACHE_GC_INTERVAL", 3600))
+        marker = self.cache_dir / GC_MARKER_NAME
+        try:
+            last_run = marker.stat().st_mtime
+        except FileNotFoundError:
+            last_run = 0.0
+        if time.time() - last_run < interval:
+            return False
+        # Claim this run before doing the work so concurrent workers don't all collect.
+        marker.touch()
+        self.clear_old_cache_files()
+        return True
 
     def clear_old_cache_files(self) -> None:
         """
-        Clear cache files that are older than 30 days.
+        Clear cache files that are older than 30 days, then evict the least recently used files until the
+        cache fits in CLI_TOOL_AUDIT_CACHE_MAX_ENTRIES and CLI_TOOL_AUDIT_CACHE_MAX_BYTES. Also removes
+        per-process cache directories left behind by processes that have exited.
+        """
+        max_entries = int(os.environ.get("CLI_TOOL_AUDIT_CACHE_MAX_ENTRIES", 1000))
+        max_bytes = int(os.environ.get("CLI_TOOL_AUDIT_CACHE_MAX_BYTES", 10 * 1024 * 1024))
+        max_age = datetime.timedelta(days=EXPIRATION_DAYS).total_seconds()
+        now = time.time()
+
+        # mtime is when an entry was written, atime is when it was last read.
+        live: list[tuple[float, int, str]] = []
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                is_temp = entry.name.endswith(".tmp")
+                if not is_temp and not entry.name.endswith((RECORD_SUFFIX, LEGACY_SUFFIX)):
+                    continue
+                try:
+                    stat = entry.stat()
+                    if entry.name.endswith(LEGACY_SUFFIX) or now - stat.st_mtime > max_age:
+                        os.unlink(entry.path)
+                    elif not is_temp:
+                        live.append((stat.st_atime, stat.st_size, entry.path))
+                except FileNotFoundError:
+                    # This appears to be intermittent. If it is already gone, no problem, I guess.
+                    logger.debug(f"Failed to find cache file {entry.path}")
+
+        live.sort()
+        total_bytes = sum(size for _, size, _ in live)
+        evicted = 0
+        while evicted < len(live) and (len(live) - evicted > max_entries or total_bytes > max_bytes):
+            _, size, path = live[evicted]
+            logger.debug(f"Evicting least recently used cache file {path}")
+            pathlib.Path(path).unlink(missing_ok=True)
+            total_bytes -= size
+            evicted += 1
+
+        self.remove_abandoned_pid_dirs()
+
+    def remove_abandoned_pid_dirs(self) -> None:
         """
-        current_time = datetime.datetime.now()
-        expiration_days = 30
-        for cache_file in self.cache_dir.glob("*.json"):
+        Remove per-process cache directories whose process is no longer running.
+
+        Versions before the shared cache directory wrote to one directory per process id.
+        """
+        cache_root = self.cache_dir.parent
+        if cache_root.name != CACHE_ROOT_NAME:
+            # Not the standard layout, a numeric directory here could be anything.
+            return
+        now = time.time()
+        for child in cache_root.iterdir():
             try:
-                file_creation_time = datetime.datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if (current_time - file_creation_time) > datetime.timedelta(days=expiration_days):
-                    if cache_file.exists():
-                        cache_file.unlink(missing_ok=True)  # Delete the file
+                if child.name.isdigit() and child.is_dir() and _is_abandoned_pid_dir(child, now):
+                    logger.debug(f"Removing abandoned cache directory {child}")
+                    shutil.rmtree(child, ignore_errors=True)
             except FileNotFoundError:
-                # This appears to be intermittent. If it is already gone, no problem, I guess.
-                logger.debug(f"Failed to find cache file {cache_file}")
+                logger.debug(f"Failed to find cache directory {child}")
+
+    @staticmethod
+    def mark_used(cache_file: Path) -> None:
+        """
+        Record a read for LRU eviction by updating the access time, leaving the modified time alone.
 
-    def get_cache_filename(self, tool_config: models.CliToolConfig) -> Path:
+        Args:
+            cache_file (Path): The cache file that was read.
+        """
+        try:
+            stat = cache_file.stat()
+            os.utime(cache_file, ns=(time.time_ns(), stat.st_mtime_ns))
+        except OSError:
+            logger.debug(f"Failed to update access time of {cache_file}")
+
+    def get_cache_filename(self, tool_config: models.CliToolConfig, the_fingerprint: str | None = None) -> Path:
         """
         Get the cache filename for the given tool.
+
+        The name includes the fingerprint of the executable, so an entry stops matching as soon as the
+        tool appears on, disappears from or changes on the PATH.
+
         Args:
             tool_config (models.CliToolConfig): The tool to get the cache filename for.
+            the_fingerprint (Optional[str], optional): The fingerprint digest of the tool, if the caller already
+                has it. Defaults to None, computing it.
 
         Returns:
             Path: The cache filename.
         """
         sanitized_name = tool_config.name.replace(".", "_")
         the_hash = tool_config.cache_hash()
-        return self.cache_dir / f"{sanitized_name}_{the_hash}.json"
+        if the_fingerprint is None:
+            the_fingerprint = fingerprint.fingerprint_digest(tool_config.name)
+        return self.cache_dir / f"{sanitized_name}_{the_hash}_{the_fingerprint}{RECORD_SUFFIX}"
+
+    @staticmethod
+    def time_to_live(result: models.ToolCheckResult) -> float:
+        """
+        How long a result stays fresh. Problems get a short life of their own so a fix is noticed soon.
+
+        Args:
+            result (models.ToolCheckResult): The cached result.
+
+        Returns:
+            float: Seconds the result is valid for after it was written.
+        """
+        if result.is_problem():
+            return float(os.environ.get("CLI_TOOL_AUDIT_NEGATIVE_CACHE_TTL", NEGATIVE_TTL_SECONDS))
+        default_ttl = datetime.timedelta(days=EXPIRATION_DAYS).total_seconds()
+        return float(os.environ.get("CLI_TOOL_AUDIT_CACHE_TTL", default_ttl))
 
-    def read_from_cache(self, tool_config: models.CliToolConfig) -> models.ToolCheckResult | None:
+    @classmethod
+    def is_expired(cls, result: models.ToolCheckResult) -> bool:
+        """
+        Check if a result is older than its time to live.
+
+        Args:
+            result (models.ToolCheckResult): The result to check.
+
+        Returns:
+            bool: True if the result should be checked again. Results of unknown age are expired.
+        """
+        if not result.is_needed_for_os:
+            return False
+        age = result.age_seconds()
+        return age is None or age > cls.time_to_live(result)
+
+    def read_from_cache(
+        self, tool_config: models.CliToolConfig, allow_stale: bool = False, the_fingerprint: str | None = None
+    ) -> models.ToolCheckResult | None:
         """
         Read the cached result for the given tool.
         Args:
             tool_config (models.CliToolConfig): The tool to get the cached result for.
+            allow_stale (bool, optional): Return expired entries too, as long as the executable is unchanged.
+                Defaults to False.
+            the_fingerprint (Optional[str], optional): The fingerprint digest of the tool. Defaults to None,
+                computing it.
 
         Returns:
             Optional[models.ToolCheckResult]: The cached result or None if not found.
         """
-        cache_file = self.get_cache_filename(tool_config)
+        cache_file = self.get_cache_filename(tool_config, the_fingerprint)
         if cache_file.exists():
-            logger.debug(f"Cache hit for {tool_config.name}")
             try:
-                with open(cache_file, encoding="utf-8") as file:
-                    hit = models.ToolCheckResult(**json.load(file, object_hook=custom_json_deserializer))
-                    self.cache_hit = True
-                    return hit
-            except TypeError:
-                pathlib.Path(cache_file).unlink()
+                hit = cache_record.decode(cache_file.read_bytes())
+                age = hit.age_seconds()
+                if age is None:
+                    # Not stamped with a check time, the file time is close enough.
+                    age = time.time() - cache_file.stat().st_mtime
+            except ValueError:
+                pathlib.Path(cache_file).unlink(missing_ok=True)
                 self.cache_hit = False
                 return None
+            except FileNotFoundError:
+                # Evicted by another process between the check and the read.
+                self.cache_hit = False
+                return None
+            # The record only keeps the fields that decide how the tool is checked, the caller's config
+            # has the same cache key and brings back tags and install hints.
+            hit.tool_config = tool_config
+            self.cache_stale = age > self.time_to_live(hit)
+            if not self.cache_stale or allow_stale:
+                logger.debug(f"Cache hit for {tool_config.name}, {age:.0f} seconds old")
+                self.mark_used(cache_file)
+                self.cache_hit = True
+                return hit
+            logger.debug(f"Cache entry for {tool_config.name} expired, {age:.0f} seconds old")
         logger.debug(f"Cache miss for {tool_config.name}")
         self.cache_hit = False
         return None
 
-    def write_to_cache(self, tool_config: models.CliToolConfig, result: models.ToolCheckResult) -> None:
+    def write_to_cache(
+        self, tool_config: models.CliToolConfig, result: models.ToolCheckResult, the_fingerprint: str | None = None
+    ) -> None:
         """
         Write the given result to the cache.
         Args:
             tool_config (models.CliToolConfig): The tool to write the result for.
             result (models.ToolCheckResult): The result to write.
+            the_fingerprint (Optional[str], optional): The fingerprint digest of the tool. Defaults to None,
+                computing it.
+        """
+        logger.debug(f"Caching {tool_config.name}")
+        self.write_atomically(self.get_cache_filename(tool_config, the_fingerprint), cache_record.encode(result))
+
+    def write_atomically(self, target: Path, data: bytes) -> None:
+        """
+        Write a file in the cache directory so that readers never see half of it.
+
+        The cache directory is shared between processes, so write to a temporary file then rename.
+
+        Args:
+            target (Path): The file to write.
+            data (bytes): The content.
         """
-        cache_file = self.get_cache_filename(tool_config)
-        with open(cache_file, "w", encoding="utf-8") as file:
-            logger.debug(f"Caching {tool_config.name}")
-            json.dump(result.__dict__, file, ensure_ascii=False, indent=4, default=json_utils.custom_json_serializer)
+        handle, temp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with open(handle, "wb") as file:
+                file.write(data)
+            os.replace(temp_name, target)
+        except BaseException:
+            pathlib.Path(temp_name).unlink(missing_ok=True)
+            raise
 
-    def call_and_check(self, tool_config: models.CliToolConfig) -> models.ToolCheckResult:
+    def call_and_check(self, tool_config: models.CliToolConfig, allow_stale: bool = False) -> models.ToolCheckResult:
         """
         Call and check the given tool.
         Args:
             tool_config (models.CliToolConfig): The tool to call and check.
+            allow_stale (bool, optional): Answer from expired cache entries instead of calling the tool.
+                Defaults to False.
 
         Returns:
             models.ToolCheckResult: The result of the check.
         """
-        cached_result = self.read_from_cache(tool_config)
+        executable_fingerprint = fingerprint.get_executable_fingerprint(tool_config.name)
+        remembered = MEMORY_CACHE.get(self.cache_dir, tool_config, executable_fingerprint)
+        if remembered is not None:
+            self.cache_stale = self.is_expired(remembered)
+            if not self.cache_stale or allow_stale:
+                logger.debug(f"Memory cache hit for {tool_config.name}")
+                self.cache_hit = True
+                self.stats.record_hit(remembered, stale=self.cache_stale)
+                return remembered
+
+        # Resolving the fingerprint walks the whole launcher chain, do it once for the read and the write.
+        the_fingerprint = fingerprint.digest(executable_fingerprint)
+        cached_result = self.read_from_cache(tool_config, allow_stale=allow_stale, the_fingerprint=the_fingerprint)
         if cached_result:
+            self.stats.record_hit(cached_result, stale=self.cache_stale)
+            MEMORY_CACHE.put(self.cache_dir, tool_config, executable_fingerprint, cached_result)
             return cached_result
 
         result = self.audit_manager.call_and_check(tool_config)
-        if not result.is_problem():
-            # Don't cache problems. Assume user will fix it soon.
-            self.write_to_cache(tool_config, result)
+        self.stats.record_miss(result)
+        # Problems are cached too, a broken tool can take until the timeout to fail again.
+        # They expire sooner and the entry stops matching as soon as the executable changes.
+        self.write_to_cache(tool_config, result, the_fingerprint)
+        MEMORY_CACHE.put(self.cache_dir, tool_config, executable_fingerprint, result)
         return result
+
+    def iter_entries(self) -> Iterator[tuple[Path, models.ToolCheckResult]]:
+        """
+        Read every entry in the cache, skipping any that can't be read.
+
+        Yields:
+            tuple[Path, models.ToolCheckResult]: The cache file and its result.
+        """
+        for cache_file in sorted(self.cache_dir.glob(f"*{RECORD_SUFFIX}")):
+            try:
+                result = cache_record.decode(cache_file.read_bytes())
+            except (OSError, ValueError) as error:
+                logger.debug(f"Skipping unreadable cache file {cache_file}: {error}")
+                continue
+            yield cache_file, result
+
+    def is_current(self, cache_file: Path, result: models.ToolCheckResult) -> bool:
+        """
+        Check if a cache entry still matches the executable on the PATH.
+
+        Args:
+            cache_file (Path): The cache file.
+            result (models.ToolCheckResult): The result in the cache file.
+
+        Returns:
+            bool: True if the fingerprint in the file name matches the current fingerprint.
+        """
+        return cache_file.stem.endswith(f"_{fingerprint.fingerprint_digest(result.tool)}")
+
+    def clear(self) -> int:
+        """
+        Delete every cache entry.
+
+        Returns:
+            int: The number of entries deleted.
+        """
+        MEMORY_CACHE.clear()
+        removed = 0
+        for pattern in (f"*{RECORD_SUFFIX}", f"*{LEGACY_SUFFIX}"):
+            for cache_file in self.cache_dir.glob(pattern):
+                cache_file.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def prune(self) -> int:
+        """
+        Delete entries that can never be used again: expired, for an executable that has changed, or unreadable.
+        Then run garbage collection.
+
+        Returns:
+            int: The number of entries deleted.
+        """
+        readable = set()
+        removed = 0
+        for cache_file, result in self.iter_entries():
+            readable.add(cache_file)
+            if self.is_expired(result) or not self.is_current(cache_file, result):
+                cache_file.unlink(missing_ok=True)
+                removed += 1
+        for cache_file in self.cache_dir.glob(f"*{RECORD_SUFFIX}"):
+            if cache_file not in readable:
+                cache_file.unlink(missing_ok=True)
+                removed += 1
+        self.clear_old_cache_files()
+        return removed
+
+    def export_bundle(self, bundle_path: Path) -> int:
+        """
+        Write the unexpired entries to a gzipped bundle, each keyed by the fingerprint of its executable.
+
+        Args:
+            bundle_path (Path): Where to write the bundle.
+
+        Returns:
+            int: The number of entries exported.
+        """
+        entries = []
+        for cache_file, result in self.iter_entries():
+            if self.is_expired(result):
+                continue
+            key, the_fingerprint = cache_file.stem.rsplit("_", 1)
+            record = base64.b64encode(cache_file.read_bytes()).decode("ascii")
+            entries.append({"key": key, "fingerprint": the_fingerprint, "record": record})
+        bundle = {"format": BUNDLE_FORMAT, "version": BUNDLE_VERSION, "entries": entries}
+        with gzip.open(bundle_path, "wt", encoding="utf-8") as file:
+            json.dump(bundle, file, separators=(",", ":"))
+        return len(entries)
+
+    def import_bundle(self, bundle_path: Path) -> tuple[int, int]:
+        """
+        Load the entries of a bundle whose fingerprint matches the executable on this machine.
+
+        Entries keep their original check time, so they expire as if they had been checked here.
+        A newer local entry is never replaced. Malformed entries are skipped with a warning.
+
+        Args:
+            bundle_path (Path): The bundle written by export_bundle.
+
+        Returns:
+            tuple[int, int]: The number of entries imported and skipped.
+
+        Raises:
+            ValueError: If the file is not a bundle this version can read.
+        """
+        with gzip.open(bundle_path, "rt", encoding="utf-8") as file:
+            bundle = json.load(file)
+        if (
+            not isinstance(bundle, dict)
+            or bundle.get("format") != BUNDLE_FORMAT
+            or bundle.get("version") != BUNDLE_VERSION
+            or not isinstance(bundle.get("entries"), list)
+        ):
+            raise ValueError(f"{bundle_path} is not a version {BUNDLE_VERSION} cache bundle.")
+        imported = skipped = 0
+        for number, entry in enumerate(bundle["entries"]):
+            try:
+                key, digest, data = _bundle_entry(entry)
+                result = cache_record.decode(data)
+            except ValueError as error:
+                logger.warning(f"Not importing entry {number} from {bundle_path}: {error}")
+                skipped += 1
+                continue
+            if (
+                Path(key).name != key
+                or not BUNDLE_KEY_PATTERN.fullmatch(key)
+                or not key.startswith(f"{result.tool.replace('.', '_')}_")
+            ):
+                logger.warning(f"Not importing {key!r} from {bundle_path}, it is not a cache entry key")
+                skipped += 1
+                continue
+            if self.is_expired(result):
+                skipped += 1
+                continue
+            target = self.cache_dir / f"{key}_{fingerprint.fingerprint_digest(result.tool)}{RECORD_SUFFIX}"
+            if not target.stem.endswith(f"_{digest}"):
+                logger.debug(f"Not importing {result.tool}, the executable differs on this machine")
+                skipped += 1
+                continue
+            try:
+                local = cache_record.decode(target.read_bytes())
+            except (OSError, ValueError):
+                local = None
+            if local is not None and (local.age_seconds() or 0) < (result.age_seconds() or 0):
+                skipped += 1
+                continue
+            self.write_atomically(target, data)
+            imported += 1
+        return imported, skipped
+
+    def record_run(self, stats: CacheStats) -> None:
+        """
+        Append the statistics of an audit to the history, keeping the last HISTORY_LENGTH runs.
+
+        Args:
+            stats (CacheStats): The statistics of the audit that just finished.
+        """
+        if not stats.lookups:
+            return
+        history_file = self.cache_dir / HISTORY_NAME
+        record = {"finished_at": datetime.datetime.now().isoformat(), **stats.to_dict()}
+        try:
+            lines = history_file.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            lines = []
+        lines = lines[-(HISTORY_LENGTH - 1) :] + [json.dumps(record)]
+        self.write_atomically(history_file, ("\n".join(lines) + "\n").encode("utf-8"))
+
+    def read_history(self, last_runs: int = 10) -> list[dict[str, Any]]:
+        """
+        Read the statistics of recent audits.
+
+        Args:
+            last_runs (int, optional): How many of the most recent runs to read. Defaults to 10.
+
+        Returns:
+            list[dict[str, Any]]: One dict per run, oldest first.
+        """
+        try:
+            lines = (self.cache_dir / HISTORY_NAME).read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+        history = []
+        for line in lines[-last_runs:] if last_runs > 0 else []:
+            try:
+                history.append(json.loads(line))
+            except ValueError:
+                logger.debug(f"Skipping unreadable history line {line}")
+        return history
+
+    def refresh(self, tool_configs: list[models.CliToolConfig]) -> None:
+        """
+        Call every tool again and overwrite its cache entry, regardless of what is cached.
+
+        Args:
+            tool_configs (list[models.CliToolConfig]): The tools to refresh.
+        """
+        marker = self.cache_dir / REFRESH_MARKER_NAME
+        marker.touch()
+        try:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = executor.map(self.audit_manager.call_and_check, tool_configs)
+                for tool_config, result in zip(tool_configs, results, strict=True):
+                    self.write_to_cache(tool_config, result)
+        finally:
+            marker.unlink(missing_ok=True)
+
+    def warm(self, tool_configs: list[models.CliToolConfig]) -> CacheStats:
+        """
+        Fill the cache for these tools, calling only the ones without a fresh entry.
+
+        Configs are completed the way an audit completes them, so the entries are the ones an audit
+        of the same config looks up. Tools for another OS are skipped.
+
+        Args:
+            tool_configs (list[models.CliToolConfig]): The tools to warm.
+
+        Returns:
+            CacheStats: Hits for tools that were already cached, misses for tools that were called.
+        """
+        configs = [
+            replace(config, version_switch=config.version_switch or "--version")
+            for config in tool_configs
+            if not config.if_os or sys.platform.startswith(config.if_os)
+        ]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # One facade per call, call_and_check records what it did on the facade.
+            list(
+                executor.map(
+                    lambda config: AuditFacade(cache_dir=self.cache_dir, stats=self.stats).call_and_check(config),
+                    configs,
+                )
+            )
+        return self.stats
+
+    def refresh_in_background(self, tool_configs: list[models.CliToolConfig], warm: bool = False) -> bool:
+        """
+        Start a detached process that refreshes the cache entries for these tools, then return at once.
+
+        Args:
+            tool_configs (list[models.CliToolConfig]): The tools to refresh.
+            warm (bool, optional): Only call the tools without a fresh entry, see warm. Defaults to False.
+
+        Returns:
+            bool: True if a refresh was started, False if there was nothing to do or one is already running.
+        """
+        if not tool_configs:
+            return False
+        marker = self.cache_dir / REFRESH_MARKER_NAME
+        try:
+            started = marker.stat().st_mtime
+            timeout = int(os.environ.get("CLI_TOOL_AUDIT_TIMEOUT", 15))
+            # Each tool is called at most once, in parallel, so an older marker was left by a crash.
+            if time.time() - started < timeout * 4:
+                logger.debug("Background cache refresh already running")
+                return False
+        except FileNotFoundError:
+            pass
+        marker.touch()
+
+        payload = json.dumps(
+            {
+                "cache_dir": str(self.cache_dir),
+                "warm": warm,
+                "tool_configs": [{"tool_config": config} for config in tool_configs],
+            },
+            default=json_utils.custom_json_serializer,
+        )
+        detached: dict[str, Any]
+        if sys.platform == "win32":
+            detached = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            detached = {"start_new_session": True}
+        logger.debug(f"Refreshing {len(tool_configs)} cache entries in the background")
+        # Not waited for, the child outlives this process.
+        # pylint: disable=consider-using-with
+        process = subprocess.Popen(
+            [sys.executable, "-m", "cli_tool_audit.audit_cache"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            **detached,  # type: ignore[arg-type]
+        )  # nosec
+        if process.stdin:
+            process.stdin.write(payload)
+            process.stdin.close()
+        return True
+
+
+def refresh_from_stdin() -> None:
+    """
+    Entry point of the background refresh process started by AuditFacade.refresh_in_background.
+    """
+    request = json.load(sys.stdin, object_hook=custom_json_deserializer)
+    lower_priority()
+    facade = AuditFacade(cache_dir=Path(request["cache_dir"]))
+    tool_configs = [item["tool_config"] for item in request["tool_configs"]]
+    try:
+        if request.get("warm"):
+            facade.warm(tool_configs)
+        else:
+            facade.refresh(tool_configs)
+    finally:
+        # refresh_in_background created the marker for either kind of run.
+        (facade.cache_dir / REFRESH_MARKER_NAME).unlink(missing_ok=True)
+
+
+def lower_priority() -> None:
+    """
+    Run this process, and the tools it calls, at low CPU priority so background work doesn't slow the user down.
+
+    Only has an effect where os.nice exists.
+    """
+    if not hasattr(os, "nice"):
+        return
+    try:
+        os.nice(10)
+    except OSError as error:
+        logger.debug(f"Could not lower priority: {error}")
+
+
+if __name__ == "__main__":
+    refresh_from_stdin()
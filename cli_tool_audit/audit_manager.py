@@ -9,6 +9,7 @@ import logging
 import os
 import subprocess  # nosec
 import sys
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Literal
@@ -16,10 +17,11 @@ from typing import Literal
 import packaging.specifiers as packaging_specifiers
 import packaging.version as packaging
 from semver import Version
-from whichcraft import which
 
 import cli_tool_audit.compatibility as compatibility
 import cli_tool_audit.models as models
+import cli_tool_audit.path_index as path_index
+import cli_tool_audit.providers as providers
 import cli_tool_audit.version_parsing as version_parsing
 from cli_tool_audit.call_tools import extract_version_output
 from cli_tool_audit.known_switches import KNOWN_SWITCHES
@@ -287,12 +289,16 @@ class AuditManager:
                 is_broken=False,
                 last_modified=None,
                 tool_config=config,
+                checked_at=datetime.datetime.now(),
             )
+        checked_at = datetime.datetime.now()
+        started = time.perf_counter()
         result = self.call_tool(
             tool,
             config.schema or models.SchemaType.SEMVER,
             config.version_switch or "--version",
         )
+        check_duration = time.perf_counter() - started
 
         # Not pretty.
         if config.schema == models.SchemaType.EXISTENCE:
@@ -345,6 +351,11 @@ class AuditManager:
             is_broken=result.is_broken,
             last_modified=result.last_modified,
             tool_config=config,
+            checked_at=checked_at,
+            check_duration=check_duration,
+            version_provider=result.version_provider,
+            package_name=result.package_name,
+            package_version=result.package_version,
         )
 
     def call_tool(
@@ -376,10 +387,26 @@ class AuditManager:
             logger.debug(f"{tool_name} exists, but not checking for version.")
             return models.ToolAvailabilityResult(True, False, None, last_modified)
 
+        if schema != models.SchemaType.SNAPSHOT and version_switch in (None, "--version"):
+            found = path_index.lookup(tool_name)
+            provided = providers.find_version(found[0]) if found else None
+            if provided:
+                logger.debug(f"{tool_name} version {provided.version} read by {provided.provider}, not running it.")
+                package = provided.package
+                return models.ToolAvailabilityResult(
+                    True,
+                    False,
+                    provided.version,
+                    last_modified,
+                    provided.provider,
+                    package.name if package else None,
+                    package.version if package else None,
+                )
+
         if version_switch is None or version_switch == "--version":
             # override default.
             # Could be a problem if KNOWN_SWITCHES was ever wrong.
-            version_switch = KNOWN_SWITCHES.get(tool_name, "--version")
+            version_switch = KNOWN_SWITCHES.get(os.path.basename(tool_name), "--version")
 
         version = None
 
@@ -410,6 +437,9 @@ class AuditManager:
                 logger.error(f"{tool_name} stdout: {exception.stdout}")
             else:
                 logger.warning(f"{tool_name} returned a non-zero exit code but still produced version output.")
+        except subprocess.TimeoutExpired:
+            # Usually a tool that doesn't understand the switch and waits for input.
+            logger.error(f"{tool_name} did not respond to {version_switch} within {timeout} seconds.")
         except FileNotFoundError:
             logger.error(f"{tool_name} is not on path, file not found.")
             return models.ToolAvailabilityResult(False, True, None, last_modified)
@@ -425,13 +455,8 @@ class AuditManager:
         Returns:
             Optional[datetime.datetime]: The last modified date of the command's executable.
         """
-        # Find the path of the command's executable
-        result = which(tool_name)
-        if result is None:
+        # Find the command's executable, the index stats it on the way
+        found = path_index.lookup(tool_name)
+        if found is None:
             return None
-
-        executable_path = result
-
-        # Get the last modified time of the executable
-        last_modified_timestamp = os.path.getmtime(executable_path)
-        return datetime.datetime.fromtimestamp(last_modified_timestamp)
+        return datetime.datetime.fromtimestamp(found[1].st_mtime)
@@ -0,0 +1,98 @@
+"""
+Reports and maintenance for the result cache, behind the `cache` subcommand.
+"""
+
+import cli_tool_audit.audit_cache as audit_cache
+import cli_tool_audit.views as views
+
+
+def format_bytes(size: int) -> str:
+    """
+    Format a byte count for display.
+
+    Args:
+        size (int): Number of bytes.
+
+    Returns:
+        str: The size in B, KB or MB.
+    """
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def stats_report(facade: audit_cache.AuditFacade, last_runs: int = 10) -> str:
+    """
+    Describe what is in the cache and how well it has been working.
+
+    Args:
+        facade (audit_cache.AuditFacade): The cache to report on.
+        last_runs (int, optional): How many recent audits to include in hit and miss ratios. Defaults to 10.
+
+    Returns:
+        str: A multi-line report.
+    """
+    entries = problems = expired = changed = 0
+    for cache_file, result in facade.iter_entries():
+        entries += 1
+        problems += int(result.is_problem())
+        expired += int(facade.is_expired(result))
+        changed += int(not facade.is_current(cache_file, result))
+    disk_usage = sum(path.stat().st_size for path in facade.cache_dir.iterdir() if path.is_file())
+
+    lines = [
+        f"Cache directory: {facade.cache_dir}",
+        f"Entries: {entries} ({problems} problems, {expired} expired, {changed} for executables that changed)",
+        f"Disk usage: {format_bytes(disk_usage)}",
+    ]
+    history = facade.read_history(last_runs)
+    if not history:
+        lines.append("No audits have used the cache yet.")
+        return "\n".join(lines)
+    totals = audit_cache.CacheStats(
+        hits=sum(run["hits"] for run in history),
+        stale_hits=sum(run["stale_hits"] for run in history),
+        misses=sum(run["misses"] for run in history),
+        saved_seconds=sum(run["saved_seconds"] for run in history),
+        probe_seconds=sum(run["probe_seconds"] for run in history),
+    )
+    lines.append(f"Last {len(history)} runs: {totals.summary().removeprefix('Cache: ')}")
+    lines.append(
+        f"Probe time: {totals.probe_seconds:.1f}s spent on misses, about {totals.saved_seconds:.1f}s saved by hits"
+    )
+    return "\n".join(lines)
+
+
+def inspect_report(facade: audit_cache.AuditFacade, tool: str) -> str:
+    """
+    Describe every cache entry for one tool.
+
+    Args:
+        facade (audit_cache.AuditFacade): The cache to inspect.
+        tool (str): The tool name.
+
+    Returns:
+        str: A multi-line report.
+    """
+    lines = []
+    for cache_file, result in facade.iter_entries():
+        if result.tool != tool:
+            continue
+        freshness = "expired" if facade.is_expired(result) else "fresh"
+        executable = "current" if facade.is_current(cache_file, result) else "changed since"
+        duration = f"{result.check_duration:.2f}s" if result.check_duration is not None else "?"
+        found = (result.found_version or "").splitlines()
+        lines.append(str(cache_file))
+        lines.append(f"  found:      {found[0] if found else ''}")
+        if result.version_provider:
+            lines.append(f"  read by:    {result.version_provider}, not run")
+        if result.package_name:
+            lines.append(f"  package:    {result.package_name} {result.package_version}")
+        lines.append(f"  status:     {result.status()}")
+        lines.append(f"  checked:    {views.format_age(result.age_seconds())} ago ({freshness}), took {duration}")
+        lines.append(f"  executable: {executable}")
+    if not lines:
+        return f"No cache entries for {tool}."
+    return "\n".join(lines)
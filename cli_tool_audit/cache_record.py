@@ -0,0 +1,169 @@
+"""
+Compact binary encoding of cached check results.
+
+A record holds only what the check produced and the parts of the config that decide how the tool
+is checked. Tags and install hints are left out, the config they come from is part of the cache key.
+
+Layout, little-endian:
+
+- header: magic `CTAR`, format version (1 byte), flags (1 byte), last_modified, checked_at and
+  check_duration as signed 64-bit microseconds
+- twelve strings, each a 32-bit length (0xFFFFFFFF for None) followed by UTF-8 bytes: tool,
+  desired_version, found_version, parsed_version, is_compatible, the config's version,
+  version_switch, schema and if_os, version_provider, package_name and package_version
+"""
+
+import datetime
+import struct
+
+import cli_tool_audit.models as models
+
+__all__ = ["RECORD_VERSION", "decode", "encode"]
+
+MAGIC = b"CTAR"
+RECORD_VERSION = 3
+"""Bumped whenever the layout changes. Records of any other version are treated as unreadable."""
+
+_HEADER = struct.Struct("<4sBBqqq")
+_STRING_COUNT = 12
+_LENGTH = struct.Struct("<I")
+_NONE = 0xFFFFFFFF
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+_NEEDED_FOR_OS = 1
+_AVAILABLE = 2
+_SNAPSHOT = 4
+_BROKEN = 8
+_HAS_LAST_MODIFIED = 16
+_HAS_CHECKED_AT = 32
+_HAS_DURATION = 64
+
+
+def _to_microseconds(value: datetime.datetime) -> int:
+    """
+    Convert a datetime to microseconds since 1970, keeping naive datetimes naive.
+
+    Args:
+        value (datetime.datetime): The datetime, aware ones are converted to local time.
+
+    Returns:
+        int: Microseconds since 1970-01-01 00:00 in the same clock as value.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _pack_string(value: str | None) -> bytes:
+    if value is None:
+        return _LENGTH.pack(_NONE)
+    data = value.encode("utf-8")
+    return _LENGTH.pack(len(data)) + data
+
+
+def encode(result: models.ToolCheckResult) -> bytes:
+    """
+    Encode a result as a record.
+
+    Args:
+        result (models.ToolCheckResult): The result to encode.
+
+    Returns:
+        bytes: The record.
+    """
+    flags = (
+        _NEEDED_FOR_OS * bool(result.is_needed_for_os)
+        | _AVAILABLE * bool(result.is_available)
+        | _SNAPSHOT * bool(result.is_snapshot)
+        | _BROKEN * bool(result.is_broken)
+        | _HAS_LAST_MODIFIED * (result.last_modified is not None)
+        | _HAS_CHECKED_AT * (result.checked_at is not None)
+        | _HAS_DURATION * (result.check_duration is not None)
+    )
+    header = _HEADER.pack(
+        MAGIC,
+        RECORD_VERSION,
+        flags,
+        _to_microseconds(result.last_modified) if result.last_modified is not None else 0,
+        _to_microseconds(result.checked_at) if result.checked_at is not None else 0,
+        round(result.check_duration * 1_000_000) if result.check_duration is not None else 0,
+    )
+    config = result.tool_config
+    schema = config.schema if config else None
+    strings = (
+        result.tool,
+        result.desired_version,
+        result.found_version,
+        result.parsed_version,
+        result.is_compatible,
+        config.version if config else None,
+        config.version_switch if config else None,
+        str(schema) if schema is not None else None,
+        config.if_os if config else None,
+        result.version_provider,
+        result.package_name,
+        result.package_version,
+    )
+    return header + b"".join(_pack_string(value) for value in strings)
+
+
+def decode(data: bytes) -> models.ToolCheckResult:
+    """
+    Decode a record.
+
+    Args:
+        data (bytes): The record.
+
+    Returns:
+        models.ToolCheckResult: The result. Its tool_config only holds the fields that were encoded.
+
+    Raises:
+        ValueError: If data is not a record of this version, or is truncated.
+    """
+    try:
+        magic, version, flags, last_modified, checked_at, duration = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != RECORD_VERSION:
+            raise ValueError(f"Not a version {RECORD_VERSION} cache record")
+        strings: list[str | None] = []
+        offset = _HEADER.size
+        for _ in range(_STRING_COUNT):
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            if length == _NONE:
+                strings.append(None)
+                continue
+            end = offset + length
+            if end > len(data):
+                raise ValueError("Truncated cache record")
+            strings.append(data[offset:end].decode("utf-8"))
+            offset = end
+    except struct.error as error:
+        raise ValueError(f"Truncated cache record: {error}") from error
+
+    tool, desired_version, found_version, parsed_version, is_compatible, *config_fields = strings
+    config_version, version_switch, schema, if_os, version_provider, package_name, package_version = config_fields
+    return models.ToolCheckResult(
+        tool=str(tool),
+        desired_version=str(desired_version),
+        is_needed_for_os=bool(flags & _NEEDED_FOR_OS),
+        is_available=bool(flags & _AVAILABLE),
+        is_snapshot=bool(flags & _SNAPSHOT),
+        found_version=found_version,
+        parsed_version=parsed_version,
+        is_compatible=str(is_compatible),
+        is_broken=bool(flags & _BROKEN),
+        last_modified=_EPOCH + last_modified * _MICROSECOND if flags & _HAS_LAST_MODIFIED else None,
+        tool_config=models.CliToolConfig(
+            name=str(tool),
+            version=config_version,
+            version_switch=version_switch,
+            schema=models.SchemaType(schema) if schema else None,
+            if_os=if_os,
+        ),
+        checked_at=_EPOCH + checked_at * _MICROSECOND if flags & _HAS_CHECKED_AT else None,
+        check_duration=duration / 1_000_000 if flags & _HAS_DURATION else None,
+        version_provider=version_provider,
+        package_name=package_name,
+        package_version=package_version,
+    )
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 def check_tool_wrapper(
     tool_info: tuple[str, models.CliToolConfig, threading.Lock, bool],
+    stale_ok: bool = False,
+    cache_stats: audit_cache.CacheStats | None = None,
 ) -> models.ToolCheckResult:
     """
     Wrapper function for check_tool_availability() that returns a ToolCheckResult object.
@@ -22,6 +24,9 @@ def check_tool_wrapper(
     Args:
         tool_info (tuple[str, models.CliToolConfig, threading.Lock, bool]): A tuple containing the tool name, the
         CliToolConfig object, a lock, and a boolean indicating if the cache is enabled.
+        stale_ok (bool, optional): If the cache is enabled, answer from expired entries. Defaults to False.
+        cache_stats (Optional[audit_cache.CacheStats], optional): If the cache is enabled, count hits and misses
+            here. Defaults to None.
 
     Returns:
         models.ToolCheckResult: A ToolCheckResult object.
@@ -49,10 +54,10 @@ def check_tool_wrapper(
     config.version_switch = config.version_switch or "--version"
 
     if enable_cache:
-        cached_manager = audit_cache.AuditFacade()
+        cached_manager = audit_cache.AuditFacade(stats=cache_stats)
         with lock:
             logger.debug(f"Checking {tool} with cache")
-            return cached_manager.call_and_check(tool_config=config)
+            return cached_manager.call_and_check(tool_config=config, allow_stale=stale_ok)
 
     manager = audit_manager.AuditManager()
     return manager.call_and_check(tool_config=config)
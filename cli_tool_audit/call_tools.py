@@ -15,10 +15,8 @@ import logging
 import os
 import subprocess  # nosec
 
-# pylint: disable=no-name-in-module
-from whichcraft import which
-
 import cli_tool_audit.models as models
+import cli_tool_audit.path_index as path_index
 from cli_tool_audit.known_switches import KNOWN_SWITCHES
 
 logger = logging.getLogger(__name__)
@@ -50,16 +48,11 @@ def get_command_last_modified_date(tool_name: str) -> datetime.datetime | None:
     Returns:
         Optional[datetime.datetime]: The last modified date of the command's executable.
     """
-    # Find the path of the command's executable
-    result = which(str(tool_name))
-    if result is None:
+    # Find the command's executable, the index stats it on the way
+    found = path_index.lookup(str(tool_name))
+    if found is None:
         return None
-
-    executable_path = result
-
-    # Get the last modified time of the executable
-    last_modified_timestamp = os.path.getmtime(executable_path)
-    return datetime.datetime.fromtimestamp(last_modified_timestamp)
+    return datetime.datetime.fromtimestamp(found[1].st_mtime)
 
 
 def check_tool_availability(
@@ -125,6 +118,9 @@ def check_tool_availability(
             logger.error(f"{tool_name} stdout: {exception.stdout}")
         else:
             logger.warning(f"{tool_name} returned a non-zero exit code but still produced version output.")
+    except subprocess.TimeoutExpired:
+        # Usually a tool that doesn't understand the switch and waits for input.
+        logger.error(f"{tool_name} did not respond to {version_switch} within {timeout} seconds.")
     except FileNotFoundError:
         logger.error(f"{tool_name} is not on path, file not found.")
         return models.ToolAvailabilityResult(False, True, None, last_modified)
@@ -0,0 +1,151 @@
+"""
+Thin client for the audit server started with `cli_tool_audit serve`.
+
+Shell prompts and editor status bars can't wait for a full audit. This module only imports cheap
+parts of the standard library, sends one request over the server's Unix socket and prints the answer.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+__all__ = ["ServerUnavailable", "audit_request", "main", "request", "socket_path"]
+
+CACHE_ROOT_NAME = ".cli_tool_audit_cache"
+"""Same as audit_cache.CACHE_ROOT_NAME, not imported from there to keep the client light."""
+SOCKET_NAME = "audit.sock"
+MAX_SOCKET_PATH = 100
+"""Unix socket paths are limited to about 104 bytes, longer ones are moved to the temp directory."""
+
+
+class ServerUnavailable(Exception):
+    """No server is listening on the socket."""
+
+
+def socket_path(root: Path | None = None) -> Path:
+    """
+    Where the server for a project listens.
+
+    Args:
+        root (Optional[Path], optional): The project directory. Defaults to the current directory.
+
+    Returns:
+        Path: CLI_TOOL_AUDIT_SOCKET if set, else a socket in the project's cache directory.
+    """
+    configured = os.environ.get("CLI_TOOL_AUDIT_SOCKET")
+    if configured:
+        return Path(configured)
+    cache_root = (root or Path.cwd()).resolve() / CACHE_ROOT_NAME
+    path = cache_root / SOCKET_NAME
+    if len(str(path)) <= MAX_SOCKET_PATH:
+        return path
+    import tempfile  # pylint: disable=import-outside-toplevel
+
+    digest = hashlib.md5(str(cache_root).encode()).hexdigest()[:12]  # nosec
+    return Path(tempfile.gettempdir()) / f"cli_tool_audit-{digest}.sock"
+
+
+def audit_request(config: Path, tags: list[str] | None = None) -> dict[str, object]:
+    """
+    Build an audit request. The server refuses it unless it runs with this process's PATH and directory.
+
+    Args:
+        config (Path): The config file.
+        tags (Optional[list[str]], optional): Only check tools with these tags. Defaults to None.
+
+    Returns:
+        dict[str, object]: The request.
+    """
+    return {
+        "command": "audit",
+        "config": str(config.resolve()),
+        "tags": tags,
+        "path": os.environ.get("PATH", ""),
+        "cwd": os.getcwd(),
+    }
+
+
+def request(message: dict[str, object], path: Path | None = None, timeout: float = 60.0) -> dict[str, object]:
+    """
+    Send one request to the server and wait for the answer.
+
+    Args:
+        message (dict[str, object]): The request, see server for the commands.
+        path (Optional[Path], optional): The socket. Defaults to socket_path().
+        timeout (float, optional): Seconds to wait for the answer. Defaults to 60.
+
+    Returns:
+        dict[str, object]: The answer.
+
+    Raises:
+        ServerUnavailable: If no server is listening.
+    """
+    path = path or socket_path()
+    if not hasattr(socket, "AF_UNIX"):
+        raise ServerUnavailable("Unix domain sockets are not supported on this platform")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        try:
+            connection.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError) as error:
+            raise ServerUnavailable(f"No cli_tool_audit server at {path}") from error
+        connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        with connection.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ServerUnavailable(f"The server at {path} closed the connection without answering")
+    return json.loads(line)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Ask the server for an audit and print the tools that fail.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The arguments. Defaults to sys.argv.
+
+    Returns:
+        int: 0 if every tool passes, 1 if any fails, 2 if the server can't be reached or reports an error.
+    """
+    parser = argparse.ArgumentParser(
+        prog="cli_tool_audit-client", description="Ask a running `cli_tool_audit serve` for an audit."
+    )
+    parser.add_argument("-c", "--config", default="pyproject.toml", help="Configuration file. (default is %(default)s)")
+    parser.add_argument("--tags", nargs="+", help="Tag for filtering tools.")
+    parser.add_argument("--json", action="store_true", help="Print the server's answer as JSON.")
+    parser.add_argument("--ping", action="store_true", help="Check that the server is running.")
+    parser.add_argument("--stop", action="store_true", help="Stop the server.")
+    args = parser.parse_args(argv)
+
+    if args.ping:
+        message: dict[str, object] = {"command": "ping"}
+    elif args.stop:
+        message = {"command": "shutdown"}
+    else:
+        message = audit_request(Path(args.config), args.tags)
+    try:
+        answer = request(message)
+    except (ServerUnavailable, OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps(answer, indent=4))
+    if not answer.get("ok"):
+        print(f"Error: {answer.get('error')}", file=sys.stderr)
+        return 2
+    if message["command"] != "audit":
+        return 0
+    problems = answer.get("problems")
+    if not args.json and isinstance(problems, list):
+        for problem in problems:
+            print(f"{problem['tool']}: {problem['status']}")
+    return 1 if answer.get("failed") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
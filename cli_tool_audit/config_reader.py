@@ -2,6 +2,8 @@
 Read list of tools from config.
 """
 
+import copy
+import functools
 import logging
 from pathlib import Path
 
@@ -11,10 +13,34 @@ import cli_tool_audit.models as models
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def _parse_config(file_path: Path, _stat_key: tuple[int, int, int]) -> dict[str, models.CliToolConfig]:
+    """
+    Parse a config file, remembering the result until the file changes.
+
+    Args:
+        file_path (Path): The path to the pyproject.toml file.
+        _stat_key (tuple[int, int, int]): The inode, modified time and size of the file, used only as part of
+            the cache key.
+
+    Returns:
+        dict[str, models.CliToolConfig]: A dictionary with the cli-tools section.
+    """
+    logger.debug(f"Loading config from {file_path}")
+    manager = config_manager.ConfigManager(file_path)
+    found = manager.read_config()
+    if not found:
+        logger.warning("Config section not found, expected [tool.cli-tools] with values")
+    return manager.tools
+
+
 def read_config(file_path: Path) -> dict[str, models.CliToolConfig]:
     """
     Read the cli-tools section from a pyproject.toml file.
 
+    Long-lived processes such as the GUI read the same file on every audit, so the parsed file is
+    remembered until its inode, modified time or size changes. Callers get their own copy.
+
     Args:
         file_path (Path): The path to the pyproject.toml file.
 
@@ -23,12 +49,12 @@ def read_config(file_path: Path) -> dict[str, models.CliToolConfig]:
     """
     # pylint: disable=broad-exception-caught
     try:
-        logger.debug(f"Loading config from {file_path}")
-        manager = config_manager.ConfigManager(file_path)
-        found = manager.read_config()
-        if not found:
-            logger.warning("Config section not found, expected [tool.cli-tools] with values")
-        return manager.tools
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return _parse_config.__wrapped__(file_path, (0, 0, 0))
+        stat_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        return copy.deepcopy(_parse_config(file_path.resolve(), stat_key))
     except BaseException as e:
         logger.error(e)
         print(f"Error reading pyproject.toml: {e}")
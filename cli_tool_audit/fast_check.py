@@ -0,0 +1,75 @@
+"""
+Pass or fail with as few imports as possible, for git hooks and shell prompts.
+
+`cli_tool_audit-check` answers from `cli-tools.lock` when neither the config nor any locked
+executable changed. That needs nothing beyond the standard library, the PATH index and the lock file
+reader. Only when something changed does it import the config parser, the cache and the checkers to
+check the changed tools.
+"""
+
+import argparse
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+import cli_tool_audit.lockfile as lockfile
+import cli_tool_audit.models as models
+import cli_tool_audit.policy as policy
+
+__all__ = ["check", "main"]
+
+
+def check(config_path: Path, check_hash: bool = False) -> list[models.ToolCheckResult]:
+    """
+    Check the configured tools, from the lock file where possible.
+
+    Args:
+        config_path (Path): The config file.
+        check_hash (bool, optional): Also compare content hashes of locked executables. Defaults to False.
+
+    Returns:
+        list[models.ToolCheckResult]: The results.
+    """
+    results = lockfile.fast_verify(config_path, check_hash=check_hash)
+    if results is not None:
+        return results
+    # Something changed, only now pay for the full machinery.
+    # pylint: disable=import-outside-toplevel
+    import cli_tool_audit.config_reader as config_reader
+    import cli_tool_audit.views as views
+
+    lock_check = lockfile.verify(
+        config_reader.read_config(config_path), lockfile.lock_path_for(config_path), check_hash=check_hash
+    )
+    return lock_check.results + views.process_tools(lock_check.changed, disable_progress_bar=True)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Exit 0 if the configured tools pass, 1 if not, printing only the failing tools.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="cli_tool_audit-check",
+        description="Exit non-zero if the configured tools fail, answering from cli-tools.lock when nothing changed.",
+    )
+    parser.add_argument("-c", "--config", default="pyproject.toml", help="Configuration file. (default is %(default)s)")
+    parser.add_argument("--verify-hash", action="store_true", help="Also compare a hash of each locked executable.")
+    args = parser.parse_args(argv)
+
+    results = check(Path(args.config), check_hash=args.verify_hash)
+    if not policy.apply_policy(results):
+        return 0
+    for result in results:
+        if result.is_problem():
+            print(f"{result.tool}: {result.status()}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
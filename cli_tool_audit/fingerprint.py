@@ -0,0 +1,309 @@
+"""
+Fingerprint the executable behind a tool name.
+
+A cached result is only trusted while the fingerprint of the executable it describes is unchanged,
+so installing, upgrading or removing a tool invalidates its cache entries at once.
+
+Many tools on the PATH are small launchers: symlinks into a version manager, scripts whose shebang
+names the real interpreter, and console scripts of Python packages. Upgrading what is underneath
+does not touch the launcher, so the fingerprint covers the whole chain: every symlink, the shebang
+interpreter and, for console scripts and npm packages, the metadata of the package that installed them.
+"""
+
+import functools
+import hashlib
+import os
+import re
+from pathlib import Path
+
+import cli_tool_audit.path_index as path_index
+
+MISSING = "missing"
+"""Fingerprint of a tool that is not on the PATH."""
+
+SHEBANG_BYTES = 512
+"""How much of a script to read looking for its interpreter. Covers pip's two line /bin/sh trampoline."""
+
+_PIP_TRAMPOLINE = re.compile(rb"^'''exec' (?:\"([^\"]+)\"|(\S+))", re.MULTILINE)
+_CONSOLE_SCRIPTS = re.compile(r"^\[console_scripts\]$(.*?)(?=^\[|\Z)", re.MULTILINE | re.DOTALL)
+
+
+def _stat_part(path: str) -> str:
+    """
+    Describe one file by its path, modified time and size.
+
+    Args:
+        path (str): The file.
+
+    Returns:
+        str: The description, or the path followed by MISSING if it can't be read.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"{path}|{MISSING}"
+    return f"{path}|{stat.st_mtime_ns}|{stat.st_size}"
+
+
+def _symlink_chain(path: str, max_links: int = 40) -> list[str]:
+    """
+    Follow symlinks one hop at a time, recording each link and where it points.
+
+    Args:
+        path (str): The path to start from.
+        max_links (int, optional): Give up after this many hops, as the OS does with loops. Defaults to 40.
+
+    Returns:
+        list[str]: One "link->target" entry per hop, empty if path is not a symlink.
+    """
+    chain = []
+    current = path
+    for _ in range(max_links):
+        try:
+            target = os.readlink(current)
+        except (OSError, ValueError):
+            break
+        chain.append(f"{current}->{target}")
+        current = os.path.join(os.path.dirname(current), target)
+    return chain
+
+
+def read_shebang_interpreter(path: str) -> str | None:
+    """
+    Find the interpreter named by a script's shebang line.
+
+    Handles `#!/usr/bin/env [-S] name`, and the `/bin/sh` trampoline pip writes when the interpreter
+    path is too long for a shebang.
+
+    Args:
+        path (str): The script.
+
+    Returns:
+        str | None: The path of the interpreter, or None for binaries and unreadable files.
+    """
+    try:
+        with open(path, "rb") as file:
+            head = file.read(SHEBANG_BYTES)
+    except OSError:
+        return None
+    if not head.startswith(b"#!"):
+        return None
+    words = head[2:].split(b"\n", 1)[0].decode("utf-8", errors="replace").split()
+    if not words:
+        return None
+    interpreter = words[0]
+    if interpreter == "/bin/sh":
+        trampoline = _PIP_TRAMPOLINE.search(head)
+        if trampoline:
+            return (trampoline.group(1) or trampoline.group(2)).decode("utf-8", errors="replace")
+    if os.path.basename(interpreter) == "env":
+        commands = [word for word in words[1:] if not word.startswith("-") and "=" not in word]
+        if not commands:
+            return None
+        return path_index.which(commands[0])
+    return interpreter
+
+
+@functools.lru_cache(maxsize=32)
+def _console_script_index(site_packages: str, _site_packages_mtime_ns: int) -> dict[str, tuple[str, ...]]:
+    """
+    Map every console script declared in a site-packages directory to the dist-info directories declaring it.
+
+    Each entry_points.txt is read once per environment, however many of its scripts are looked up.
+    The mtime of site-packages is part of the cache key, so installing or removing any package
+    in the environment causes a fresh scan.
+
+    Args:
+        site_packages (str): The site-packages directory.
+        _site_packages_mtime_ns (int): The mtime of site-packages, used only as part of the cache key.
+
+    Returns:
+        dict[str, tuple[str, ...]]: Script names and their dist-info directories, usually one per script.
+    """
+    try:
+        entries = sorted(os.scandir(site_packages), key=lambda entry: entry.name)
+    except OSError:
+        return {}
+    index: dict[str, tuple[str, ...]] = {}
+    for entry in entries:
+        if not entry.name.endswith(".dist-info"):
+            continue
+        try:
+            with open(os.path.join(entry.path, "entry_points.txt"), encoding="utf-8") as file:
+                entry_points = file.read()
+        except OSError:
+            continue
+        for section in _CONSOLE_SCRIPTS.findall(entry_points):
+            for line in section.splitlines():
+                script_name, equals, _target = line.partition("=")
+                script_name = script_name.strip()
+                if equals and script_name and entry.path not in index.get(script_name, ()):
+                    index[script_name] = (*index.get(script_name, ()), entry.path)
+    return index
+
+
+def _site_packages_for(bin_dir: Path) -> list[Path]:
+    """
+    Find the site-packages directories of the environment a bin or Scripts directory belongs to.
+
+    Args:
+        bin_dir (Path): The directory that holds the console script.
+
+    Returns:
+        list[Path]: The site-packages directories, empty if bin_dir is not part of a Python environment.
+    """
+    prefix = bin_dir.parent
+    return [*prefix.glob("lib/python*/site-packages"), *prefix.glob("Lib/site-packages")]
+
+
+def console_script_dist_infos(script_path: str) -> tuple[str, ...]:
+    """
+    Find the dist-info directories of the packages in a console script's environment that declare it.
+
+    Args:
+        script_path (str): The console script, symlinks already resolved.
+
+    Returns:
+        tuple[str, ...]: The dist-info directories, empty if the script is not part of a Python environment or no
+            package declares it.
+    """
+    script = Path(script_path)
+    # Only drop Windows launcher suffixes, console scripts like py.test have dots in their names.
+    script_name = script.stem if script.suffix.lower() == ".exe" else script.name
+    for site_packages in _site_packages_for(Path(script_path).parent):
+        try:
+            mtime_ns = site_packages.stat().st_mtime_ns
+        except OSError:
+            continue
+        dist_infos = _console_script_index(str(site_packages), mtime_ns).get(script_name, ())
+        if dist_infos:
+            return dist_infos
+    return ()
+
+
+def _dist_info_parts(script_path: str) -> list[str]:
+    """
+    Describe the package metadata behind a Python console script.
+
+    Args:
+        script_path (str): The console script, symlinks already resolved.
+
+    Returns:
+        list[str]: Descriptions of RECORD and METADATA of the owning packages, empty if there isn't one.
+    """
+    return [
+        _stat_part(os.path.join(dist_info, name))
+        for dist_info in console_script_dist_infos(script_path)
+        for name in ("RECORD", "METADATA")
+    ]
+
+
+def node_package_dir(script_path: str) -> str | None:
+    """
+    Find the npm package a script belongs to.
+
+    Args:
+        script_path (str): The script, symlinks already resolved.
+
+    Returns:
+        Optional[str]: The nearest directory directly inside a node_modules directory, or inside a scope such as
+            node_modules/@types, or None if the script is not part of an npm package.
+    """
+    directory = Path(script_path).parent
+    while directory.parent != directory:
+        parent = directory.parent
+        if parent.name == "node_modules" or (parent.name.startswith("@") and parent.parent.name == "node_modules"):
+            return str(directory)
+        directory = parent
+    return None
+
+
+def _node_package_parts(script_path: str) -> list[str]:
+    """
+    Describe the package.json of the npm package a script belongs to.
+
+    npm gives every file it installs the same fixed modified time, so the file is described by a hash of its
+    contents. It is small and only read for scripts inside node_modules.
+
+    Args:
+        script_path (str): The script, symlinks already resolved.
+
+    Returns:
+        list[str]: The description of package.json, empty if the script is not part of an npm package.
+    """
+    package_dir = node_package_dir(script_path)
+    if package_dir is None:
+        return []
+    package_json = os.path.join(package_dir, "package.json")
+    try:
+        with open(package_json, "rb") as file:
+            return [f"{package_json}|{hashlib.md5(file.read()).hexdigest()}"]  # nosec
+    except OSError:
+        return [f"{package_json}|{MISSING}"]
+
+
+def _resolution_chain(path: str, depth: int = 0) -> list[str]:
+    """
+    Describe everything that decides what running path does.
+
+    Args:
+        path (str): The executable.
+        depth (int, optional): Interpreter nesting so far, to stop on interpreters that name themselves. Defaults to 0.
+
+    Returns:
+        list[str]: Symlinks, the real file, npm package metadata, and recursively the shebang interpreter and Python
+            package metadata.
+    """
+    parts = _symlink_chain(path)
+    real_path = os.path.realpath(path)
+    parts.append(_stat_part(real_path))
+    parts.extend(_node_package_parts(real_path))
+    interpreter = read_shebang_interpreter(real_path)
+    if interpreter and depth < 2:
+        parts.append(f"interpreter:{interpreter}")
+        parts.extend(_resolution_chain(interpreter, depth + 1))
+        if os.path.basename(interpreter).lower().startswith(("python", "pypy")):
+            parts.extend(_dist_info_parts(real_path))
+    return parts
+
+
+def get_executable_fingerprint(tool_name: str) -> str:
+    """
+    Describe the executable a tool name resolves to, cheaply, without running it.
+
+    Args:
+        tool_name (str): The name of the command.
+
+    Returns:
+        str: The resolved path followed by everything it depends on, or MISSING if the tool is not on the PATH.
+    """
+    executable_path = path_index.which(str(tool_name))
+    if executable_path is None or not os.path.exists(executable_path):
+        return MISSING
+    return ";".join([executable_path, *_resolution_chain(executable_path)])
+
+
+def digest(executable_fingerprint: str) -> str:
+    """
+    Hash a fingerprint so it can be used in a file name.
+
+    Args:
+        executable_fingerprint (str): A fingerprint from get_executable_fingerprint.
+
+    Returns:
+        str: The hash of the fingerprint.
+    """
+    return hashlib.md5(executable_fingerprint.encode()).hexdigest()  # nosec
+
+
+def fingerprint_digest(tool_name: str) -> str:
+    """
+    Hash the fingerprint so it can be used in a file name.
+
+    Args:
+        tool_name (str): The name of the command.
+
+    Returns:
+        str: The hash of the fingerprint.
+    """
+    return digest(get_executable_fingerprint(tool_name))
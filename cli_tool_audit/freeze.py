@@ -3,13 +3,12 @@ Capture current version of a list of tools.
 """
 
 import os
-import shutil
 import tempfile
 from pathlib import Path
 
 import cli_tool_audit.call_tools as call_tools
-import cli_tool_audit.config_manager as cm
 import cli_tool_audit.models as models
+import cli_tool_audit.path_index as path_index
 
 # Broad categories of tools on PATH for --from-path --category
 _PATH_CATEGORIES: dict[str, list[str]] = {
@@ -72,6 +71,9 @@ def freeze_to_config(tool_names: list[str], config_path: Path, schema: models.Sc
         config_path (Path): The path to the config file.
         schema (SchemaType): The schema to use for the version.
     """
+    # Imported here, the CLI lists the path categories without loading the toml libraries.
+    import cli_tool_audit.config_manager as cm  # pylint: disable=import-outside-toplevel
+
     results = freeze_requirements(tool_names, schema=schema)
     config_manager = cm.ConfigManager(config_path)
     config_manager.read_config()
@@ -89,6 +91,8 @@ def freeze_to_screen(tool_names: list[str], schema: models.SchemaType) -> None:
         tool_names (list[str]): A list of tool names.
         schema (SchemaType): The schema to use for the version.
     """
+    import cli_tool_audit.config_manager as cm  # pylint: disable=import-outside-toplevel
+
     results = freeze_requirements(tool_names, schema=schema)
 
     # Create a temporary directory and file
@@ -126,7 +130,7 @@ def infer_tools_from_makefile(makefile_path: Path | None = None) -> list[str]:
     if makefile_path is None:
         makefile_path = Path.cwd() / "Makefile"
     found = _scan_makefile(makefile_path)
-    return sorted(t for t in found if shutil.which(t))
+    return sorted(t for t in found if path_index.which(t))
 
 
 def infer_tools_from_path(category: str | None = None) -> list[str]:
@@ -143,7 +147,7 @@ def infer_tools_from_path(category: str | None = None) -> list[str]:
         candidates = _PATH_CATEGORIES.get(category, [])
     else:
         candidates = [tool for tools in _PATH_CATEGORIES.values() for tool in tools]
-    return sorted({t for t in candidates if shutil.which(t)})
+    return sorted({t for t in candidates if path_index.which(t)})
 
 
 def list_path_categories() -> list[str]:
@@ -412,7 +412,8 @@ class AuditPanel(_BasePanel):
     def _fetch(config_path):
         from cli_tool_audit.views import validate
 
-        return validate(Path(config_path), no_cache=False, disable_progress_bar=True)
+        # The GUI re-audits on demand, answer unchanged tools from memory however few there are.
+        return validate(Path(config_path), no_cache=False, disable_progress_bar=True, force_cache=True)
 
     def _display(self, results, only_errors=False):
         if not self._alive():
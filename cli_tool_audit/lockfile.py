@@ -0,0 +1,312 @@
+"""
+Record the checked tools in a lock file and verify them later without running anything.
+
+`cli_tool_audit lock` checks every tool once and writes `cli-tools.lock` next to the config. For
+each tool it records the executable the name resolves to, its inode, size, modified time, a content
+hash, the launcher fingerprint, the tool's config and the result of the check. `audit --locked` then only stats the
+executables: tools whose executable is unchanged are answered from the lock file, the rest are
+checked as usual.
+"""
+
+import dataclasses
+import datetime
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import cli_tool_audit.fingerprint as fingerprint
+import cli_tool_audit.models as models
+import cli_tool_audit.path_index as path_index
+
+__all__ = ["LOCK_FILE_NAME", "LockCheck", "fast_verify", "lock_path_for", "read_lock", "verify", "write_lock"]
+
+logger = logging.getLogger(__name__)
+
+LOCK_FILE_NAME = "cli-tools.lock"
+LOCK_FORMAT = "cli_tool_audit-lock"
+LOCK_VERSION = 1
+
+_RESULT_FIELDS = (
+    "desired_version",
+    "is_needed_for_os",
+    "is_available",
+    "is_snapshot",
+    "found_version",
+    "parsed_version",
+    "is_compatible",
+    "is_broken",
+)
+
+
+def lock_path_for(config_path: Path | None) -> Path:
+    """
+    Where the lock file for a config file lives.
+
+    Args:
+        config_path (Optional[Path]): The config file, None for the current directory.
+
+    Returns:
+        Path: The lock file next to the config file.
+    """
+    if config_path is None:
+        return Path(LOCK_FILE_NAME)
+    return config_path.parent / LOCK_FILE_NAME
+
+
+def file_hash(path: str) -> str | None:
+    """
+    Hash the contents of a file.
+
+    Args:
+        path (str): The file.
+
+    Returns:
+        Optional[str]: The sha256 hex digest, or None if the file can't be read.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _stat_fields(path: str, stat: os.stat_result) -> dict[str, Any]:
+    return {"path": path, "inode": stat.st_ino, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _config_hash(config: models.CliToolConfig) -> str:
+    # Checking a tool fills in the default version switch, hash the config as it is checked.
+    return dataclasses.replace(config, version_switch=config.version_switch or "--version").cache_hash()
+
+
+def _config_fields(config: models.CliToolConfig) -> dict[str, Any]:
+    fields = dataclasses.asdict(config)
+    fields["schema"] = str(config.schema) if config.schema else None
+    return fields
+
+
+def _config_from_entry(entry: dict[str, Any]) -> models.CliToolConfig | None:
+    """
+    Rebuild the config a tool was locked with.
+
+    Args:
+        entry (dict[str, Any]): The tool's lock file entry.
+
+    Returns:
+        Optional[models.CliToolConfig]: The config, or None if the entry doesn't record a usable one.
+    """
+    fields = entry.get("config")
+    if not isinstance(fields, dict):
+        return None
+    try:
+        if fields.get("schema"):
+            fields = {**fields, "schema": models.SchemaType(fields["schema"])}
+        return models.CliToolConfig(**fields)
+    except (TypeError, ValueError) as error:
+        logger.debug(f"Ignoring locked config {fields}: {error}")
+        return None
+
+
+def lock_entry(result: models.ToolCheckResult) -> dict[str, Any]:
+    """
+    Describe a checked tool for the lock file.
+
+    Args:
+        result (models.ToolCheckResult): The result of checking the tool.
+
+    Returns:
+        dict[str, Any]: The entry, with the executable fields set to None if the tool is not on the PATH.
+    """
+    entry: dict[str, Any] = {
+        "config_hash": _config_hash(result.tool_config),
+        "config": _config_fields(result.tool_config),
+    }
+    found = path_index.lookup(result.tool_config.name)
+    if found is None:
+        entry.update({"path": None, "inode": None, "size": None, "mtime_ns": None, "sha256": None})
+    else:
+        entry.update(_stat_fields(*found))
+        entry["sha256"] = file_hash(os.path.realpath(found[0]))
+    entry["fingerprint"] = fingerprint.get_executable_fingerprint(result.tool_config.name)
+    entry["checked_at"] = result.checked_at.isoformat() if result.checked_at else None
+    entry["last_modified"] = result.last_modified.isoformat() if result.last_modified else None
+    for field in _RESULT_FIELDS:
+        entry[field] = getattr(result, field)
+    entry["version_provider"] = result.version_provider
+    entry["package_name"] = result.package_name
+    entry["package_version"] = result.package_version
+    return entry
+
+
+def write_lock(results: list[models.ToolCheckResult], lock_path: Path, config_path: Path | None = None) -> None:
+    """
+    Write the lock file atomically.
+
+    Args:
+        results (list[models.ToolCheckResult]): The results of checking every configured tool.
+        lock_path (Path): Where to write the lock file.
+        config_path (Optional[Path], optional): The config the tools came from. Its hash lets fast_verify skip
+            parsing it. Defaults to None.
+    """
+    data = {
+        "format": LOCK_FORMAT,
+        "version": LOCK_VERSION,
+        "config_sha256": file_hash(str(config_path)) if config_path else None,
+        "tools": {result.tool: lock_entry(result) for result in sorted(results, key=lambda result: result.tool)},
+    }
+    handle, temp_name = tempfile.mkstemp(dir=lock_path.parent, prefix=".cli-tools.", suffix=".tmp")
+    try:
+        with open(handle, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+            file.write("\n")
+        os.replace(temp_name, lock_path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def read_lock(lock_path: Path) -> dict[str, Any]:
+    """
+    Read a lock file.
+
+    Args:
+        lock_path (Path): The lock file.
+
+    Returns:
+        dict[str, Any]: The lock file, with the entries by tool name under "tools".
+
+    Raises:
+        ValueError: If the file is not a lock file of this version.
+    """
+    data = json.loads(lock_path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or data.get("format") != LOCK_FORMAT:
+        raise ValueError(f"{lock_path} is not a cli_tool_audit lock file")
+    if data.get("version") != LOCK_VERSION:
+        raise ValueError(f"{lock_path} is lock file version {data.get('version')}, expected {LOCK_VERSION}")
+    return data
+
+
+def _parse_datetime(value: str | None) -> datetime.datetime | None:
+    return datetime.datetime.fromisoformat(value) if value else None
+
+
+def _executable_is_unchanged(name: str, entry: dict[str, Any], check_hash: bool) -> bool:
+    """
+    Is the executable a tool name resolves to the one the lock file describes?
+
+    Args:
+        name (str): The command name.
+        entry (dict[str, Any]): The tool's lock file entry.
+        check_hash (bool): Also compare the content hash, which reads the whole executable.
+
+    Returns:
+        bool: True if the executable is unchanged, or still missing.
+    """
+    found = path_index.lookup(name)
+    if found is None:
+        return entry.get("path") is None
+    if {key: entry.get(key) for key in ("path", "inode", "size", "mtime_ns")} != _stat_fields(*found):
+        return False
+    if entry.get("fingerprint") != fingerprint.get_executable_fingerprint(name):
+        return False
+    return not check_hash or entry.get("sha256") == file_hash(os.path.realpath(found[0]))
+
+
+def _result_from_entry(tool: str, entry: dict[str, Any], config: models.CliToolConfig) -> models.ToolCheckResult:
+    return models.ToolCheckResult(
+        tool=tool,
+        tool_config=config,
+        last_modified=_parse_datetime(entry["last_modified"]),
+        checked_at=_parse_datetime(entry["checked_at"]),
+        # Lock files written before providers and packages were recorded don't have them.
+        version_provider=entry.get("version_provider"),
+        package_name=entry.get("package_name"),
+        package_version=entry.get("package_version"),
+        **{field: entry[field] for field in _RESULT_FIELDS},
+    )
+
+
+@dataclasses.dataclass
+class LockCheck:
+    """
+    Tools answered from a lock file and tools that have to be checked again.
+    """
+
+    results: list[models.ToolCheckResult] = dataclasses.field(default_factory=list)
+    changed: dict[str, models.CliToolConfig] = dataclasses.field(default_factory=dict)
+
+
+def verify(cli_tools: dict[str, models.CliToolConfig], lock_path: Path, check_hash: bool = False) -> LockCheck:
+    """
+    Answer tools from the lock file where their config and executable are unchanged.
+
+    Unchanged means the same config, the same resolved path with the same inode, size and modified
+    time, and the same launcher fingerprint. Nothing is run.
+
+    Args:
+        cli_tools (dict[str, models.CliToolConfig]): The configured tools.
+        lock_path (Path): The lock file. If it is missing or unreadable, every tool counts as changed.
+        check_hash (bool, optional): Also compare content hashes. Defaults to False.
+
+    Returns:
+        LockCheck: Results from the lock file, and the tools to check again.
+    """
+    check = LockCheck()
+    try:
+        entries = read_lock(lock_path)["tools"]
+    except (OSError, ValueError, KeyError) as error:
+        logger.warning(f"Can't use lock file {lock_path}: {error}")
+        entries = {}
+    for tool, config in cli_tools.items():
+        entry = entries.get(tool)
+        if (
+            entry is None
+            or entry.get("config_hash") != _config_hash(config)
+            or not _executable_is_unchanged(config.name, entry, check_hash)
+        ):
+            check.changed[tool] = config
+            continue
+        check.results.append(_result_from_entry(tool, entry, config))
+    return check
+
+
+def fast_verify(config_path: Path, check_hash: bool = False) -> list[models.ToolCheckResult] | None:
+    """
+    Answer every tool from the lock file without parsing the config, if nothing changed at all.
+
+    The config file is compared by hash instead of being parsed, so the config parser and its
+    dependencies are never imported. The results carry the config each tool was locked with, so
+    schema and OS conditions are the same as after parsing the config.
+
+    Args:
+        config_path (Path): The config file. The lock file is next to it.
+        check_hash (bool, optional): Also compare content hashes of the executables. Defaults to False.
+
+    Returns:
+        Optional[list[models.ToolCheckResult]]: The results, or None if the lock file is missing or anything
+            changed since it was written.
+    """
+    lock_path = lock_path_for(config_path)
+    try:
+        data = read_lock(lock_path)
+        entries = data["tools"]
+    except (OSError, ValueError, KeyError) as error:
+        logger.debug(f"Can't use lock file {lock_path}: {error}")
+        return None
+    if not data.get("config_sha256") or data["config_sha256"] != file_hash(str(config_path)):
+        return None
+    results = []
+    for tool, entry in entries.items():
+        # Lock files written before configs were recorded are verified against the parsed config.
+        config = _config_from_entry(entry)
+        if config is None or not _executable_is_unchanged(config.name, entry, check_hash):
+            return None
+        results.append(_result_from_entry(tool, entry, config))
+    return results
@@ -79,6 +79,26 @@ class ToolCheckResult:
     is_broken: bool
     last_modified: datetime.datetime | None
     tool_config: CliToolConfig
+    checked_at: datetime.datetime | None = None
+    """When the tool was actually run, cached results keep the time of the original check."""
+    check_duration: float | None = None
+    """Seconds spent finding and running the tool."""
+    version_provider: str | None = None
+    """Provider that read found_version without running the tool, None if the tool was run."""
+    package_name: str | None = None
+    """System package found_version was read from, None if the tool was run or no package database answered."""
+    package_version: str | None = None
+    """Version of package_name as the package manager records it, such as `1:2.39.5-0+deb12u2`."""
+
+    def age_seconds(self) -> float | None:
+        """How old the data in this result is.
+
+        Returns:
+            Optional[float]: Seconds since the tool was checked, or None if unknown.
+        """
+        if self.checked_at is None:
+            return None
+        return (datetime.datetime.now() - self.checked_at).total_seconds()
 
     def _uses_existence_schema(self) -> bool:
         schema = self.tool_config.schema
@@ -164,6 +184,12 @@ class ToolAvailabilityResult:
     version: str | None
     """Desired version"""
     last_modified: datetime.datetime | None
+    version_provider: str | None = None
+    """Provider that read the version without running the tool, None if the tool was run."""
+    package_name: str | None = None
+    """System package the version was read from."""
+    package_version: str | None = None
+    """Version of package_name as the package manager records it."""
 
 
 if __name__ == "__main__":
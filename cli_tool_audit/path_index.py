@@ -0,0 +1,298 @@
+"""
+Find executables on the PATH from an index instead of probing every PATH directory per tool.
+
+`shutil.which` tries every PATH directory in turn, so with a long PATH and many tools an audit
+makes thousands of stat calls. The index lists each PATH directory once with `os.scandir` and
+answers lookups from memory, keeping the first match in PATH order like `which` does. A directory
+is listed again only when its mtime changes, which happens whenever an entry is added, removed or
+renamed in it.
+
+When the project has a result cache, the directory listings are saved next to it so the next run
+only has to stat the PATH directories.
+"""
+
+import json
+import logging
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+__all__ = ["PathIndex", "get_index", "lookup", "lookup_all", "which"]
+
+logger = logging.getLogger(__name__)
+
+CACHE_ROOT_NAME = ".cli_tool_audit_cache"
+"""Same as audit_cache.CACHE_ROOT_NAME, not imported from there because the cache imports this module."""
+INDEX_NAME = "path_index.json"
+"""File in the cache root that holds the saved directory listings."""
+INDEX_VERSION = 1
+REVALIDATE_SECONDS = 1.0
+"""How long the listings are trusted before the PATH directory mtimes are checked again."""
+
+
+def _is_windows() -> bool:
+    return sys.platform == "win32"
+
+
+def _normalize(name: str) -> str:
+    return name.lower() if _is_windows() else name
+
+
+class PathIndex:
+    """
+    Names of the entries of each PATH directory, listed once and refreshed when a directory changes.
+    """
+
+    def __init__(self, path_value: str, index_file: Path | None = None) -> None:
+        """
+        Args:
+            path_value (str): The PATH to index, os.pathsep separated.
+            index_file (Optional[Path], optional): Where to load and save directory listings. Defaults to None,
+                which keeps the index in memory only.
+        """
+        self.path_value = path_value
+        self.index_file = index_file
+        self.directories: list[str] = []
+        for directory in path_value.split(os.pathsep):
+            if directory and directory not in self.directories:
+                self.directories.append(directory)
+        self._listings: dict[str, tuple[int, frozenset[str]]] = {}
+        self._validated_at = 0.0
+        self._lock = threading.Lock()
+        self._load()
+        self.revalidate()
+
+    def _load(self) -> None:
+        """Read saved listings, ignoring a missing or unreadable file."""
+        if self.index_file is None:
+            return
+        try:
+            saved = json.loads(self.index_file.read_text(encoding="utf-8"))
+            if saved.get("version") != INDEX_VERSION:
+                return
+            for directory, (mtime_ns, names) in saved["directories"].items():
+                self._listings[directory] = (mtime_ns, frozenset(names))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as error:
+            logger.debug(f"Ignoring PATH index {self.index_file}: {error}")
+
+    def _save(self) -> None:
+        """Write the listings, only if the cache root exists so the index never creates cache directories."""
+        if self.index_file is None or not self.index_file.parent.is_dir():
+            return
+        saved = {
+            "version": INDEX_VERSION,
+            "directories": {
+                directory: [mtime_ns, sorted(names)] for directory, (mtime_ns, names) in self._listings.items()
+            },
+        }
+        try:
+            handle, temp_name = tempfile.mkstemp(dir=self.index_file.parent, suffix=".tmp")
+            with open(handle, "w", encoding="utf-8") as file:
+                json.dump(saved, file, separators=(",", ":"))
+            os.replace(temp_name, self.index_file)
+        except OSError as error:
+            logger.debug(f"Failed to save PATH index {self.index_file}: {error}")
+
+    def revalidate(self) -> bool:
+        """
+        Stat every PATH directory and list again the ones that changed.
+
+        Returns:
+            bool: True if any directory was listed again.
+        """
+        changed = False
+        with self._lock:
+            for directory in self.directories:
+                try:
+                    mtime_ns = os.stat(directory).st_mtime_ns
+                except OSError:
+                    if self._listings.pop(directory, None) is not None:
+                        changed = True
+                    continue
+                known = self._listings.get(directory)
+                if known is not None and known[0] == mtime_ns:
+                    continue
+                try:
+                    with os.scandir(directory) as entries:
+                        names = frozenset(_normalize(entry.name) for entry in entries)
+                except OSError:
+                    names = frozenset()
+                self._listings[directory] = (mtime_ns, names)
+                changed = True
+            self._validated_at = time.monotonic()
+        if changed:
+            self._save()
+        return changed
+
+    def _candidates(self, name: str) -> list[str]:
+        """
+        File names that would run for a command name, with PATHEXT extensions on Windows.
+
+        Args:
+            name (str): The command name.
+
+        Returns:
+            list[str]: Names to look for, in order of preference.
+        """
+        if not _is_windows():
+            return [name]
+        extensions = [ext for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep) if ext]
+        if any(name.lower().endswith(ext.lower()) for ext in extensions):
+            return [name]
+        return [name + ext for ext in extensions]
+
+    def _search(self, name: str, first_only: bool = True) -> list[tuple[str, os.stat_result]]:
+        """
+        Find the executables for a name in PATH order, using the listings as they are.
+
+        Args:
+            name (str): The command name.
+            first_only (bool, optional): Stop at the first match, like `which`. Defaults to True.
+
+        Returns:
+            list[tuple[str, os.stat_result]]: The paths and fresh stats of them, empty if not found.
+        """
+        matches = []
+        candidates = self._candidates(name)
+        for directory in self.directories:
+            listing = self._listings.get(directory)
+            if listing is None:
+                continue
+            for candidate in candidates:
+                if _normalize(candidate) not in listing[1]:
+                    continue
+                path = os.path.join(directory, candidate)
+                found = _executable_stat(path)
+                if found is None:
+                    continue
+                matches.append((path, found))
+                if first_only:
+                    return matches
+                # Only the first PATHEXT match in a directory runs, later ones are never reached.
+                break
+        return matches
+
+    def _revalidate_if_due(self) -> None:
+        # Within one audit every lookup shares one check of the directories, long-lived processes
+        # check again on their next audit.
+        if time.monotonic() - self._validated_at > REVALIDATE_SECONDS:
+            self.revalidate()
+
+    def lookup(self, name: str) -> tuple[str, os.stat_result] | None:
+        """
+        Find the executable a command name runs, like shutil.which, and stat it.
+
+        Args:
+            name (str): The command name, or a path.
+
+        Returns:
+            Optional[tuple[str, os.stat_result]]: The path and a fresh stat of it, or None if not found.
+        """
+        if os.path.dirname(name):
+            found = _executable_stat(name)
+            return (name, found) if found is not None else None
+        self._revalidate_if_due()
+        matches = self._search(name)
+        return matches[0] if matches else None
+
+    def lookup_all(self, name: str) -> list[tuple[str, os.stat_result]]:
+        """
+        Find every executable a command name could run, one per PATH directory, like `which -a`.
+
+        Args:
+            name (str): The command name.
+
+        Returns:
+            list[tuple[str, os.stat_result]]: The paths and fresh stats of them in PATH order, the first one
+                is what lookup returns.
+        """
+        if os.path.dirname(name):
+            found = self.lookup(name)
+            return [found] if found is not None else []
+        self._revalidate_if_due()
+        return self._search(name, first_only=False)
+
+
+def _executable_stat(path: str) -> os.stat_result | None:
+    """
+    Stat a file if it can be run.
+
+    Args:
+        path (str): The file.
+
+    Returns:
+        Optional[os.stat_result]: The stat, or None if the file is missing, a directory or not executable.
+    """
+    try:
+        found = os.stat(path)
+    except OSError:
+        return None
+    if stat.S_ISDIR(found.st_mode):
+        return None
+    if not _is_windows() and not os.access(path, os.X_OK):
+        return None
+    return found
+
+
+_INDEX: PathIndex | None = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_index() -> PathIndex:
+    """
+    Get the index for the current PATH, building a new one when PATH or the working directory changes.
+
+    Returns:
+        PathIndex: The process-wide index.
+    """
+    global _INDEX  # pylint: disable=global-statement
+    path_value = os.environ.get("PATH", os.defpath)
+    index_file = Path.cwd() / CACHE_ROOT_NAME / INDEX_NAME
+    with _INDEX_LOCK:
+        if _INDEX is None or _INDEX.path_value != path_value or _INDEX.index_file != index_file:
+            _INDEX = PathIndex(path_value, index_file)
+        return _INDEX
+
+
+def lookup(name: str) -> tuple[str, os.stat_result] | None:
+    """
+    Find the executable a command name runs and stat it.
+
+    Args:
+        name (str): The command name.
+
+    Returns:
+        Optional[tuple[str, os.stat_result]]: The path and its stat, or None if it is not on the PATH.
+    """
+    return get_index().lookup(str(name))
+
+
+def lookup_all(name: str) -> list[tuple[str, os.stat_result]]:
+    """
+    Find every executable on the PATH for a command name and stat them.
+
+    Args:
+        name (str): The command name.
+
+    Returns:
+        list[tuple[str, os.stat_result]]: The paths and their stats in PATH order, empty if there are none.
+    """
+    return get_index().lookup_all(str(name))
+
+
+def which(name: str) -> str | None:
+    """
+    Drop-in replacement for shutil.which, answered from the index.
+
+    Args:
+        name (str): The command name.
+
+    Returns:
+        Optional[str]: The path of the executable, or None if it is not on the PATH.
+    """
+    found = lookup(name)
+    return found[0] if found is not None else None
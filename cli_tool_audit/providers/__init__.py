@@ -0,0 +1,106 @@
+"""
+Read tool versions from the files their installers leave behind, without running the tools.
+
+Running `tool --version` starts the tool, which for interpreters and JVMs costs far more than the
+check itself. A provider recognises executables installed a particular way and reads the version
+from what the installer recorded. Providers are asked in order and the first answer wins; if none
+answers, the tool is run as usual.
+
+Providers only answer semver and pep440 checks of tools that use the default version switch. A
+snapshot compares the full output of the version switch, which no provider can reproduce, and a tool
+configured with its own version switch is always run.
+
+Providers that read a system package database also name the package, which results report next to
+the version.
+"""
+
+import logging
+import os
+
+from cli_tool_audit.providers.base import InstalledPackage, ProvidedVersion, VersionProvider
+from cli_tool_audit.providers.cargo import CargoProvider
+from cli_tool_audit.providers.conda import CondaProvider
+from cli_tool_audit.providers.dpkg import DpkgProvider
+from cli_tool_audit.providers.go_buildinfo import GoBuildInfoProvider
+from cli_tool_audit.providers.jdk import JdkProvider
+from cli_tool_audit.providers.npm import NpmProvider
+from cli_tool_audit.providers.path_layout import PathLayoutProvider
+from cli_tool_audit.providers.pipx import PipxProvider
+from cli_tool_audit.providers.python_metadata import PythonMetadataProvider
+
+__all__ = [
+    "PROVIDERS",
+    "InstalledPackage",
+    "ProvidedVersion",
+    "VersionProvider",
+    "enabled_providers",
+    "find_version",
+    "is_enabled",
+]
+
+logger = logging.getLogger(__name__)
+
+PROVIDERS: list[VersionProvider] = [
+    PipxProvider(),
+    PythonMetadataProvider(),
+    NpmProvider(),
+    CargoProvider(),
+    JdkProvider(),
+    CondaProvider(),
+    DpkgProvider(),
+    PathLayoutProvider(),
+    GoBuildInfoProvider(),
+]
+"""Every provider, in the order they are asked."""
+
+
+def is_enabled(name: str) -> bool:
+    """
+    Check if CLI_TOOL_AUDIT_PROVIDERS selects a provider.
+
+    Args:
+        name (str): The provider name.
+
+    Returns:
+        bool: True if the variable is unset or names it.
+    """
+    setting = os.environ.get("CLI_TOOL_AUDIT_PROVIDERS")
+    if setting is None:
+        return True
+    return name in {item.strip() for item in setting.split(",")}
+
+
+def enabled_providers() -> list[VersionProvider]:
+    """
+    The providers selected by CLI_TOOL_AUDIT_PROVIDERS.
+
+    Returns:
+        list[VersionProvider]: All providers if the variable is unset, else those it names, none for "none".
+    """
+    return [provider for provider in PROVIDERS if is_enabled(provider.name)]
+
+
+def find_version(path: str) -> ProvidedVersion | None:
+    """
+    Ask the providers for the version of an executable.
+
+    Args:
+        path (str): The executable as found on the PATH.
+
+    Returns:
+        Optional[ProvidedVersion]: The first answer, or None if no provider knows the executable.
+    """
+    real_path = os.path.realpath(path)
+    for provider in enabled_providers():
+        try:
+            version = provider.find_version(path, real_path)
+            if not version:
+                continue
+            source = provider.describe(path, real_path)
+            package = provider.find_package(path, real_path)
+        except (OSError, ValueError) as error:
+            logger.debug(f"Provider {provider.name} failed for {path}: {error}")
+            continue
+        return ProvidedVersion(version=version, provider=source, package=package)
+    return None
+
@@ -0,0 +1,78 @@
+"""
+Abstract base class for reading a tool's version without running it.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass
+class InstalledPackage:
+    """
+    The system package that owns an executable, reported next to the version read from it.
+    """
+
+    name: str
+    version: str
+    """The package version as the package manager records it."""
+
+
+@dataclass
+class ProvidedVersion:
+    """
+    A version read from installer metadata, and the provider that read it.
+    """
+
+    version: str
+    provider: str
+    """The provider's name, with the package manager it recognised where it knows one, e.g. path-layout:homebrew."""
+    package: InstalledPackage | None = None
+    """The package the version was read from, for providers that read system package databases."""
+
+
+class VersionProvider(ABC):
+    """
+    Abstract base class for reading the version of an executable from files its installer left behind.
+    """
+
+    name: str
+    """Short name, used in CLI_TOOL_AUDIT_PROVIDERS and in logs."""
+
+    @abstractmethod
+    def find_version(self, path: str, real_path: str) -> str | None:
+        """
+        Read the version of an executable without running it.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[str]: The version, or None if this provider doesn't know the executable or can't tell for sure.
+        """
+
+    def describe(self, path: str, real_path: str) -> str:  # pylint: disable=unused-argument
+        """
+        Say where a version answered by find_version came from, for results and reports.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            str: The provider's name by default.
+        """
+        return self.name
+
+    def find_package(self, path: str, real_path: str) -> InstalledPackage | None:  # pylint: disable=unused-argument
+        """
+        Name the package a version answered by find_version came from, for providers that know one.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[InstalledPackage]: The package, None by default.
+        """
+        return None
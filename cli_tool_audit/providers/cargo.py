@@ -0,0 +1,114 @@
+"""
+Versions of tools installed with `cargo install`, from `$CARGO_HOME/.crates2.json`.
+
+cargo records every crate it installed, with its exact version and the binaries it copied into
+`$CARGO_HOME/bin`. The manifest is parsed once into a binary to version index and parsed again only
+when it changes. A binary modified after the manifest was replaced by something other than cargo,
+so it is run as usual. The rustup proxies in the same directory are not in the manifest and are
+run as usual too.
+"""
+
+import functools
+import json
+import os
+import re
+from pathlib import Path
+
+from cli_tool_audit.providers.base import VersionProvider
+
+__all__ = ["CargoProvider", "binary_versions", "cargo_home"]
+
+MANIFEST_FILE = ".crates2.json"
+
+_INSTALL_KEY = re.compile(r"^(?P<name>\S+) (?P<version>\S+) \(")
+"""Keys of the manifest are `<crate> <version> (<source>)`."""
+
+
+def cargo_home() -> Path:
+    """
+    Where cargo keeps installed binaries and its manifest.
+
+    Returns:
+        Path: CARGO_HOME, defaults to ~/.cargo.
+    """
+    return Path(os.environ.get("CARGO_HOME") or Path.home() / ".cargo")
+
+
+@functools.lru_cache(maxsize=8)
+def _read_binary_versions(manifest_path: str, _mtime_ns: int) -> dict[str, str]:
+    """
+    Index the binaries cargo installed by name.
+
+    Args:
+        manifest_path (str): The .crates2.json file.
+        _mtime_ns (int): The mtime of manifest_path, used only as part of the cache key.
+
+    Returns:
+        dict[str, str]: The crate version by binary name, empty if the manifest can't be read.
+    """
+    try:
+        with open(manifest_path, encoding="utf-8") as file:
+            installs = json.load(file).get("installs")
+    except (OSError, ValueError, AttributeError):
+        return {}
+    if not isinstance(installs, dict):
+        return {}
+    versions = {}
+    for key, install in installs.items():
+        match = _INSTALL_KEY.match(key)
+        if not match or not isinstance(install, dict):
+            continue
+        for binary in install.get("bins") or []:
+            if isinstance(binary, str):
+                versions[binary] = match.group("version")
+    return versions
+
+
+def binary_versions(home: Path) -> tuple[dict[str, str], int | None]:
+    """
+    The binaries cargo installed and their crate versions.
+
+    Args:
+        home (Path): The cargo home.
+
+    Returns:
+        tuple[dict[str, str], Optional[int]]: The versions by binary name, and the mtime of the manifest in
+            nanoseconds, or None if there is no manifest.
+    """
+    manifest_path = home / MANIFEST_FILE
+    try:
+        mtime_ns = manifest_path.stat().st_mtime_ns
+    except OSError:
+        return {}, None
+    return _read_binary_versions(str(manifest_path), mtime_ns), mtime_ns
+
+
+class CargoProvider(VersionProvider):
+    """
+    Answers for binaries in $CARGO_HOME/bin that cargo installed and that were not modified since.
+    """
+
+    name = "cargo"
+
+    def find_version(self, path: str, real_path: str) -> str | None:
+        """
+        Read the version of the crate a binary was installed from.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[str]: The crate version, or None if the binary is not in the manifest or is newer than it.
+        """
+        home = cargo_home()
+        binary = Path(real_path)
+        if binary.parent != (home / "bin").resolve():
+            return None
+        versions, manifest_mtime_ns = binary_versions(home)
+        version = versions.get(binary.name)
+        if version is None or manifest_mtime_ns is None:
+            return None
+        if binary.stat().st_mtime_ns > manifest_mtime_ns:
+            return None
+        return version
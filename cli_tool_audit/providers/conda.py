@@ -0,0 +1,155 @@
+"""
+Versions of tools installed into conda environments, from the environment's `conda-meta` records.
+
+conda writes a JSON record for every package it links into an environment, with the package name,
+version and every file it installed, relative to the environment prefix. The executables listed in
+the records are indexed once per environment, and the index is rebuilt only when the `conda-meta`
+directory changes, which happens whenever a package is installed, upgraded or removed. The index is
+saved in the cache directory like the dpkg index.
+
+Files in an environment that no record lists, such as console scripts pip installed there, and files
+modified after the last conda transaction are left to the other providers or run as usual.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+import cli_tool_audit.providers.saved_index as saved_index
+from cli_tool_audit.providers.base import VersionProvider
+
+__all__ = ["CondaProvider", "conda_prefix_for", "executable_packages"]
+
+logger = logging.getLogger(__name__)
+
+META_DIR = "conda-meta"
+EXECUTABLE_DIRS = frozenset({"bin", "Scripts", "Library/bin", ""})
+"""Directories of a prefix that hold executables, relative to it. The prefix itself holds python.exe on Windows."""
+
+
+def conda_prefix_for(real_path: str) -> Path | None:
+    """
+    Find the conda environment an executable is in.
+
+    Args:
+        real_path (str): The executable with symlinks resolved.
+
+    Returns:
+        Optional[Path]: The environment prefix, the directory with conda-meta, or None if there is none.
+    """
+    directory = Path(real_path).parent
+    # bin or Scripts, Library/bin, or the prefix itself.
+    for candidate in (directory.parent, directory.parent.parent, directory):
+        if (candidate / META_DIR).is_dir():
+            return candidate
+    return None
+
+
+def _build_index(meta_dir: Path) -> dict[str, list[str]]:
+    """
+    Index the executables of the packages linked into an environment.
+
+    Args:
+        meta_dir (Path): The conda-meta directory of the environment.
+
+    Returns:
+        dict[str, list[str]]: The package name and version by path of each executable, relative to the prefix.
+    """
+    executables = {}
+    with os.scandir(meta_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                with open(entry.path, encoding="utf-8") as file:
+                    record = json.load(file)
+                name, version, files = record["name"], record["version"], record.get("files") or []
+            except (OSError, ValueError, TypeError, KeyError) as error:
+                logger.debug(f"Skipping conda record {entry.path}: {error}")
+                continue
+            for file_path in files:
+                if isinstance(file_path, str) and os.path.dirname(file_path) in EXECUTABLE_DIRS:
+                    executables[file_path] = [name, version]
+    return executables
+
+
+@functools.lru_cache(maxsize=16)
+def _load_index(meta_dir: str, meta_mtime_ns: int, saved_path: str) -> dict[str, list[str]]:
+    """
+    Load the saved index if it is for this environment and conda-meta directory, else build and save it.
+
+    Args:
+        meta_dir (str): The conda-meta directory.
+        meta_mtime_ns (int): The mtime of meta_dir.
+        saved_path (str): Where the index is saved.
+
+    Returns:
+        dict[str, list[str]]: The package name and version by path of each executable, relative to the prefix.
+    """
+    try:
+        return saved_index.load_or_build(
+            Path(saved_path),
+            {"meta_dir": meta_dir, "meta_mtime_ns": meta_mtime_ns},
+            lambda: _build_index(Path(meta_dir)),
+        )
+    except OSError as error:
+        logger.debug(f"Failed to read conda records {meta_dir}: {error}")
+        return {}
+
+
+def executable_packages(prefix: Path) -> tuple[dict[str, list[str]], int | None]:
+    """
+    The executables of the packages linked into an environment, with their package.
+
+    Args:
+        prefix (Path): The environment prefix.
+
+    Returns:
+        tuple[dict[str, list[str]], Optional[int]]: The package name and version by path of each executable,
+            relative to the prefix, and the mtime of conda-meta in nanoseconds, or None if there is no conda-meta.
+    """
+    meta_dir = prefix / META_DIR
+    try:
+        meta_mtime_ns = meta_dir.stat().st_mtime_ns
+    except OSError:
+        return {}, None
+    digest = hashlib.md5(str(meta_dir).encode()).hexdigest()[:12]  # nosec
+    saved_path = saved_index.index_file(f"conda_index_{digest}.json")
+    return _load_index(str(meta_dir), meta_mtime_ns, str(saved_path)), meta_mtime_ns
+
+
+class CondaProvider(VersionProvider):
+    """
+    Answers for executables that a package linked into a conda environment and that were not modified since.
+    """
+
+    name = "conda"
+
+    def find_version(self, path: str, real_path: str) -> str | None:
+        """
+        Read the version of the conda package that installed an executable.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[str]: The package version, or None if the executable is not in a conda environment, no
+                package lists it, or it is newer than the last conda transaction.
+        """
+        prefix = conda_prefix_for(real_path)
+        if prefix is None:
+            return None
+        executables, meta_mtime_ns = executable_packages(prefix)
+        if meta_mtime_ns is None:
+            return None
+        owner = executables.get(Path(real_path).relative_to(prefix).as_posix())
+        if owner is None:
+            logger.debug(f"No conda package in {prefix} lists {path}")
+            return None
+        if os.stat(real_path).st_mtime_ns > meta_mtime_ns:
+            return None
+        return owner[1]
@@ -0,0 +1,265 @@
+"""
+Versions of tools installed from Debian packages, from the dpkg database.
+
+Most system tools on Debian and Ubuntu, such as make, git, curl and jq, belong to a package. dpkg
+lists the files of each package in `info/<package>.list` and the version of each installed package
+in `status`. The executables in bin, sbin and games directories are indexed once, with the version of
+the package that owns them. The index is rebuilt only when the status file changes, which dpkg does
+on every install, upgrade and removal. When the project has a result cache, the index is saved next
+to it so the next run does not read the thousands of list files again.
+
+The reported version is the upstream part of the package version: `1:2.39.5-0+deb12u2` is reported
+as `2.39.5`, which is what `git --version` prints. Repack suffixes such as `+dfsg` are dropped and a
+downgrade such as `0.99.4+really0.99.3` is reported as the version it really is. The package name and
+full Debian version are reported next to it. A binary modified after the status file was not put
+there by dpkg, so it is run as usual.
+"""
+
+import functools
+import logging
+import os
+import re
+from pathlib import Path
+
+import cli_tool_audit.providers.saved_index as saved_index
+from cli_tool_audit.providers.base import InstalledPackage, VersionProvider
+
+__all__ = ["DpkgProvider", "admin_dir", "executable_packages", "owning_package", "upstream_version"]
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "dpkg_index.json"
+"""File in the cache root that holds the saved index."""
+EXECUTABLE_DIRS = ("/bin", "/sbin", "/games")
+"""Only files in directories with these names are indexed, the rest of a package can't be on the PATH."""
+REPACK_SUFFIX = re.compile(r"[+~](?:dfsg|ds|repack)[\d.]*$")
+"""Marks an upstream tarball that Debian repacked, `1.34+dfsg` is upstream `1.34`."""
+REALLY = "+really"
+"""Marks a downgrade, `0.99.4+really0.99.3` sorts after 0.99.4 but is upstream `0.99.3`."""
+
+
+def admin_dir() -> Path:
+    """
+    Where dpkg keeps its database.
+
+    Returns:
+        Path: DPKG_ADMINDIR, defaults to /var/lib/dpkg.
+    """
+    return Path(os.environ.get("DPKG_ADMINDIR") or "/var/lib/dpkg")
+
+
+def upstream_version(version: str) -> str:
+    """
+    The version of the software in a Debian package version.
+
+    Args:
+        version (str): The package version, `[epoch:]upstream[-revision]`.
+
+    Returns:
+        str: The upstream version, without repack suffixes, the downgraded-to version of a `+really` version, and
+            `~` pre-releases written with `-` so semver and pep440 can parse them.
+    """
+    epoch, separator, rest = version.partition(":")
+    if separator and epoch.isdigit():
+        version = rest
+    upstream, separator, _revision = version.rpartition("-")
+    if not separator:
+        upstream = version
+    upstream = upstream.rpartition(REALLY)[2]
+    return REPACK_SUFFIX.sub("", upstream).replace("~", "-")
+
+
+def _read_status(status_path: Path) -> dict[str, str]:
+    """
+    Read the versions of installed packages.
+
+    Args:
+        status_path (Path): The dpkg status file.
+
+    Returns:
+        dict[str, str]: The package version by package name.
+    """
+    versions = {}
+    fields: dict[str, str] = {}
+    with open(status_path, encoding="utf-8", errors="replace") as file:
+        for line in [*file, "\n"]:
+            if line == "\n":
+                if fields.get("Status", "").endswith(" installed") and "Package" in fields and "Version" in fields:
+                    versions[fields["Package"]] = fields["Version"]
+                fields = {}
+            elif not line[0].isspace():
+                key, separator, value = line.partition(":")
+                if separator and key in ("Package", "Status", "Version"):
+                    fields[key] = value.strip()
+    return versions
+
+
+def _read_lists(info_dir: Path) -> dict[str, str]:
+    """
+    Find the package that owns each executable.
+
+    Args:
+        info_dir (Path): The dpkg info directory.
+
+    Returns:
+        dict[str, str]: The package name by path of each file in a bin, sbin or games directory.
+    """
+    owners = {}
+    with os.scandir(info_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".list"):
+                continue
+            # Multi-arch packages are listed as <package>:<arch>.list.
+            package = entry.name[: -len(".list")].split(":")[0]
+            try:
+                with open(entry.path, encoding="utf-8", errors="replace") as file:
+                    for line in file:
+                        file_path = line.rstrip("\n")
+                        if os.path.dirname(file_path).endswith(EXECUTABLE_DIRS):
+                            owners[file_path] = package
+            except OSError as error:
+                logger.debug(f"Skipping {entry.path}: {error}")
+    return owners
+
+
+def _build_index(admin: Path) -> dict[str, list[str]]:
+    """
+    Index the executables of installed packages.
+
+    Args:
+        admin (Path): The dpkg database directory.
+
+    Returns:
+        dict[str, list[str]]: The package name and package version by path of each executable.
+    """
+    versions = _read_status(admin / "status")
+    return {
+        file_path: [package, versions[package]]
+        for file_path, package in _read_lists(admin / "info").items()
+        if package in versions
+    }
+
+
+@functools.lru_cache(maxsize=4)
+def _load_index(admin: str, status_mtime_ns: int, saved_path: str) -> dict[str, list[str]]:
+    """
+    Load the saved index if it is for this database and status file, else build and save it.
+
+    Args:
+        admin (str): The dpkg database directory.
+        status_mtime_ns (int): The mtime of the status file.
+        saved_path (str): Where the index is saved.
+
+    Returns:
+        dict[str, list[str]]: The package name and package version by path of each executable.
+    """
+    try:
+        return saved_index.load_or_build(
+            Path(saved_path),
+            {"admin_dir": admin, "status_mtime_ns": status_mtime_ns},
+            lambda: _build_index(Path(admin)),
+        )
+    except OSError as error:
+        logger.debug(f"Failed to read dpkg database {admin}: {error}")
+        return {}
+
+
+def executable_packages(admin: Path) -> tuple[dict[str, list[str]], int | None]:
+    """
+    The executables of installed packages, with their package.
+
+    Args:
+        admin (Path): The dpkg database directory.
+
+    Returns:
+        tuple[dict[str, list[str]], Optional[int]]: The package name and package version by path of each
+            executable, and the mtime of the status file in nanoseconds, or None if there is no dpkg database.
+    """
+    try:
+        status_mtime_ns = (admin / "status").stat().st_mtime_ns
+    except OSError:
+        return {}, None
+    return _load_index(str(admin), status_mtime_ns, str(saved_index.index_file(INDEX_NAME))), status_mtime_ns
+
+
+def _owner(real_path: str) -> tuple[str, str, int] | None:
+    """
+    Find the installed package that owns an executable.
+
+    Args:
+        real_path (str): The executable with symlinks resolved.
+
+    Returns:
+        Optional[tuple[str, str, int]]: The package name, package version and mtime of the status file in
+            nanoseconds, or None if no installed package owns the executable.
+    """
+    executables, status_mtime_ns = executable_packages(admin_dir())
+    if not executables or status_mtime_ns is None:
+        return None
+    # With merged /usr, /bin is a link to /usr/bin but packages still list /bin/ls.
+    candidates = [real_path, real_path[len("/usr") :]] if real_path.startswith("/usr/") else [real_path]
+    for candidate in candidates:
+        owner = executables.get(candidate)
+        if owner is not None:
+            return owner[0], owner[1], status_mtime_ns
+    return None
+
+
+def owning_package(real_path: str) -> InstalledPackage | None:
+    """
+    Find the installed package that owns an executable.
+
+    Args:
+        real_path (str): The executable with symlinks resolved.
+
+    Returns:
+        Optional[InstalledPackage]: The package name and full Debian version, or None if no installed package
+            owns the executable.
+    """
+    owner = _owner(real_path)
+    if owner is None:
+        return None
+    return InstalledPackage(name=owner[0], version=owner[1])
+
+
+class DpkgProvider(VersionProvider):
+    """
+    Answers for executables that an installed Debian package owns and that were not modified since.
+    """
+
+    name = "dpkg"
+
+    def find_version(self, path: str, real_path: str) -> str | None:
+        """
+        Read the upstream version of the package that owns an executable.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[str]: The upstream version, or None if no installed package owns the executable or it is
+                newer than the status file.
+        """
+        owner = _owner(real_path)
+        if owner is None:
+            return None
+        package, version, status_mtime_ns = owner
+        if os.stat(real_path).st_mtime_ns > status_mtime_ns:
+            return None
+        logger.debug(f"{path} belongs to {package} {version}")
+        return upstream_version(version)
+
+    def find_package(self, path: str, real_path: str) -> InstalledPackage | None:
+        """
+        Name the package that owns an executable.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[InstalledPackage]: The package name and full Debian version, or None if no installed package
+                owns the executable.
+        """
+        return owning_package(real_path)
@@ -0,0 +1,294 @@
+"""
+Versions of Go programs, from the build info the Go linker embeds in every ELF binary.
+
+Since Go 1.13 binaries carry a `.go.buildinfo` blob with the toolchain version and the module info
+printed by `go version -m`: the main package path, the main module and its version, dependencies and
+build settings. Decoding it reads a few kilobytes of the file and never runs it. This covers Go CLIs
+whose `--version` is slow, needs network access or does not exist.
+
+Binaries built from a checkout report the main module version as `(devel)` or, since Go 1.24, as a
+pseudo-version of the commit. Those are run as usual, since their own `--version` is what the
+project set at link time. Only ELF binaries are read; Go binaries for macOS and Windows are run.
+"""
+
+import functools
+import os
+import re
+import struct
+from typing import BinaryIO
+
+from cli_tool_audit.providers.base import VersionProvider
+
+__all__ = ["GoBuildInfoProvider", "main_module_version", "read_build_info"]
+
+ELF_MAGIC = b"\x7fELF"
+BUILDINFO_MAGIC = b"\xff Go buildinf:"
+BUILDINFO_HEADER_SIZE = 32
+BUILDINFO_SEARCH_BYTES = 64 * 1024
+"""Without section headers the blob is searched for in the start of the first writable segment, as Go does."""
+MAX_STRING_BYTES = 1024 * 1024
+
+_FLAG_BIG_ENDIAN = 1
+_FLAG_INLINE_STRINGS = 2
+"""Go 1.18 and later store the strings right after the header instead of pointing to them."""
+_PT_LOAD = 1
+_PF_W = 2
+_SENTINEL_SIZE = 16
+"""The module info is wrapped in 16 byte markers."""
+_UNRELEASED = re.compile(r"(^|[-.])\d{14}-[0-9a-f]{12}(\+incompatible)?$|\+dirty$")
+"""Pseudo-versions of untagged commits, and builds with uncommitted changes."""
+
+
+class _Elf:
+    """
+    Reads just enough of an ELF file to find data by section name or virtual address.
+    """
+
+    def __init__(self, file: BinaryIO) -> None:
+        """
+        Args:
+            file: The ELF file, opened in binary mode.
+
+        Raises:
+            ValueError: If the file is not an ELF file this reader understands.
+        """
+        self.file = file
+        ident = self._read(0, 16)
+        if len(ident) < 16 or ident[:4] != ELF_MAGIC or ident[4] not in (1, 2) or ident[5] not in (1, 2):
+            raise ValueError("not an ELF file")
+        self.is_64 = ident[4] == 2
+        self.endian = "<" if ident[5] == 1 else ">"
+        if self.is_64:
+            self.phoff, self.shoff = self._unpack(0x20, "QQ")
+            self.phentsize, self.phnum, self.shentsize, self.shnum, self.shstrndx = self._unpack(0x36, "HHHHH")
+        else:
+            self.phoff, self.shoff = self._unpack(0x1C, "II")
+            self.phentsize, self.phnum, self.shentsize, self.shnum, self.shstrndx = self._unpack(0x2A, "HHHHH")
+
+    def _read(self, offset: int, size: int) -> bytes:
+        self.file.seek(offset)
+        return self.file.read(size)
+
+    def _unpack(self, offset: int, layout: str) -> tuple:
+        fmt = self.endian + layout
+        data = self._read(offset, struct.calcsize(fmt))
+        if len(data) < struct.calcsize(fmt):
+            raise ValueError("truncated ELF file")
+        return struct.unpack(fmt, data)
+
+    def sections(self) -> dict[str, tuple[int, int]]:
+        """
+        The sections by name.
+
+        Returns:
+            dict[str, tuple[int, int]]: File offset and size by section name, empty if the file has no section headers.
+        """
+        if not self.shoff or not self.shnum or self.shstrndx >= self.shnum:
+            return {}
+        headers = []
+        for index in range(self.shnum):
+            base = self.shoff + index * self.shentsize
+            if self.is_64:
+                name, _type, _flags, _addr, offset, size = self._unpack(base, "IIQQQQ")
+            else:
+                name, _type, _flags, _addr, offset, size = self._unpack(base, "IIIIII")
+            headers.append((name, offset, size))
+        _name, names_offset, names_size = headers[self.shstrndx]
+        names = self._read(names_offset, min(names_size, MAX_STRING_BYTES))
+        result = {}
+        for name, offset, size in headers:
+            end = names.find(b"\0", name)
+            result[names[name:end].decode("ascii", errors="replace")] = (offset, size)
+        return result
+
+    def segments(self) -> list[tuple[int, int, int, int]]:
+        """
+        The loadable segments.
+
+        Returns:
+            list[tuple[int, int, int, int]]: Virtual address, file offset, size in the file and flags of each segment.
+        """
+        segments = []
+        for index in range(self.phnum):
+            base = self.phoff + index * self.phentsize
+            if self.is_64:
+                kind, flags, offset, vaddr, _paddr, filesz = self._unpack(base, "IIQQQQ")
+            else:
+                kind, offset, vaddr, _paddr, filesz, _memsz, flags = self._unpack(base, "IIIIIII")
+            if kind == _PT_LOAD:
+                segments.append((vaddr, offset, filesz, flags))
+        return segments
+
+    def read_address(self, address: int, size: int) -> bytes:
+        """
+        Read data by virtual address.
+
+        Args:
+            address (int): The virtual address.
+            size (int): How many bytes to read.
+
+        Returns:
+            bytes: The data.
+
+        Raises:
+            ValueError: If no segment holds the data.
+        """
+        for vaddr, offset, filesz, _flags in self.segments():
+            if vaddr <= address and address + size <= vaddr + filesz:
+                return self._read(offset + address - vaddr, size)
+        raise ValueError(f"address {address:#x} is not in the file")
+
+    def read_blob(self) -> bytes | None:
+        """
+        Find the start of the build info blob.
+
+        Returns:
+            Optional[bytes]: Up to BUILDINFO_SEARCH_BYTES from the magic on, or None if there is no build info.
+        """
+        section = self.sections().get(".go.buildinfo")
+        if section is not None:
+            data = self._read(section[0], min(section[1], BUILDINFO_SEARCH_BYTES))
+            return data if data.startswith(BUILDINFO_MAGIC) else None
+        writable = [segment for segment in self.segments() if segment[3] & _PF_W]
+        if not writable:
+            return None
+        _vaddr, offset, filesz, _flags = writable[0]
+        data = self._read(offset, min(filesz, BUILDINFO_SEARCH_BYTES))
+        position = data.find(BUILDINFO_MAGIC)
+        # The blob is 16 byte aligned.
+        while position != -1 and position % 16:
+            position = data.find(BUILDINFO_MAGIC, position + 1)
+        return data[position:] if position != -1 else None
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while position < len(data):
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, position
+        shift += 7
+    raise ValueError("truncated varint")
+
+
+def _strip_sentinels(modinfo: str) -> str:
+    if len(modinfo) >= 2 * _SENTINEL_SIZE + 1 and modinfo[-_SENTINEL_SIZE - 1] == "\n":
+        return modinfo[_SENTINEL_SIZE:-_SENTINEL_SIZE]
+    return modinfo
+
+
+@functools.lru_cache(maxsize=256)
+def _read_build_info(path: str, _mtime_ns: int, _size: int) -> tuple[str, str] | None:
+    """
+    Decode the build info of a Go binary.
+
+    Args:
+        path (str): The binary.
+        _mtime_ns (int): The mtime of path, used only as part of the cache key.
+        _size (int): The size of path, used only as part of the cache key.
+
+    Returns:
+        Optional[tuple[str, str]]: The Go toolchain version and the module info, or None if path is not a Go ELF binary.
+    """
+    try:
+        with open(path, "rb") as file:
+            elf = _Elf(file)
+            blob = elf.read_blob()
+            if blob is None or len(blob) < BUILDINFO_HEADER_SIZE:
+                return None
+            pointer_size = blob[14]
+            flags = blob[15]
+            if flags & _FLAG_INLINE_STRINGS:
+                strings = []
+                position = BUILDINFO_HEADER_SIZE
+                for _ in range(2):
+                    length, position = _read_varint(blob, position)
+                    strings.append(blob[position : position + length].decode("utf-8", errors="replace"))
+                    position += length
+                go_version, modinfo = strings
+            else:
+                if pointer_size not in (4, 8):
+                    return None
+                endian = ">" if flags & _FLAG_BIG_ENDIAN else "<"
+                pointer = endian + ("Q" if pointer_size == 8 else "I")
+
+                def read_string(header_address: int) -> str:
+                    data_address, length = struct.unpack(
+                        endian + ("QQ" if pointer_size == 8 else "II"), elf.read_address(header_address, 2 * pointer_size)
+                    )
+                    if length > MAX_STRING_BYTES:
+                        raise ValueError("string too long")
+                    return elf.read_address(data_address, length).decode("utf-8", errors="replace")
+
+                (version_address,) = struct.unpack_from(pointer, blob, 16)
+                (modinfo_address,) = struct.unpack_from(pointer, blob, 16 + pointer_size)
+                go_version = read_string(version_address)
+                modinfo = read_string(modinfo_address)
+    except (OSError, ValueError, struct.error):
+        return None
+    return go_version, _strip_sentinels(modinfo)
+
+
+def read_build_info(path: str) -> tuple[str, str] | None:
+    """
+    Decode the build info of a Go binary, cached until the file changes.
+
+    Args:
+        path (str): The binary.
+
+    Returns:
+        Optional[tuple[str, str]]: The Go toolchain version, e.g. go1.21.6, and the module info as printed by
+            `go version -m`, or None if path is not a Go ELF binary.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return _read_build_info(path, stat.st_mtime_ns, stat.st_size)
+
+
+def main_module_version(modinfo: str) -> str | None:
+    """
+    Find the version of the main module in Go module info.
+
+    Args:
+        modinfo (str): The module info.
+
+    Returns:
+        Optional[str]: The version without its leading v, or None if the binary was not built from a release.
+    """
+    for line in modinfo.splitlines():
+        fields = line.split("\t")
+        if len(fields) >= 3 and fields[0] == "mod":
+            version = fields[2]
+            if not version or version == "(devel)" or _UNRELEASED.search(version):
+                return None
+            return version.removeprefix("v")
+    return None
+
+
+class GoBuildInfoProvider(VersionProvider):
+    """
+    Answers for Go ELF binaries whose main module has a version.
+    """
+
+    name = "go-buildinfo"
+
+    def find_version(self, path: str, real_path: str) -> str | None:
+        """
+        Read the main module version from a Go binary's build info.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[str]: The version, or None if the executable is not a Go ELF binary or has no module version.
+        """
+        build_info = read_build_info(real_path)
+        if build_info is None:
+            return None
+        return main_module_version(build_info[1])
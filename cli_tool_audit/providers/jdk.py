@@ -0,0 +1,141 @@
+"""
+Versions of JDK tools, from the `release` file of the JDK they belong to.
+
+Every JDK tool starts a JVM to print its version, which costs from a few hundred milliseconds to
+seconds on small machines. Each JDK home has a `release` file with `JAVA_VERSION="17.0.6"`. One read
+of it answers java, javac, jar, jshell, keytool and the other tools in its bin directory. The parsed
+file is cached by its modified time.
+"""
+
+import functools
+import os
+from pathlib import Path
+
+from cli_tool_audit.providers.base import VersionProvider
+
+__all__ = ["JDK_TOOLS", "JdkProvider", "jdk_home_for", "read_release"]
+
+JDK_TOOLS = frozenset(
+    {
+        "jar",
+        "jarsigner",
+        "java",
+        "javac",
+        "javadoc",
+        "javap",
+        "jcmd",
+        "jconsole",
+        "jdb",
+        "jdeprscan",
+        "jdeps",
+        "jfr",
+        "jhsdb",
+        "jimage",
+        "jinfo",
+        "jlink",
+        "jmap",
+        "jmod",
+        "jpackage",
+        "jps",
+        "jrunscript",
+        "jshell",
+        "jstack",
+        "jstat",
+        "jstatd",
+        "keytool",
+        "rmiregistry",
+        "serialver",
+    }
+)
+"""Tools that report the version of the JDK. Others in the same directory, like GraalVM's, may have their own."""
+
+
+@functools.lru_cache(maxsize=32)
+def _read_release(release_path: str, _mtime_ns: int) -> dict[str, str]:
+    """
+    Parse a JDK release file.
+
+    Args:
+        release_path (str): The release file.
+        _mtime_ns (int): The mtime of release_path, used only as part of the cache key.
+
+    Returns:
+        dict[str, str]: The values by key, with quotes removed, empty if the file can't be read.
+    """
+    values = {}
+    try:
+        with open(release_path, encoding="utf-8", errors="replace") as file:
+            for line in file:
+                key, separator, value = line.partition("=")
+                if separator:
+                    values[key.strip()] = value.strip().strip('"')
+    except OSError:
+        return {}
+    return values
+
+
+def read_release(jdk_home: Path) -> dict[str, str]:
+    """
+    Read the release file of a JDK.
+
+    Args:
+        jdk_home (Path): The JDK home.
+
+    Returns:
+        dict[str, str]: The values by key, empty if there is no release file.
+    """
+    release_path = jdk_home / "release"
+    try:
+        mtime_ns = release_path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _read_release(str(release_path), mtime_ns)
+
+
+def jdk_home_for(real_path: str) -> Path | None:
+    """
+    Find the JDK home of a tool in a JDK's bin directory.
+
+    Args:
+        real_path (str): The tool with symlinks resolved.
+
+    Returns:
+        Optional[Path]: The directory with the release file. For JDK 8 tools in jre/bin that is the JDK home
+            above jre. None if there is no release file.
+    """
+    bin_dir = Path(real_path).parent
+    if bin_dir.name != "bin":
+        return None
+    home = bin_dir.parent
+    candidates = [home, home.parent] if home.name == "jre" else [home]
+    for candidate in candidates:
+        if (candidate / "release").is_file():
+            return candidate
+    return None
+
+
+class JdkProvider(VersionProvider):
+    """
+    Answers for the tools of a JDK, however they are linked onto the PATH.
+    """
+
+    name = "jdk"
+
+    def find_version(self, path: str, real_path: str) -> str | None:
+        """
+        Read the Java version of the JDK a tool belongs to.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[str]: JAVA_VERSION from the release file, or None if the executable is not a JDK tool.
+        """
+        name = os.path.basename(real_path).lower().removesuffix(".exe")
+        if name not in JDK_TOOLS:
+            return None
+        jdk_home = jdk_home_for(real_path)
+        if jdk_home is None:
+            return None
+        return read_release(jdk_home).get("JAVA_VERSION") or None
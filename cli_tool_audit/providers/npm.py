@@ -0,0 +1,71 @@
+"""
+Versions of npm package executables, from the package's package.json.
+
+`npm install -g` and project installs link each executable a package declares into a bin directory,
+`<prefix>/bin` or `node_modules/.bin`, pointing into `node_modules/<package>/`. Running one with
+`--version` starts Node. The package's `package.json` next to it records the version.
+
+Windows installs `.cmd` shims instead of symlinks, those are run as usual.
+"""
+
+import json
+import os
+
+import cli_tool_audit.fingerprint as fingerprint
+from cli_tool_audit.providers.base import VersionProvider
+
+__all__ = ["NpmProvider", "declared_bins"]
+
+
+def declared_bins(package: dict, package_dir: str) -> set[str]:
+    """
+    The executables a package.json declares, as real paths.
+
+    Args:
+        package (dict): The parsed package.json.
+        package_dir (str): The package directory.
+
+    Returns:
+        set[str]: The declared executables with symlinks resolved.
+    """
+    bins = package.get("bin")
+    if isinstance(bins, str):
+        bins = {"": bins}
+    if not isinstance(bins, dict):
+        return set()
+    return {
+        os.path.realpath(os.path.join(package_dir, target)) for target in bins.values() if isinstance(target, str)
+    }
+
+
+class NpmProvider(VersionProvider):
+    """
+    Answers for executables an npm package declares in the bin field of its package.json.
+    """
+
+    name = "npm"
+
+    def find_version(self, path: str, real_path: str) -> str | None:
+        """
+        Read the version of the npm package an executable belongs to.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[str]: The package version, or None if real_path is not an executable declared by the npm
+                package it is in.
+        """
+        package_dir = fingerprint.node_package_dir(real_path)
+        if package_dir is None:
+            return None
+        try:
+            with open(os.path.join(package_dir, "package.json"), encoding="utf-8") as file:
+                package = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(package, dict) or real_path not in declared_bins(package, package_dir):
+            return None
+        version = package.get("version")
+        return version if isinstance(version, str) and version else None
@@ -0,0 +1,123 @@
+"""
+Versions read from where a tool is installed, for package managers that put the version in the path.
+
+Several package managers install every version into its own directory and link the one in use onto
+the PATH, so the resolved path of the executable already says which version it is:
+
+- Homebrew and Linuxbrew: `<prefix>/Cellar/git/2.42.0/bin/git`, with an optional `_<revision>`
+- Nix: `/nix/store/<hash>-ripgrep-14.1.0/bin/rg`
+- asdf: `~/.asdf/installs/nodejs/20.11.0/bin/node`, and `~/.asdf/installs/golang/1.22.0/go/bin/go`
+- mise: `~/.local/share/mise/installs/python/3.12.1/bin/python3`
+- nvm: `~/.nvm/versions/node/v20.11.0/bin/node`
+
+A Cellar or Nix store directory holds one package, so every executable in its bin directory has the
+package's version. The directories of asdf, mise and nvm hold a language runtime, and the packages
+installed with that runtime's own package manager, such as pip or gem, land in the same bin
+directory. Those only answer for the runtime's own executable, whose name matches the tool.
+
+Answers name the manager, as `path-layout:homebrew` or `path-layout:nvm`.
+"""
+
+import logging
+import re
+
+from cli_tool_audit.providers.base import VersionProvider
+
+__all__ = ["PathLayoutProvider", "version_from_path"]
+
+logger = logging.getLogger(__name__)
+
+_PACKAGE_LAYOUTS = (
+    ("homebrew", re.compile(r"/Cellar/(?P<name>[^/]+)/(?P<version>\d[^/_]*)(?:_\d+)?/s?bin/(?P<exe>[^/]+)$")),
+    (
+        "nix",
+        re.compile(r"/nix/store/[0-9a-z]{32}-(?P<name>[^/]+?)-(?P<version>\d[^/-]*)(?:-bin)?/s?bin/(?P<exe>[^/]+)$"),
+    ),
+)
+"""One package per directory, every executable in it is answered."""
+
+_RUNTIME_LAYOUTS = (
+    # The golang plugins unpack the Go release archive, which keeps its go/ directory.
+    ("asdf", re.compile(r"/\.asdf/installs/(?P<name>[^/]+)/(?P<version>\d[^/]*)/(?:go/)?bin/(?P<exe>[^/]+)$")),
+    ("mise", re.compile(r"/mise/installs/(?P<name>[^/]+)/v?(?P<version>\d[^/]*)/(?:go/)?bin/(?P<exe>[^/]+)$")),
+    ("nvm", re.compile(r"/\.nvm/versions/(?P<name>node)/v(?P<version>\d[^/]*)/bin/(?P<exe>[^/]+)$")),
+)
+"""A runtime per directory, only the runtime's own executable is answered."""
+
+
+def _is_runtime_executable(name: str, executable: str) -> bool:
+    """
+    Check if an executable is the runtime a directory was installed for.
+
+    Args:
+        name (str): The name the manager installed the runtime as, e.g. nodejs or python.
+        executable (str): The file name of the executable.
+
+    Returns:
+        bool: True for node in nodejs, go in golang and python3.12 in python, False for pip or black.
+    """
+    stem = executable.lower().removesuffix(".exe").rstrip("0123456789.")
+    return len(stem) >= 2 and (stem == name or name.startswith(stem))
+
+
+def version_from_path(real_path: str) -> tuple[str, str] | None:
+    """
+    Read the version from the install layout of a path.
+
+    Args:
+        real_path (str): The executable with symlinks resolved.
+
+    Returns:
+        Optional[tuple[str, str]]: The package manager and the version, or None if the path is not in a known
+            layout or is not an executable the layout answers for.
+    """
+    normalized = real_path.replace("\\", "/")
+    for manager, pattern in _PACKAGE_LAYOUTS:
+        match = pattern.search(normalized)
+        if match:
+            return manager, match.group("version")
+    for manager, pattern in _RUNTIME_LAYOUTS:
+        match = pattern.search(normalized)
+        if match and _is_runtime_executable(match.group("name"), match.group("exe")):
+            return manager, match.group("version")
+    return None
+
+
+class PathLayoutProvider(VersionProvider):
+    """
+    Answers for executables installed by Homebrew, Nix, asdf, mise or nvm, from the version in their path.
+    """
+
+    name = "path-layout"
+
+    def find_version(self, path: str, real_path: str) -> str | None:
+        """
+        Read the version from the path an executable resolves to.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[str]: The version, or None if the path does not say.
+        """
+        found = version_from_path(real_path)
+        if found is None:
+            return None
+        manager, version = found
+        logger.debug(f"{path} is installed by {manager} at {real_path}")
+        return version
+
+    def describe(self, path: str, real_path: str) -> str:
+        """
+        Name the package manager that installed an executable.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            str: path-layout:<manager>, e.g. path-layout:homebrew.
+        """
+        found = version_from_path(real_path)
+        return f"{self.name}:{found[0]}" if found else self.name
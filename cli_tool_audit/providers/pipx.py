@@ -0,0 +1,146 @@
+"""
+Versions of pipx apps, from the pipx_metadata.json of the venv pipx installed them into.
+
+pipx installs each package into its own venv under `$PIPX_HOME/venvs/` and links or copies the apps
+into `$PIPX_BIN_DIR`. Next to each venv it records the package, its version and its apps in
+`pipx_metadata.json`, the same data `pipx list --json` prints. Reading it needs no subprocess,
+neither pipx nor the app is run.
+"""
+
+import functools
+import json
+import os
+import sys
+from pathlib import Path
+
+from cli_tool_audit.providers.base import VersionProvider
+
+__all__ = ["PipxProvider", "app_versions", "pipx_bin_dir", "pipx_homes"]
+
+METADATA_FILE = "pipx_metadata.json"
+
+
+def pipx_homes() -> list[Path]:
+    """
+    Where pipx keeps its venvs.
+
+    Returns:
+        list[Path]: PIPX_HOME if set, else the existing ones of the default locations of current and older pipx.
+    """
+    configured = os.environ.get("PIPX_HOME")
+    if configured:
+        return [Path(configured)]
+    home = Path.home()
+    data_home = Path(os.environ.get("XDG_DATA_HOME") or home / ".local" / "share")
+    candidates = [home / ".local" / "pipx", data_home / "pipx", home / "pipx"]
+    if sys.platform == "darwin":
+        candidates.append(home / "Library" / "Application Support" / "pipx")
+    return [candidate for candidate in candidates if candidate.is_dir()]
+
+
+def pipx_bin_dir() -> Path:
+    """
+    Where pipx puts the apps.
+
+    Returns:
+        Path: PIPX_BIN_DIR, defaults to ~/.local/bin.
+    """
+    return Path(os.environ.get("PIPX_BIN_DIR") or Path.home() / ".local" / "bin")
+
+
+@functools.lru_cache(maxsize=256)
+def _read_app_versions(metadata_path: str, _mtime_ns: int) -> dict[str, str]:
+    """
+    Read the apps of one pipx venv and the versions of the packages that provide them.
+
+    The mtime of the metadata file is part of the cache key, so upgrading or injecting reads it again.
+
+    Args:
+        metadata_path (str): The venv's pipx_metadata.json.
+        _mtime_ns (int): The mtime of metadata_path, used only as part of the cache key.
+
+    Returns:
+        dict[str, str]: The version by app name, empty if the file can't be read.
+    """
+    try:
+        with open(metadata_path, encoding="utf-8") as file:
+            metadata = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(metadata, dict):
+        return {}
+    packages = [metadata.get("main_package")]
+    injected = metadata.get("injected_packages")
+    if isinstance(injected, dict):
+        packages.extend(injected.values())
+    versions: dict[str, str] = {}
+    for package in packages:
+        if not isinstance(package, dict) or not isinstance(package.get("package_version"), str):
+            continue
+        # Apps of dependencies are left out, pipx does not record the versions of dependencies.
+        for app in package.get("apps") or []:
+            if isinstance(app, str):
+                versions.setdefault(app, package["package_version"])
+    return versions
+
+
+def app_versions(venv_dir: Path) -> dict[str, str]:
+    """
+    The apps pipx installed from one venv and their versions.
+
+    Args:
+        venv_dir (Path): The venv, a directory in $PIPX_HOME/venvs.
+
+    Returns:
+        dict[str, str]: The version by app name, empty if venv_dir is not a pipx venv.
+    """
+    metadata_path = venv_dir / METADATA_FILE
+    try:
+        mtime_ns = metadata_path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _read_app_versions(str(metadata_path), mtime_ns)
+
+
+def _lookup(versions: dict[str, str], name: str) -> str | None:
+    if name in versions:
+        return versions[name]
+    # The metadata names Windows apps with their suffix.
+    return versions.get(f"{name}.exe") or versions.get(name.removesuffix(".exe"))
+
+
+class PipxProvider(VersionProvider):
+    """
+    Answers for apps pipx installed, linked into PIPX_BIN_DIR or, on Windows, copied there.
+    """
+
+    name = "pipx"
+
+    def find_version(self, path: str, real_path: str) -> str | None:
+        """
+        Read the version of the package a pipx app comes from.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[str]: The package version, or None if the executable is not a pipx app.
+        """
+        resolved = Path(real_path)
+        venv_dir = resolved.parent.parent
+        if resolved.parent.name in ("bin", "Scripts") and venv_dir.parent.name == "venvs":
+            return _lookup(app_versions(venv_dir), resolved.name)
+        if sys.platform != "win32" or Path(path).parent.resolve() != pipx_bin_dir().resolve():
+            return None
+        # On Windows apps are copied and can't be followed to their venv, look for the app in every venv.
+        for home in pipx_homes():
+            try:
+                venv_dirs = sorted((home / "venvs").iterdir())
+            except OSError:
+                continue
+            for candidate in venv_dirs:
+                version = _lookup(app_versions(candidate), Path(path).name)
+                if version:
+                    return version
+        return None
@@ -0,0 +1,66 @@
+"""
+Versions of Python console scripts, from the METADATA of the package that declares them.
+
+A console script is a small launcher whose shebang names the environment's Python. Running it with
+`--version` starts that interpreter and imports the package, which takes hundreds of milliseconds
+for some tools. The package that declares the script in its `entry_points.txt` records its version
+in the `Version:` header of its dist-info `METADATA`.
+"""
+
+import os
+
+import cli_tool_audit.fingerprint as fingerprint
+from cli_tool_audit.providers.base import VersionProvider
+
+__all__ = ["PythonMetadataProvider", "read_metadata_version"]
+
+
+def read_metadata_version(metadata_path: str) -> str | None:
+    """
+    Read the Version header of a dist-info METADATA file.
+
+    Args:
+        metadata_path (str): The METADATA file.
+
+    Returns:
+        Optional[str]: The version, or None if the file can't be read or has no Version header.
+    """
+    try:
+        with open(metadata_path, encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    # Headers end at the first blank line, the rest is the description.
+                    return None
+                if line.startswith("Version:"):
+                    return line.removeprefix("Version:").strip() or None
+    except (OSError, UnicodeDecodeError):
+        return None
+    return None
+
+
+class PythonMetadataProvider(VersionProvider):
+    """
+    Answers for console scripts declared by exactly one package in their environment.
+    """
+
+    name = "python-metadata"
+
+    def find_version(self, path: str, real_path: str) -> str | None:
+        """
+        Read the version of the package that declares a console script.
+
+        Args:
+            path (str): The executable as found on the PATH.
+            real_path (str): The executable with symlinks resolved.
+
+        Returns:
+            Optional[str]: The package version, or None if real_path is not a console script of a Python environment,
+                or more than one package declares it.
+        """
+        interpreter = fingerprint.read_shebang_interpreter(real_path)
+        if not interpreter or not os.path.basename(interpreter).lower().startswith(("python", "pypy")):
+            return None
+        dist_infos = fingerprint.console_script_dist_infos(real_path)
+        if len(dist_infos) != 1:
+            return None
+        return read_metadata_version(os.path.join(dist_infos[0], "METADATA"))
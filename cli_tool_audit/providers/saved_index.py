@@ -0,0 +1,69 @@
+"""
+Indexes that providers build from package manager databases, saved in the cache root between runs.
+
+Reading a whole package database can cost as much as running the tool the provider saves. The index
+is saved with a key describing what it was built from, such as the mtime of the database, and is
+used by the next run only if the key still matches. Like the PATH index, it is saved only if the
+project has a result cache, so providers never create cache directories.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import cli_tool_audit.path_index as path_index
+
+__all__ = ["index_file", "load_or_build"]
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+
+def index_file(name: str) -> Path:
+    """
+    Where an index is saved.
+
+    Args:
+        name (str): The file name.
+
+    Returns:
+        Path: The file in the cache root of the working directory.
+    """
+    return Path.cwd() / path_index.CACHE_ROOT_NAME / name
+
+
+def load_or_build(
+    saved_path: Path, key: dict[str, Any], build: Callable[[], dict[str, list[str]]]
+) -> dict[str, list[str]]:
+    """
+    Load a saved index if it was built for the same key, else build and save it.
+
+    Args:
+        saved_path (Path): Where the index is saved.
+        key (dict[str, Any]): What the index is built from, JSON serializable.
+        build (Callable[[], dict[str, list[str]]]): Builds the index.
+
+    Returns:
+        dict[str, list[str]]: The index.
+    """
+    try:
+        saved = json.loads(saved_path.read_text(encoding="utf-8"))
+        if saved.get("version") == INDEX_VERSION and saved.get("key") == key:
+            return saved["index"]
+    except (OSError, ValueError, TypeError, KeyError, AttributeError) as error:
+        logger.debug(f"Ignoring saved index {saved_path}: {error}")
+    index = build()
+    if saved_path.parent.is_dir():
+        try:
+            handle, temp_name = tempfile.mkstemp(dir=saved_path.parent, suffix=".tmp")
+            with open(handle, "w", encoding="utf-8") as file:
+                json.dump({"version": INDEX_VERSION, "key": key, "index": index}, file, separators=(",", ":"))
+            os.replace(temp_name, saved_path)
+        except OSError as error:
+            logger.debug(f"Failed to save index {saved_path}: {error}")
+    return index
@@ -0,0 +1,183 @@
+"""
+Resident audit server behind `cli_tool_audit serve`.
+
+A one-off audit pays for Python startup and imports before it checks anything. The server pays
+once and keeps the parsed config, the PATH index and the results in memory. Each of those is
+validated on every request against the config file's stat, the PATH directory mtimes and the
+executable fingerprints. Changes are picked up without restarting and unchanged tools are never run
+again.
+
+The protocol is one JSON object per line over a Unix domain socket, one request per connection:
+
+- `{"command": "audit", "config": "/abs/path/pyproject.toml", "tags": ["build"], "path": str, "cwd": str}`
+  answers `{"ok": true, "failed": bool, "problems": [{"tool", "status"}], "results": [...]}`
+- `{"command": "ping"}` answers `{"ok": true, "pid": int, "version": str}`
+- `{"command": "shutdown"}` answers `{"ok": true}` and stops the server
+
+Errors are answered as `{"ok": false, "error": str}`.
+
+The server audits with its own PATH, environment and working directory, so an audit request carries the
+client's PATH and working directory and is refused if either differs from the server's.
+"""
+
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any
+
+import cli_tool_audit.client as client
+import cli_tool_audit.config_reader as config_reader
+import cli_tool_audit.json_utils as json_utils
+import cli_tool_audit.policy as policy
+import cli_tool_audit.views as views
+from cli_tool_audit.__about__ import __version__
+
+__all__ = ["AuditServer", "audit", "environment_mismatch", "serve"]
+
+logger = logging.getLogger(__name__)
+
+MAX_REQUEST_BYTES = 64 * 1024
+
+
+def audit(config_path: Path, tags: list[str] | None = None) -> dict[str, Any]:
+    """
+    Audit the tools in a config file, answering from memory where nothing changed.
+
+    Args:
+        config_path (Path): The config file.
+        tags (Optional[list[str]], optional): Only check tools with these tags. Defaults to None.
+
+    Returns:
+        dict[str, Any]: The answer to an audit request.
+    """
+    cli_tools = config_reader.read_config(config_path)
+    results = views.process_tools(cli_tools, tags=tags or [], disable_progress_bar=True, force_cache=True)
+    results.sort(key=lambda result: result.tool)
+    return {
+        "ok": True,
+        "failed": policy.apply_policy(results),
+        "problems": [{"tool": result.tool, "status": result.status()} for result in results if result.is_problem()],
+        "results": [result.__dict__ for result in results],
+    }
+
+
+def environment_mismatch(message: dict[str, Any]) -> str | None:
+    """
+    Check that an audit would find the same tools for the client as for the server.
+
+    Args:
+        message (dict[str, Any]): The audit request, with the client's PATH and working directory.
+
+    Returns:
+        Optional[str]: Why the server can't audit for the client, or None if it can.
+    """
+    if message.get("path") != os.environ.get("PATH", ""):
+        return "The client's PATH differs from the server's, restart the server from the client's shell."
+    cwd = message.get("cwd")
+    if not isinstance(cwd, str) or Path(cwd).resolve() != Path.cwd().resolve():
+        return f"The client runs in {cwd}, the server in {Path.cwd()}, start a server in the client's directory."
+    return None
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers one JSON request per connection."""
+
+    server: "AuditServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        # pylint: disable=broad-exception-caught
+        try:
+            answer = self.server.answer(json.loads(line))
+        except Exception as error:
+            logger.exception("Failed to answer request")
+            answer = {"ok": False, "error": str(error)}
+        self.wfile.write(json.dumps(answer, default=json_utils.custom_json_serializer).encode("utf-8") + b"\n")
+
+
+class AuditServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Answers audit requests on a Unix domain socket, one thread per connection.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path (Path): The socket to listen on. Only the current user can connect.
+        """
+        self.path = path
+        # bind creates the socket with the umask's mode, restrict it before there is a socket to connect to.
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(path), _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def answer(self, message: dict[str, Any]) -> dict[str, Any]:
+        """
+        Answer one request.
+
+        Args:
+            message (dict[str, Any]): The request.
+
+        Returns:
+            dict[str, Any]: The answer.
+        """
+        command = message.get("command")
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid(), "version": __version__}
+        if command == "shutdown":
+            # shutdown waits for serve_forever to return, which waits for this handler.
+            threading.Thread(target=self.shutdown).start()
+            return {"ok": True}
+        if command == "audit":
+            mismatch = environment_mismatch(message)
+            if mismatch:
+                return {"ok": False, "error": mismatch}
+            return audit(Path(message.get("config") or "pyproject.toml"), message.get("tags"))
+        return {"ok": False, "error": f"Unknown command {command!r}"}
+
+
+def serve(path: Path | None = None) -> int:
+    """
+    Answer audit requests until stopped by a shutdown request, Ctrl+C or SIGTERM.
+
+    Args:
+        path (Optional[Path], optional): The socket. Defaults to client.socket_path().
+
+    Returns:
+        int: The exit code, 1 if the server could not start.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: serve needs Unix domain sockets, which this platform does not support.")
+        return 1
+    path = path or client.socket_path()
+    if path.exists():
+        try:
+            client.request({"command": "ping"}, path, timeout=5)
+            print(f"Error: a server is already running at {path}")
+            return 1
+        except (client.ServerUnavailable, OSError, ValueError):
+            logger.debug(f"Removing stale socket {path}")
+            path.unlink()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    server = AuditServer(path)
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda _signum, _frame: threading.Thread(target=server.shutdown).start())
+    print(f"Serving audits on {path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+    return 0
@@ -0,0 +1,139 @@
+"""
+Find every copy of a tool on the PATH and check each one.
+
+An audit only checks the executable that runs, the first match on the PATH. When a version manager,
+a virtualenv or an old system package puts another copy earlier on the PATH, the audit fails even
+though a good copy is installed. Checking every copy shows which one is in the way.
+"""
+
+import concurrent.futures
+import dataclasses
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import cli_tool_audit.audit_manager as audit_manager
+import cli_tool_audit.models as models
+import cli_tool_audit.path_index as path_index
+
+__all__ = ["ShadowReport", "ToolInstance", "audit_all_instances"]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class ToolInstance:
+    """
+    One executable on the PATH for a tool name.
+    """
+
+    path: str
+    real_path: str
+    position: int
+    """1 for the copy that runs, counting up in PATH order."""
+    result: models.ToolCheckResult
+    duplicate_of: int | None = None
+    """Position of an earlier copy that is the same file, which was checked instead of this one."""
+
+
+@dataclasses.dataclass
+class ShadowReport:
+    """
+    Every copy of one tool on the PATH, in PATH order.
+    """
+
+    tool: str
+    instances: list[ToolInstance]
+    result: models.ToolCheckResult
+    """Result for the copy that runs, or for the tool name if there is no copy on the PATH."""
+
+    def passing_instances(self) -> list[ToolInstance]:
+        """
+        Copies after the first that would pass policy.
+
+        Returns:
+            list[ToolInstance]: The passing copies that are different files from the one that runs.
+        """
+        return [
+            instance
+            for instance in self.instances[1:]
+            if instance.duplicate_of is None and not instance.result.is_problem()
+        ]
+
+    def is_shadowed(self) -> bool:
+        """
+        Does the copy that runs fail while a later copy would pass?
+
+        Returns:
+            bool: True if moving a later copy to the front of the PATH would fix the tool.
+        """
+        return self.result.is_problem() and bool(self.passing_instances())
+
+
+def _check_instance(config: models.CliToolConfig, path: str) -> models.ToolCheckResult:
+    """
+    Check one copy of a tool by running it by its full path.
+
+    Args:
+        config (models.CliToolConfig): The tool's config.
+        path (str): The copy to run.
+
+    Returns:
+        models.ToolCheckResult: The result, reported under the tool's name.
+    """
+    result = audit_manager.AuditManager().call_and_check(dataclasses.replace(config, name=path))
+    return dataclasses.replace(result, tool=config.name, tool_config=config)
+
+
+def audit_all_instances(cli_tools: dict[str, models.CliToolConfig]) -> list[ShadowReport]:
+    """
+    Check every copy of every tool on the PATH.
+
+    The PATH is searched once per tool from the PATH index. Copies that are the same file, such as
+    two symlinks to one binary, are checked once. All distinct copies of all tools are checked
+    concurrently and results are not cached, since the cache only describes the copy that runs.
+
+    Args:
+        cli_tools (dict[str, models.CliToolConfig]): The tools to check.
+
+    Returns:
+        list[ShadowReport]: One report per tool, in the order of cli_tools.
+    """
+    all_paths: dict[str, list[tuple[str, str]]] = {}
+    for tool, config in cli_tools.items():
+        all_paths[tool] = [(path, os.path.realpath(path)) for path, _stat in path_index.lookup_all(config.name)]
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures: dict[tuple[str, str], concurrent.futures.Future[models.ToolCheckResult]] = {}
+        missing: dict[str, concurrent.futures.Future[models.ToolCheckResult]] = {}
+        for tool, config in cli_tools.items():
+            if not all_paths[tool] or (config.if_os and not sys.platform.startswith(config.if_os)):
+                # Checked by name so a missing tool or another OS gets the usual result.
+                missing[tool] = executor.submit(audit_manager.AuditManager().call_and_check, config)
+                continue
+            for path, real_path in all_paths[tool]:
+                if (tool, real_path) not in futures:
+                    futures[(tool, real_path)] = executor.submit(_check_instance, config, path)
+
+        reports = []
+        for tool in cli_tools:
+            if tool in missing:
+                reports.append(ShadowReport(tool=tool, instances=[], result=missing[tool].result()))
+                continue
+            instances: list[ToolInstance] = []
+            first_position: dict[str, int] = {}
+            for position, (path, real_path) in enumerate(all_paths[tool], start=1):
+                instances.append(
+                    ToolInstance(
+                        path=path,
+                        real_path=real_path,
+                        position=position,
+                        result=futures[(tool, real_path)].result(),
+                        duplicate_of=first_position.get(real_path),
+                    )
+                )
+                first_position.setdefault(real_path, position)
+            reports.append(ShadowReport(tool=tool, instances=instances, result=instances[0].result))
+    logger.debug(f"Checked {len(futures)} copies of {len(cli_tools)} tools")
+    return reports
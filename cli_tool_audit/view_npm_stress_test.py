@@ -1,7 +1,8 @@
 """
 This module contains a stress test for the cli_tool_audit module.
 
-It fetches all globally installed npm tools and runs them through the audit process.
+It fetches all globally installed npm tools and runs them through the audit process. Their versions
+come from each package's package.json, so Node is not started for every tool.
 """
 
 import concurrent
@@ -14,6 +15,7 @@ from threading import Lock
 from tqdm import tqdm
 
 import cli_tool_audit.call_and_compatible as call_and_compatible
+import cli_tool_audit.fingerprint as fingerprint
 import cli_tool_audit.models as models
 import cli_tool_audit.views as views
 
@@ -22,10 +24,10 @@ logger = logging.getLogger(__name__)
 
 def list_global_npm_executables() -> list[str]:
     """
-    List the executables in the global node_modules path.
+    List the executables that globally installed npm packages link into the global bin directory.
 
     Returns:
-        list[str]: A list of the executables in the global node_modules path.
+        list[str]: The names of the executables, for example tsc for the typescript package.
     """
     # Get the global node_modules path
     env = os.environ.copy()
@@ -35,16 +37,28 @@ def list_global_npm_executables() -> list[str]:
         cmd = "npm"
     try:
         out = subprocess.run(
-            [cmd, "root", "-g"], env=env, shell=True, capture_output=True, text=True, check=True
+            [cmd, "root", "-g"], env=env, shell=os.name == "nt", capture_output=True, text=True, check=True
         )  # nosec
-        node_modules_path = out.stdout.strip()
-
-        # List the executables in the bin directory
-        executables = os.listdir(node_modules_path)
-        return executables
-    except FileExistsError:
+    except (FileNotFoundError, subprocess.CalledProcessError):
         logger.error("npm not found on path")
         return []
+    node_modules_path = out.stdout.strip()
+    # <prefix>/lib/node_modules links into <prefix>/bin, on Windows <prefix>/node_modules into <prefix>.
+    if os.name == "nt":
+        bin_dir = os.path.dirname(node_modules_path)
+    else:
+        bin_dir = os.path.join(os.path.dirname(os.path.dirname(node_modules_path)), "bin")
+    try:
+        names = os.listdir(bin_dir)
+    except OSError:
+        logger.error(f"Can't list global npm bin directory {bin_dir}")
+        return []
+    if os.name == "nt":
+        return sorted(name[: -len(".cmd")] for name in names if name.endswith(".cmd"))
+    # Only links into node_modules, not node itself or other tools installed in the same prefix.
+    return sorted(
+        name for name in names if fingerprint.node_package_dir(os.path.realpath(os.path.join(bin_dir, name)))
+    )
 
 
 def report_for_npm_tools(max_count: int = -1) -> None:
@@ -68,7 +82,7 @@ def report_for_npm_tools(max_count: int = -1) -> None:
         config.version = ">=0.0.0"
         cli_tools[app_cmd] = config
         count += 1
-        if 0 < count >= max_count:
+        if count >= max_count > 0:
             break
 
     # Determine the number of available CPUs
@@ -9,29 +9,82 @@ import os
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from threading import Lock
-from typing import Union
-
-import colorama
-from prettytable import PrettyTable
-from prettytable.colortable import ColorTable, Themes
-from tqdm import tqdm
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Union
 
+import cli_tool_audit.audit_cache as audit_cache
 import cli_tool_audit.call_and_compatible as call_and_compatible
 import cli_tool_audit.config_reader as config_reader
 import cli_tool_audit.json_utils as json_utils
+import cli_tool_audit.lockfile as lockfile
 import cli_tool_audit.models as models
 import cli_tool_audit.policy as policy
+import cli_tool_audit.shadowing as shadowing
 
-colorama.init(convert=True)
+if TYPE_CHECKING:
+    from prettytable import PrettyTable
+    from prettytable.colortable import ColorTable
 
 logger = logging.getLogger(__name__)
 
+_COLORAMA_READY = False
+
+
+def _colorama() -> ModuleType:
+    """
+    Import colorama and initialize it on first use.
+
+    Only colored output needs it, so json, csv and quiet runs never pay for the import.
+
+    Returns:
+        ModuleType: The colorama module.
+    """
+    global _COLORAMA_READY  # pylint: disable=global-statement
+    import colorama  # pylint: disable=import-outside-toplevel
+
+    if not _COLORAMA_READY:
+        colorama.init(convert=True)
+        _COLORAMA_READY = True
+    return colorama
+
+
+def _new_table() -> Union["PrettyTable", "ColorTable"]:
+    """
+    Create an empty table, colored unless NO_COLOR or CI is set.
+
+    Returns:
+        Union[PrettyTable, ColorTable]: The table.
+    """
+    # Imported here, only table and html output need prettytable.
+    # pylint: disable=import-outside-toplevel
+    from prettytable import PrettyTable
+    from prettytable.colortable import ColorTable, Themes
+
+    if os.environ.get("NO_COLOR") or os.environ.get("CI"):
+        return PrettyTable()
+    _colorama()
+    return ColorTable(theme=Themes.OCEAN)
+
+
+class _NoProgressBar:
+    """Stands in for tqdm when the progress bar is hidden, so tqdm is only imported to show one."""
+
+    def __enter__(self) -> "_NoProgressBar":
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        return None
+
+    def update(self, _n: int = 1) -> None:
+        """Ignore progress."""
+
 
 def validate(
     file_path: Path = Path("pyproject.toml"),
     no_cache: bool = False,
     tags: list[str] | None = None,
     disable_progress_bar: bool = False,
+    force_cache: bool = False,
 ) -> list[models.ToolCheckResult]:
     """
     Validate the tools in the pyproject.toml file.
@@ -41,6 +94,8 @@ def validate(
         no_cache (bool, optional): If True, don't use the cache. Defaults to False.
         tags (Optional[list[str]], optional): Only check tools with these tags. Defaults to None.
         disable_progress_bar (bool, optional): If True, disable the progress bar. Defaults to False.
+        force_cache (bool, optional): Use the cache even for fewer than five tools, for long-lived callers that
+            keep results in memory. Defaults to False.
 
     Returns:
         list[models.ToolCheckResult]: A list of ToolCheckResult objects.
@@ -48,7 +103,7 @@ def validate(
     if tags is None:
         tags = []
     cli_tools = config_reader.read_config(file_path)
-    return process_tools(cli_tools, no_cache, tags, disable_progress_bar=disable_progress_bar)
+    return process_tools(cli_tools, no_cache, tags, disable_progress_bar=disable_progress_bar, force_cache=force_cache)
 
 
 def process_tools(
@@ -56,6 +111,9 @@ def process_tools(
     no_cache: bool = False,
     tags: list[str] | None = None,
     disable_progress_bar: bool = False,
+    stale_ok: bool = False,
+    cache_stats: audit_cache.CacheStats | None = None,
+    force_cache: bool = False,
 ) -> list[models.ToolCheckResult]:
     """
     Process the tools from a dictionary of CliToolConfig objects.
@@ -65,36 +123,51 @@ def process_tools(
         no_cache (bool, optional): If True, don't use the cache. Defaults to False.
         tags (Optional[list[str]], optional): Only check tools with these tags. Defaults to None.
         disable_progress_bar (bool, optional): If True, disable the progress bar. Defaults to False.
+        stale_ok (bool, optional): If True, answer from the cache even if expired and refresh expired entries
+            in a background process. Defaults to False.
+        cache_stats (Optional[audit_cache.CacheStats], optional): Collects cache hits and misses if the cache is
+            used. Defaults to None.
+        force_cache (bool, optional): Use the cache even for fewer than five tools, for long-lived callers that
+            keep results in memory. Defaults to False.
 
     Returns:
         list[models.ToolCheckResult]: A list of ToolCheckResult objects.
     """
     if tags:
         print(tags)
-        cli_tools = {
-            tool: config
-            for tool, config in cli_tools.items()
-            if config.tags and any(tag in config.tags for tag in tags)
-        }
+        cli_tools = filter_by_tags(cli_tools, tags)
 
     # Determine the number of available CPUs
     num_cpus = os.cpu_count()
 
-    enable_cache = len(cli_tools) >= 5
+    enable_cache = len(cli_tools) >= 5 or stale_ok or force_cache
     # Create a ThreadPoolExecutor with one thread per CPU
 
     if no_cache:
         enable_cache = False
+    if cache_stats is None:
+        cache_stats = audit_cache.CacheStats()
     lock = Lock()
     # Threaded appears faster.
     # lock = Dummy()
     # with ProcessPoolExecutor(max_workers=num_cpus) as executor:
     with ThreadPoolExecutor(max_workers=num_cpus) as executor:
-        disable = should_show_progress_bar(cli_tools)
-        with tqdm(total=len(cli_tools), disable=disable) as pbar:
+        disable = True if disable_progress_bar else should_show_progress_bar(cli_tools)
+        if disable:
+            pbar: Any = _NoProgressBar()
+        else:
+            from tqdm import tqdm  # pylint: disable=import-outside-toplevel
+
+            pbar = tqdm(total=len(cli_tools), disable=disable)
+        with pbar:
             # Submit tasks to the executor
             futures = [
-                executor.submit(call_and_compatible.check_tool_wrapper, (tool, config, lock, enable_cache))
+                executor.submit(
+                    call_and_compatible.check_tool_wrapper,
+                    (tool, config, lock, enable_cache),
+                    stale_ok=stale_ok,
+                    cache_stats=cache_stats,
+                )
                 for tool, config in cli_tools.items()
             ]
             results = []
@@ -102,9 +175,31 @@ def process_tools(
                 result = future.result()
                 pbar.update(1)
                 results.append(result)
+    if enable_cache:
+        facade = audit_cache.AuditFacade()
+        facade.record_run(cache_stats)
+        if stale_ok:
+            expired = [result.tool_config for result in results if audit_cache.AuditFacade.is_expired(result)]
+            facade.refresh_in_background(expired)
     return results
 
 
+def filter_by_tags(cli_tools: dict[str, models.CliToolConfig], tags: list[str]) -> dict[str, models.CliToolConfig]:
+    """
+    Keep the tools that have any of the tags.
+
+    Args:
+        cli_tools (dict[str, models.CliToolConfig]): A dictionary of tool names and CliToolConfig objects.
+        tags (list[str]): The tags to keep.
+
+    Returns:
+        dict[str, models.CliToolConfig]: The tools with at least one of the tags.
+    """
+    return {
+        tool: config for tool, config in cli_tools.items() if config.tags and any(tag in config.tags for tag in tags)
+    }
+
+
 def get_default_tools() -> dict[str, models.CliToolConfig]:
     """Get a default set of tools to check if none are configured."""
     return {
@@ -128,6 +223,10 @@ def report_from_pyproject_toml(
     only_errors: bool = False,
     quiet: bool = False,
     show_fix: bool = False,
+    stale_ok: bool = False,
+    all_instances: bool = False,
+    locked: bool = False,
+    verify_hash: bool = False,
 ) -> int:
     """
     Report on the compatibility of the tools in the pyproject.toml file.
@@ -142,6 +241,14 @@ def report_from_pyproject_toml(
         only_errors (bool, optional): Only show errors. Defaults to False.
         quiet (bool, optional): If True, suppress all output. Defaults to False.
         show_fix (bool, optional): If True, print install hints for failed tools. Defaults to False.
+        stale_ok (bool, optional): If True, answer from the cache even if expired, refresh in the background and
+            show how old each result is. Defaults to False.
+        all_instances (bool, optional): If True, check every copy of each tool on the PATH and report copies
+            that shadow a passing one. Defaults to False.
+        locked (bool, optional): If True, answer tools whose executable is unchanged since `cli_tool_audit lock`
+            from the lock file next to the config, and check only the others. Defaults to False.
+        verify_hash (bool, optional): With locked, also compare the content hash of each executable.
+            Defaults to False.
 
     Returns:
         int: The exit code.
@@ -151,8 +258,9 @@ def report_from_pyproject_toml(
     if not file_format:
         file_format = "table"
 
+    cache_stats = audit_cache.CacheStats()
     if config_as_dict:
-        results = process_tools(config_as_dict, no_cache, tags, disable_progress_bar=file_format != "table")
+        cli_tools = config_as_dict
     elif file_path:
         # Handle config file searching.
         if not file_path.exists():
@@ -162,10 +270,37 @@ def report_from_pyproject_toml(
         cli_tools = config_reader.read_config(file_path)
         if not cli_tools and file_format == "pretty":
             cli_tools = get_default_tools()
-        results = process_tools(cli_tools, no_cache, tags, disable_progress_bar=file_format != "table")
     else:
         raise TypeError("Must provide either file_path or config_as_dict.")
 
+    if all_instances:
+        if tags:
+            cli_tools = filter_by_tags(cli_tools, tags)
+        return report_all_instances(
+            shadowing.audit_all_instances(cli_tools),
+            exit_code_on_failure=exit_code_on_failure,
+            file_format=file_format,
+            quiet=quiet,
+        )
+    lock_check = None
+    if locked:
+        if tags:
+            cli_tools = filter_by_tags(cli_tools, tags)
+        lock_check = lockfile.verify(
+            cli_tools, lockfile.lock_path_for(None if config_as_dict else file_path), check_hash=verify_hash
+        )
+        cli_tools = lock_check.changed
+    results = process_tools(
+        cli_tools,
+        no_cache,
+        tags,
+        disable_progress_bar=file_format != "table",
+        stale_ok=stale_ok,
+        cache_stats=cache_stats,
+    )
+    if lock_check:
+        results = lock_check.results + results
+
     success_and_failure = len(results)
     # Remove success, no action needed.
     if only_errors:
@@ -188,12 +323,16 @@ def report_from_pyproject_toml(
             print("  </result>")
         print("</results>")
     elif file_format == "table":
-        table = pretty_print_results(results, truncate_long_versions=True, include_docs=False)
+        table = pretty_print_results(results, truncate_long_versions=True, include_docs=False, include_age=stale_ok)
         print(table)
         if not quiet:
             summary = summarize_failures(results)
             if summary:
                 print(summary)
+            if cache_stats.lookups:
+                print(cache_stats.summary())
+            if lock_check and lock_check.changed:
+                print(f"Checked again, changed since the lock file: {', '.join(sorted(lock_check.changed))}")
             if show_fix:
                 install_hints = get_install_hints(results)
                 if install_hints:
@@ -217,6 +356,7 @@ def report_from_pyproject_toml(
         pretty_print_results_pretty(results)
         if not quiet:
             no_color = bool(os.environ.get("NO_COLOR") or os.environ.get("CI"))
+            colorama = _colorama()
             red = "" if no_color else colorama.Fore.RED
             green = "" if no_color else colorama.Fore.GREEN
             reset = "" if no_color else colorama.Style.RESET_ALL
@@ -249,9 +389,30 @@ def report_from_pyproject_toml(
     return 0
 
 
+def format_age(seconds: float | None) -> str:
+    """
+    Format the age of a result for display.
+
+    Args:
+        seconds (Optional[float]): The age in seconds, None if unknown.
+
+    Returns:
+        str: The age in the largest whole unit, e.g. 45s, 3m, 2h, 5d.
+    """
+    if seconds is None:
+        return "?"
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    return f"{max(int(seconds), 0)}s"
+
+
 def pretty_print_results(
-    results: list[models.ToolCheckResult], truncate_long_versions: bool, include_docs: bool
-) -> Union[PrettyTable, ColorTable]:
+    results: list[models.ToolCheckResult],
+    truncate_long_versions: bool,
+    include_docs: bool,
+    include_age: bool = False,
+) -> Union["PrettyTable", "ColorTable"]:
     """
     Pretty print the results of the validation.
 
@@ -259,18 +420,24 @@ def pretty_print_results(
         results (list[models.ToolCheckResult]): A list of ToolCheckResult objects.
         truncate_long_versions (bool): If True, truncate long versions. Defaults to False.
         include_docs (bool): If True, include install command and install docs. Defaults to False.
+        include_age (bool): If True, include how long ago each tool was checked. Defaults to False.
 
     Returns:
         Union[PrettyTable, ColorTable]: A PrettyTable or ColorTable object.
     """
-    if os.environ.get("NO_COLOR") or os.environ.get("CI"):
-        table = PrettyTable()
-    else:
-        table = ColorTable(theme=Themes.OCEAN)
-    table.field_names = ["Tool", "Found", "Parsed", "Desired", "Status", "Modified"]
+    table = _new_table()
+    field_names = ["Tool", "Found", "Parsed", "Desired", "Status", "Modified"]
+    # Only on hosts where a package manager owns some of the tools.
+    include_package = any(result.package_name for result in results)
+    if include_package:
+        field_names.append("Package")
     if include_docs:
-        table.field_names.append("Install Command")
-        table.field_names.append("Install Docs")
+        field_names.append("Install Command")
+        field_names.append("Install Docs")
+    if include_age:
+        field_names.append("Age")
+    # Assign once, appending to table.field_names skips the setter and breaks column alignment.
+    table.field_names = field_names
 
     all_rows: list[list[str]] = []
 
@@ -293,12 +460,17 @@ def pretty_print_results(
             result.status() or "",
             last_modified,
         ]
+        if include_package:
+            row_data.append(f"{result.package_name} {result.package_version}" if result.package_name else "")
         if include_docs:
             row_data.append(result.tool_config.install_command or "")
             row_data.append(result.tool_config.install_docs or "")
+        if include_age:
+            row_data.append(format_age(result.age_seconds()))
         row_transformed = []
         for datum in row_data:
             if result.is_problem():
+                colorama = _colorama()
                 transformed = f"{colorama.Fore.RED}{datum}{colorama.Style.RESET_ALL}"
             else:
                 transformed = str(datum)
@@ -383,6 +555,7 @@ def detect_language() -> str:
 
 def get_logo(lang: str, no_color: bool) -> list[str]:
     """Get the ANSI logo for the detected language."""
+    colorama = _colorama()
     cyan = "" if no_color else colorama.Fore.CYAN
     yellow = "" if no_color else colorama.Fore.YELLOW
     blue = "" if no_color else colorama.Fore.BLUE
@@ -451,6 +624,7 @@ def pretty_print_results_pretty(results: list[models.ToolCheckResult]):
     logo = get_logo(lang, no_color)
     logo_width = 12
 
+    colorama = _colorama()
     bold = "" if no_color else colorama.Style.BRIGHT
     reset = "" if no_color else colorama.Style.RESET_ALL
     red = "" if no_color else colorama.Fore.RED
@@ -506,5 +680,96 @@ def pretty_print_results_pretty(results: list[models.ToolCheckResult]):
     print()
 
 
+def summarize_shadowing(reports: list[shadowing.ShadowReport]) -> str:
+    """
+    Describe tools whose copy that runs fails while a later copy on the PATH would pass.
+
+    Args:
+        reports (list[shadowing.ShadowReport]): The reports from shadowing.audit_all_instances.
+
+    Returns:
+        str: One line per shadowed tool, empty if no tool is shadowed.
+    """
+    lines = []
+    for report in reports:
+        if not report.is_shadowed():
+            continue
+        active = report.instances[0]
+        passing = ", ".join(instance.path for instance in report.passing_instances())
+        lines.append(f"{report.tool}: {active.path} ({active.result.status()}) shadows {passing}, which would pass")
+    return "\n".join(lines)
+
+
+def report_all_instances(
+    reports: list[shadowing.ShadowReport],
+    exit_code_on_failure: bool = True,
+    file_format: str = "table",
+    quiet: bool = False,
+) -> int:
+    """
+    Report every copy of each tool on the PATH and which ones shadow a passing copy.
+
+    Args:
+        reports (list[shadowing.ShadowReport]): The reports from shadowing.audit_all_instances.
+        exit_code_on_failure (bool, optional): If True, return 1 if the copy that runs fails for any tool.
+            Defaults to True.
+        file_format (str, optional): "table", "json" or "json-compact". Defaults to "table".
+        quiet (bool, optional): If True, suppress all output. Defaults to False.
+
+    Returns:
+        int: The exit code.
+    """
+    failed = policy.apply_policy([report.result for report in reports])
+    if file_format == "quiet" or quiet:
+        logger.debug("Quiet mode enabled, suppressing UI output.")
+    elif file_format in ("json", "json-compact"):
+        data = [
+            {
+                "tool": report.tool,
+                "shadowed": report.is_shadowed(),
+                "result": report.result.__dict__,
+                "instances": [instance.__dict__ for instance in report.instances],
+            }
+            for report in reports
+        ]
+        indent = 4 if file_format == "json" else None
+        print(json.dumps(data, indent=indent, default=json_utils.custom_json_serializer))
+    else:
+        if file_format != "table":
+            print(f"Format {file_format} is not supported with --all-instances, using table output.")
+        table = _new_table()
+        table.field_names = ["Tool", "#", "Path", "Found", "Status", "Note"]
+        for report in reports:
+            if not report.instances:
+                table.add_row([report.tool, "", "", "", report.result.status() or "", ""])
+                continue
+            for instance in report.instances:
+                result = instance.result
+                found = result.found_version[0:25].strip() if result.found_version else ""
+                if instance.duplicate_of is not None:
+                    note = f"same file as #{instance.duplicate_of}"
+                elif instance.position == 1:
+                    note = "runs"
+                elif report.is_shadowed() and not result.is_problem():
+                    note = "shadowed, would pass"
+                else:
+                    note = "shadowed"
+                row = [report.tool, str(instance.position), instance.path, found, result.status() or "", note]
+                if instance.position == 1 and result.is_problem():
+                    colorama = _colorama()
+                    row = [f"{colorama.Fore.RED}{datum}{colorama.Style.RESET_ALL}" for datum in row]
+                table.add_row(row)
+        print(table)
+        if not quiet:
+            summary = summarize_shadowing(reports)
+            if summary:
+                print(summary)
+    if failed and exit_code_on_failure and file_format == "table":
+        if not quiet:
+            print("Did not pass validation, failing with return value of 1.")
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
     report_from_pyproject_toml()
@@ -0,0 +1,168 @@
+"""
+Keep auditing while the environment changes, behind `audit --watch`.
+
+Each poll reads the config, stats the PATH directories and stats the executable each tool resolves to.
+A tool is fingerprinted again only when a PATH directory changed or its executable's stat did, so a
+quiet poll costs a few stat calls, reads no scripts and runs nothing. Only tools whose config or
+fingerprint changed are checked again, and only rows whose result changed are printed.
+"""
+
+import datetime
+import logging
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import cli_tool_audit.config_reader as config_reader
+import cli_tool_audit.fingerprint as fingerprint
+import cli_tool_audit.models as models
+import cli_tool_audit.path_index as path_index
+import cli_tool_audit.policy as policy
+import cli_tool_audit.views as views
+
+__all__ = ["Watcher", "watch"]
+
+logger = logging.getLogger(__name__)
+
+
+def _stat_key(tool_name: str) -> tuple[str, int, int, int] | None:
+    """
+    Identify the executable a tool name resolves to by its path and stat, without reading it.
+
+    Args:
+        tool_name (str): The name of the command.
+
+    Returns:
+        Optional[tuple[str, int, int, int]]: Path, inode, size and mtime, or None if the tool is not on the PATH.
+    """
+    found = path_index.lookup(tool_name)
+    if found is None:
+        return None
+    path, stat = found
+    return path, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _row_key(result: models.ToolCheckResult) -> tuple[str | None, str]:
+    return result.found_version, result.status()
+
+
+class Watcher:
+    """
+    Remembers the last config, fingerprints and results, and checks again only what changed.
+    """
+
+    def __init__(self, config_path: Path, tags: list[str] | None = None) -> None:
+        """
+        Args:
+            config_path (Path): The config file to watch.
+            tags (Optional[list[str]], optional): Only check tools with these tags. Defaults to None.
+        """
+        self.config_path = config_path
+        self.tags = tags or []
+        self.tools: dict[str, models.CliToolConfig] = {}
+        self.stats: dict[str, tuple[str, int, int, int] | None] = {}
+        self.fingerprints: dict[str, str] = {}
+        self.results: dict[str, models.ToolCheckResult] = {}
+
+    def _read_tools(self) -> dict[str, models.CliToolConfig]:
+        tools = config_reader.read_config(self.config_path)
+        return views.filter_by_tags(tools, self.tags) if self.tags else tools
+
+    def poll(self) -> tuple[list[models.ToolCheckResult], list[str]]:
+        """
+        Check the tools whose config or executable changed since the last poll.
+
+        Returns:
+            tuple[list[models.ToolCheckResult], list[str]]: Results that differ from the previous poll, and tools
+                removed from the config.
+        """
+        tools = self._read_tools()
+        removed = sorted(set(self.tools) - set(tools))
+        path_changed = path_index.get_index().revalidate()
+        stats = {tool: _stat_key(config.name) for tool, config in tools.items()}
+        fingerprints = {
+            tool: (
+                self.fingerprints[tool]
+                if not path_changed and tool in self.fingerprints and self.stats.get(tool) == stats[tool]
+                else fingerprint.get_executable_fingerprint(config.name)
+            )
+            for tool, config in tools.items()
+        }
+        affected = {
+            tool: config
+            for tool, config in tools.items()
+            if self.tools.get(tool) != config or self.fingerprints.get(tool) != fingerprints[tool]
+        }
+        self.tools = tools
+        self.stats = stats
+        self.fingerprints = fingerprints
+        for tool in removed:
+            self.results.pop(tool, None)
+        if not affected:
+            return [], removed
+
+        logger.debug(f"Checking again: {', '.join(sorted(affected))}")
+        changed = []
+        # Configs are handed over as copies, checking a tool fills in defaults on its config.
+        for result in views.process_tools(
+            {tool: config for tool, config in config_reader.read_config(self.config_path).items() if tool in affected},
+            disable_progress_bar=True,
+        ):
+            previous = self.results.get(result.tool)
+            self.results[result.tool] = result
+            if previous is None or _row_key(previous) != _row_key(result):
+                changed.append(result)
+        return changed, removed
+
+    def failed(self) -> bool:
+        """
+        Does the latest state fail policy?
+
+        Returns:
+            bool: True if any tool fails.
+        """
+        return policy.apply_policy(list(self.results.values()))
+
+
+def watch(
+    config_path: Path,
+    tags: list[str] | None = None,
+    interval: float = 2.0,
+    max_polls: int | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """
+    Print a full audit, then the rows that change, until interrupted.
+
+    Args:
+        config_path (Path): The config file.
+        tags (Optional[list[str]], optional): Only check tools with these tags. Defaults to None.
+        interval (float, optional): Seconds between polls. Defaults to 2.
+        max_polls (Optional[int], optional): Stop after this many polls, None to run until Ctrl+C. Defaults to None.
+        sleep (Callable[[float], None], optional): Waits between polls. Defaults to time.sleep.
+
+    Returns:
+        int: 1 if the last state fails policy, else 0.
+    """
+    watcher = Watcher(config_path, tags)
+    polls = 0
+    try:
+        while max_polls is None or polls < max_polls:
+            changed, removed = watcher.poll()
+            stamp = datetime.datetime.now().strftime("%H:%M:%S")
+            for tool in removed:
+                print(f"{stamp} {tool} removed from config")
+            if changed:
+                if polls:
+                    print(f"{stamp} changed:")
+                print(views.pretty_print_results(changed, truncate_long_versions=True, include_docs=False))
+            elif not polls:
+                print("No tools configured.")
+            if not polls:
+                print(f"Watching {config_path} and the PATH for changes every {interval:g}s, Ctrl+C to stop.")
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    return 1 if watcher.failed() else 0
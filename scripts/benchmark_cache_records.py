@@ -0,0 +1,82 @@
+"""
+Compare loading 1,000 cache entries in the indented JSON format used before cache records, and as records.
+
+Usage: python scripts/benchmark_cache_records.py [ENTRIES]
+"""
+
+import datetime
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from cli_tool_audit import cache_record
+from cli_tool_audit.audit_cache import custom_json_deserializer
+from cli_tool_audit.json_utils import custom_json_serializer
+from cli_tool_audit.models import CliToolConfig, SchemaType, ToolCheckResult
+
+
+def make_result(index: int) -> ToolCheckResult:
+    now = datetime.datetime.now()
+    return ToolCheckResult(
+        tool=f"tool{index}",
+        desired_version=">=1.0.0",
+        is_needed_for_os=True,
+        is_available=True,
+        is_snapshot=False,
+        found_version=f"tool{index} 1.{index}.0 (built 2026-01-01)",
+        parsed_version=f"1.{index}.0",
+        is_compatible="Compatible",
+        is_broken=False,
+        last_modified=now - datetime.timedelta(days=index % 90),
+        tool_config=CliToolConfig(name=f"tool{index}", version=">=1.0.0", schema=SchemaType.SEMVER),
+        checked_at=now,
+        check_duration=0.05,
+    )
+
+
+def decode_json(data: bytes) -> ToolCheckResult:
+    return ToolCheckResult(**json.loads(data, object_hook=custom_json_deserializer))
+
+
+def median_of(function, repeat: int = 7) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        json_files, record_files = [], []
+        for index in range(entries):
+            result = make_result(index)
+            json_file = root / f"tool{index}.json"
+            json_file.write_text(json.dumps(result.__dict__, indent=4, default=custom_json_serializer))
+            json_files.append(json_file)
+            record_file = root / f"tool{index}.rec"
+            record_file.write_bytes(cache_record.encode(result))
+            record_files.append(record_file)
+
+        for label, files, decode in (
+            ("json", json_files, decode_json),
+            ("record", record_files, cache_record.decode),
+        ):
+            contents = [path.read_bytes() for path in files]
+            load = median_of(lambda files=files, decode=decode: [decode(path.read_bytes()) for path in files])
+            decode_only = median_of(lambda contents=contents, decode=decode: [decode(data) for data in contents])
+            print(
+                f"{label:>6}: {sum(map(len, contents)) / entries:.0f} bytes/entry, "
+                f"load {load * 1000:.1f} ms, {load / entries * 1_000_000:.1f} us/entry "
+                f"(decode {decode_only / entries * 1_000_000:.1f} us/entry)"
+            )
+
+
+if __name__ == "__main__":
+    main()
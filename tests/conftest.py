@@ -0,0 +1,94 @@
+"""Fixtures shared by all tests."""
+
+import os
+import subprocess  # nosec
+import sys
+from pathlib import Path
+
+import pytest
+
+import cli_tool_audit.path_index as path_index
+
+
+@pytest.fixture(autouse=True)
+def isolated_run(tmp_path, monkeypatch):
+    """
+    Run each test in its own directory, so cache directories and saved indexes are not written into the
+    checkout, and without version providers, so no test reads the host's package databases.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CLI_TOOL_AUDIT_PROVIDERS", "none")
+
+
+@pytest.fixture
+def providers_enabled(monkeypatch):
+    """Opt in to every version provider, as if CLI_TOOL_AUDIT_PROVIDERS were unset."""
+    monkeypatch.delenv("CLI_TOOL_AUDIT_PROVIDERS", raising=False)
+
+
+@pytest.fixture
+def source_root():
+    """The checkout, for subprocesses that import cli_tool_audit from it rather than from an installed copy."""
+    return Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def fresh_path_index(monkeypatch):
+    """Forget the PATH index of earlier tests and revalidate it on every lookup, for tests that change the PATH."""
+    monkeypatch.setattr(path_index, "_INDEX", None)
+    monkeypatch.setattr(path_index, "REVALIDATE_SECONDS", 0.0)
+
+
+@pytest.fixture
+def provider_version():
+    """Ask one provider for the version of an executable, with the arguments providers.find_version gives it."""
+
+    def find(provider, path):
+        return provider.find_version(str(path), os.path.realpath(path))
+
+    return find
+
+
+@pytest.fixture
+def import_times(source_root):
+    """
+    Run Python from the checkout with -X importtime, returning the cumulative import time in microseconds of every
+    module it imported and the total of the top level imports.
+    """
+
+    def run(args: list[str], cwd: Path | None = None) -> tuple[dict[str, int], int]:
+        cwd = cwd or Path.cwd()
+        path = os.pathsep.join([str(cwd / "bin"), os.environ.get("PATH", "")])
+        env = dict(os.environ, PYTHONPATH=str(source_root), PATH=path, CI="1")
+        completed = subprocess.run(  # nosec
+            [sys.executable, "-X", "importtime", *args], capture_output=True, text=True, check=False, cwd=cwd, env=env
+        )
+        assert completed.returncode == 0, completed.stderr[-2000:]
+        times = {}
+        total = 0
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _self, cumulative, name = line.removeprefix("import time:").split("|")
+            if not cumulative.strip().isdigit():
+                continue
+            times[name.strip()] = int(cumulative)
+            # Only top level lines, nested imports are included in their parent's cumulative time.
+            if not name.startswith("  "):
+                total += int(cumulative)
+        return times, total
+
+    return run
+
+
+@pytest.fixture
+def make_script():
+    """Write an executable file, creating its directory, for tests that put fake tools and interpreters on disk."""
+
+    def make(path: Path, text: str = "#!/bin/sh\n", mode: int = 0o755) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        path.chmod(mode)
+        return path
+
+    return make
@@ -1,11 +1,24 @@
 """Extended tests for cli_tool_audit.audit_cache module."""
 
 import datetime
+import io
+import json
+import threading
 from unittest.mock import patch
 
 import pytest
 
-from cli_tool_audit.audit_cache import AuditFacade, custom_json_deserializer
+import cli_tool_audit.call_and_compatible as call_and_compatible
+from cli_tool_audit.audit_cache import (
+    MEMORY_CACHE,
+    REFRESH_MARKER_NAME,
+    AuditFacade,
+    CacheStats,
+    MemoryCache,
+    custom_json_deserializer,
+    refresh_from_stdin,
+)
+from cli_tool_audit.json_utils import custom_json_serializer
 from cli_tool_audit.models import CliToolConfig, SchemaType, ToolCheckResult
 
 
@@ -96,6 +109,17 @@ class TestAuditFacade:
         filename = facade.get_cache_filename(config)
         assert config.cache_hash() in filename.name
 
+    def test_call_and_check_fingerprints_once(self, tmp_path):
+        from cli_tool_audit import fingerprint
+
+        facade = AuditFacade(cache_dir=tmp_path)
+        with patch.object(
+            fingerprint, "get_executable_fingerprint", wraps=fingerprint.get_executable_fingerprint
+        ) as mock_fingerprint, patch.object(facade.audit_manager, "call_and_check", return_value=_make_check_result()):
+            facade.call_and_check(_make_tool_config())
+        assert mock_fingerprint.call_count == 1
+        assert facade.read_from_cache(_make_tool_config()) is not None
+
     def test_cache_miss_returns_none(self, tmp_path):
         facade = AuditFacade(cache_dir=tmp_path)
         config = _make_tool_config("notcached")
@@ -113,18 +137,56 @@ class TestAuditFacade:
         assert result.tool == "mytool"
         assert facade.cache_hit is True
 
-    def test_problems_not_cached(self, tmp_path):
+    def test_problems_are_cached(self, tmp_path):
         facade = AuditFacade(cache_dir=tmp_path)
         config = _make_tool_config()
         # A problem result (unavailable)
         problem_result = _make_check_result(is_available=False, is_compatible=">=2.0.0 != 1.0.0")
 
-        with patch.object(facade.audit_manager, "call_and_check", return_value=problem_result):
+        with patch.object(facade.audit_manager, "call_and_check", return_value=problem_result) as mock_check:
             result = facade.call_and_check(config)
+            facade.call_and_check(config)
 
         assert result.is_available is False
-        # Should NOT be cached
+        mock_check.assert_called_once()
+        assert facade.cache_hit is True
+
+    def test_problems_expire_after_negative_ttl(self, tmp_path, monkeypatch):
+        import os
+
+        facade = AuditFacade(cache_dir=tmp_path)
+        config = _make_tool_config()
+        facade.write_to_cache(config, _make_check_result(is_available=False, is_compatible="Not Found"))
+        cache_file = facade.get_cache_filename(config)
+        written = cache_file.stat().st_mtime - 301
+        os.utime(cache_file, (written, written))
+
         assert facade.read_from_cache(config) is None
+        monkeypatch.setenv("CLI_TOOL_AUDIT_NEGATIVE_CACHE_TTL", "600")
+        assert facade.read_from_cache(config) is not None
+
+    def test_success_uses_its_own_ttl(self, tmp_path, monkeypatch):
+        import os
+
+        facade = AuditFacade(cache_dir=tmp_path)
+        config = _make_tool_config()
+        facade.write_to_cache(config, _make_check_result())
+        cache_file = facade.get_cache_filename(config)
+        written = cache_file.stat().st_mtime - 301
+        os.utime(cache_file, (written, written))
+
+        assert facade.read_from_cache(config) is not None
+        monkeypatch.setenv("CLI_TOOL_AUDIT_CACHE_TTL", "60")
+        assert facade.read_from_cache(config) is None
+
+    def test_entry_invalidated_when_executable_changes(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        config = _make_tool_config()
+        with patch("cli_tool_audit.fingerprint.get_executable_fingerprint", return_value="missing"):
+            facade.write_to_cache(config, _make_check_result(is_available=False, is_compatible="Not Found"))
+            assert facade.read_from_cache(config) is not None
+        with patch("cli_tool_audit.fingerprint.get_executable_fingerprint", return_value="/usr/bin/mytool|1|2"):
+            assert facade.read_from_cache(config) is None
 
     def test_good_results_are_cached(self, tmp_path):
         facade = AuditFacade(cache_dir=tmp_path)
@@ -162,15 +224,503 @@ class TestAuditFacade:
         facade.clear_old_cache_files()
         assert not stale.exists()
 
-    def test_corrupt_cache_file_raises_json_decode_error(self, tmp_path):
-        # BUG: read_from_cache catches TypeError (for bad keys) but not JSONDecodeError
-        # for corrupt/invalid JSON. A corrupt cache file raises instead of returning None.
-        import json
-
+    def test_corrupt_cache_file_is_a_miss(self, tmp_path):
         facade = AuditFacade(cache_dir=tmp_path)
         config = _make_tool_config()
         cache_file = facade.get_cache_filename(config)
         cache_file.write_text("not valid json {{{{", encoding="utf-8")
 
-        with pytest.raises(json.JSONDecodeError):
-            facade.read_from_cache(config)
+        assert facade.read_from_cache(config) is None
+        assert not cache_file.exists()
+
+    def test_cached_result_gets_callers_config(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        config = _make_tool_config()
+        config.install_command = "pipx install mytool"
+        result = _make_check_result()
+        result.tool_config = config
+        facade.write_to_cache(config, result)
+        assert facade.read_from_cache(config).tool_config.install_command == "pipx install mytool"
+
+    def test_legacy_json_entries_removed_by_gc(self, tmp_path):
+        legacy = tmp_path / "mytool_abc_def.json"
+        legacy.write_text("{}", encoding="utf-8")
+        AuditFacade(cache_dir=tmp_path).clear_old_cache_files()
+        assert not legacy.exists()
+
+
+# ---------------------------------------------------------------------------
+# Garbage collection
+# ---------------------------------------------------------------------------
+
+
+class TestGarbageCollection:
+    def test_gc_runs_once_per_interval(self, tmp_path):
+        with patch.object(AuditFacade, "clear_old_cache_files") as mock_clear:
+            AuditFacade(cache_dir=tmp_path)
+            AuditFacade(cache_dir=tmp_path)
+            AuditFacade(cache_dir=tmp_path)
+        mock_clear.assert_called_once()
+        assert (tmp_path / ".last_gc").exists()
+
+    def test_gc_runs_again_after_interval(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CLI_TOOL_AUDIT_CACHE_GC_INTERVAL", "0")
+        with patch.object(AuditFacade, "clear_old_cache_files") as mock_clear:
+            AuditFacade(cache_dir=tmp_path)
+            AuditFacade(cache_dir=tmp_path)
+        assert mock_clear.call_count == 2
+
+    def test_evicts_least_recently_used_over_entry_cap(self, tmp_path, monkeypatch):
+        import os
+
+        facade = AuditFacade(cache_dir=tmp_path)
+        for index, name in enumerate(["a", "b", "c"]):
+            cache_file = facade.get_cache_filename(_make_tool_config(name))
+            facade.write_to_cache(_make_tool_config(name), _make_check_result(name))
+            os.utime(cache_file, (1_000 + index, cache_file.stat().st_mtime))
+        # Reading "a" makes it the most recently used.
+        facade.read_from_cache(_make_tool_config("a"))
+
+        monkeypatch.setenv("CLI_TOOL_AUDIT_CACHE_MAX_ENTRIES", "2")
+        facade.clear_old_cache_files()
+
+        assert facade.get_cache_filename(_make_tool_config("a")).exists()
+        assert not facade.get_cache_filename(_make_tool_config("b")).exists()
+        assert facade.get_cache_filename(_make_tool_config("c")).exists()
+
+    def test_evicts_until_under_byte_cap(self, tmp_path, monkeypatch):
+        facade = AuditFacade(cache_dir=tmp_path)
+        for name in ["a", "b", "c"]:
+            facade.write_to_cache(_make_tool_config(name), _make_check_result(name))
+        one_entry = facade.get_cache_filename(_make_tool_config("a")).stat().st_size
+
+        monkeypatch.setenv("CLI_TOOL_AUDIT_CACHE_MAX_BYTES", str(one_entry + 10))
+        facade.clear_old_cache_files()
+
+        assert len(list(tmp_path.glob("*.rec"))) == 1
+
+    def test_read_updates_access_time_not_modified_time(self, tmp_path):
+        import os
+
+        facade = AuditFacade(cache_dir=tmp_path)
+        config = _make_tool_config()
+        facade.write_to_cache(config, _make_check_result())
+        cache_file = facade.get_cache_filename(config)
+        os.utime(cache_file, (1_000, 2_000))
+
+        facade.read_from_cache(config)
+
+        stat = cache_file.stat()
+        assert stat.st_mtime == 2_000
+        assert stat.st_atime > 2_000
+
+    def test_write_leaves_no_temp_files(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        facade.write_to_cache(_make_tool_config(), _make_check_result())
+        assert not list(tmp_path.glob("*.tmp"))
+
+    @pytest.mark.skipif(__import__("os").name == "nt", reason="process probing is POSIX only")
+    def test_removes_abandoned_pid_dirs(self, tmp_path, monkeypatch):
+        import os
+        import subprocess
+        import sys
+
+        monkeypatch.chdir(tmp_path)
+        finished = subprocess.Popen([sys.executable, "-c", "pass"])  # nosec
+        finished.wait()
+        cache_root = tmp_path / ".cli_tool_audit_cache"
+        dead_dir = cache_root / str(finished.pid)
+        own_dir = cache_root / str(os.getpid())
+        dead_dir.mkdir(parents=True)
+        own_dir.mkdir(parents=True)
+
+        facade = AuditFacade()
+        facade.clear_old_cache_files()
+
+        assert facade.cache_dir == cache_root / "shared"
+        assert not dead_dir.exists()
+        assert own_dir.exists()
+
+    def test_ignores_numeric_dirs_outside_cache_root(self, tmp_path):
+        numeric = tmp_path / "12345678"
+        numeric.mkdir()
+        facade = AuditFacade(cache_dir=tmp_path / "cache")
+        facade.clear_old_cache_files()
+        assert numeric.exists()
+
+
+# ---------------------------------------------------------------------------
+# Stale-while-revalidate
+# ---------------------------------------------------------------------------
+
+
+class TestStaleWhileRevalidate:
+    def test_expired_entry_served_only_when_stale_allowed(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        config = _make_tool_config()
+        old_result = _make_check_result()
+        old_result.checked_at = datetime.datetime.now() - datetime.timedelta(days=60)
+        facade.write_to_cache(config, old_result)
+
+        assert facade.read_from_cache(config) is None
+        stale = facade.read_from_cache(config, allow_stale=True)
+        assert stale is not None
+        assert stale.checked_at == old_result.checked_at
+        assert AuditFacade.is_expired(stale)
+
+    def test_call_and_check_with_stale_does_not_call_tool(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        config = _make_tool_config()
+        old_result = _make_check_result()
+        old_result.checked_at = datetime.datetime.now() - datetime.timedelta(days=60)
+        facade.write_to_cache(config, old_result)
+
+        with patch.object(facade.audit_manager, "call_and_check") as mock_check:
+            result = facade.call_and_check(config, allow_stale=True)
+        mock_check.assert_not_called()
+        assert result.tool == "mytool"
+
+    def test_unknown_age_is_expired(self):
+        assert AuditFacade.is_expired(_make_check_result())
+
+    def test_fresh_result_is_not_expired(self):
+        result = _make_check_result()
+        result.checked_at = datetime.datetime.now()
+        assert not AuditFacade.is_expired(result)
+
+    def test_refresh_overwrites_entries(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        config = _make_tool_config()
+        new_result = _make_check_result()
+        new_result.checked_at = datetime.datetime.now()
+        with patch.object(facade.audit_manager, "call_and_check", return_value=new_result):
+            facade.refresh([config])
+        assert facade.read_from_cache(config).checked_at == new_result.checked_at
+        assert not (tmp_path / ".refreshing").exists()
+
+    def test_refresh_in_background_sends_configs_to_child(self, tmp_path):
+        import json
+
+        facade = AuditFacade(cache_dir=tmp_path)
+        with patch("cli_tool_audit.audit_cache.subprocess.Popen") as mock_popen:
+            started = facade.refresh_in_background([_make_tool_config()])
+        assert started
+        payload = json.loads(mock_popen.return_value.stdin.write.call_args[0][0])
+        assert payload["cache_dir"] == str(tmp_path)
+        assert payload["tool_configs"][0]["tool_config"]["name"] == "mytool"
+        mock_popen.return_value.wait.assert_not_called()
+
+    def test_refresh_in_background_skipped_while_running(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        (tmp_path / ".refreshing").touch()
+        with patch("cli_tool_audit.audit_cache.subprocess.Popen") as mock_popen:
+            assert not facade.refresh_in_background([_make_tool_config()])
+        mock_popen.assert_not_called()
+
+    def test_refresh_in_background_nothing_to_do(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        with patch("cli_tool_audit.audit_cache.subprocess.Popen") as mock_popen:
+            assert not facade.refresh_in_background([])
+        mock_popen.assert_not_called()
+
+    def test_refresh_from_stdin(self, tmp_path, monkeypatch):
+        import io
+        import json
+
+        from cli_tool_audit import audit_cache
+        from cli_tool_audit.json_utils import custom_json_serializer
+
+        payload = json.dumps(
+            {"cache_dir": str(tmp_path), "tool_configs": [{"tool_config": _make_tool_config()}]},
+            default=custom_json_serializer,
+        )
+        monkeypatch.setattr("sys.stdin", io.StringIO(payload))
+        with patch.object(audit_cache.AuditFacade, "refresh") as mock_refresh:
+            audit_cache.refresh_from_stdin()
+        refreshed = mock_refresh.call_args[0][0]
+        assert refreshed[0] == _make_tool_config()
+
+
+class TestCacheMaintenance:
+    def test_stats_summary(self):
+        stats = CacheStats()
+        timed = _make_check_result()
+        timed.check_duration = 2.0
+        stats.record_hit(timed, stale=True)
+        stats.record_hit(timed, stale=False)
+        stats.record_miss(timed)
+        assert stats.lookups == 3
+        assert stats.summary() == "Cache: 2 hits (1 stale), 1 misses, 67% hit ratio, 4.0s saved"
+
+    def test_call_and_check_records_hits_and_misses(self, tmp_path):
+        stats = CacheStats()
+        facade = AuditFacade(cache_dir=tmp_path, stats=stats)
+        fresh = _make_check_result()
+        fresh.checked_at = datetime.datetime.now()
+        with patch.object(facade.audit_manager, "call_and_check", return_value=fresh):
+            facade.call_and_check(_make_tool_config())
+            facade.call_and_check(_make_tool_config())
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_record_run_keeps_recent_history(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        facade.record_run(CacheStats())
+        assert facade.read_history() == []
+        with patch("cli_tool_audit.audit_cache.HISTORY_LENGTH", 3):
+            for hits in range(5):
+                facade.record_run(CacheStats(hits=hits + 1))
+        assert [run["hits"] for run in facade.read_history()] == [3, 4, 5]
+        assert [run["hits"] for run in facade.read_history(last_runs=1)] == [5]
+
+    def test_clear(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        facade.write_to_cache(_make_tool_config("one"), _make_check_result("one"))
+        facade.write_to_cache(_make_tool_config("two"), _make_check_result("two"))
+        assert facade.clear() == 2
+        assert not list(tmp_path.glob("*.rec"))
+
+    def test_prune_removes_expired_changed_and_unreadable(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        fresh = _make_check_result("fresh")
+        fresh.checked_at = datetime.datetime.now()
+        facade.write_to_cache(fresh.tool_config, fresh)
+        facade.write_to_cache(_make_tool_config("old"), _make_check_result("old"))
+        changed = _make_check_result("changed")
+        changed.checked_at = datetime.datetime.now()
+        facade.write_to_cache(changed.tool_config, changed)
+        changed_file = facade.get_cache_filename(changed.tool_config)
+        changed_file.rename(changed_file.with_name(changed_file.name.replace(changed_file.stem[-32:], "0" * 32)))
+        (tmp_path / "garbage_x_y.rec").write_bytes(b"CTAR")
+
+        assert facade.prune() == 3
+        assert [result.tool for _, result in facade.iter_entries()] == ["fresh"]
+
+
+class TestBundle:
+    def _fresh(self, tool):
+        result = _make_check_result(tool)
+        result.checked_at = datetime.datetime.now()
+        return result
+
+    def test_round_trip(self, tmp_path):
+        source = AuditFacade(cache_dir=tmp_path / "source")
+        source.write_to_cache(_make_tool_config("one"), self._fresh("one"))
+        source.write_to_cache(_make_tool_config("old"), _make_check_result("old"))
+        bundle = tmp_path / "bundle.json.gz"
+        assert source.export_bundle(bundle) == 1
+
+        target = AuditFacade(cache_dir=tmp_path / "target")
+        assert target.import_bundle(bundle) == (1, 0)
+        assert target.read_from_cache(_make_tool_config("one")).tool == "one"
+
+    def test_import_skips_other_fingerprints(self, tmp_path):
+        source = AuditFacade(cache_dir=tmp_path / "source")
+        source.write_to_cache(_make_tool_config("one"), self._fresh("one"))
+        bundle = tmp_path / "bundle.json.gz"
+        source.export_bundle(bundle)
+
+        target = AuditFacade(cache_dir=tmp_path / "target")
+        with patch("cli_tool_audit.fingerprint.get_executable_fingerprint", return_value="/other|1|2"):
+            assert target.import_bundle(bundle) == (0, 1)
+        assert not list((tmp_path / "target").glob("*.rec"))
+
+    def test_import_keeps_newer_local_entry(self, tmp_path):
+        source = AuditFacade(cache_dir=tmp_path / "source")
+        older = self._fresh("one")
+        older.checked_at -= datetime.timedelta(hours=1)
+        source.write_to_cache(_make_tool_config("one"), older)
+        bundle = tmp_path / "bundle.json.gz"
+        source.export_bundle(bundle)
+
+        target = AuditFacade(cache_dir=tmp_path / "target")
+        newer = self._fresh("one")
+        target.write_to_cache(_make_tool_config("one"), newer)
+        assert target.import_bundle(bundle) == (0, 1)
+        assert target.read_from_cache(_make_tool_config("one")).checked_at == newer.checked_at
+
+    @pytest.mark.parametrize(
+        "key",
+        ["../one_" + "0" * 32, "one_" + "0" * 32 + "/../../escape", "/tmp/one_" + "0" * 32, "two_" + "0" * 32, "one"],
+    )
+    def test_import_rejects_unsafe_keys(self, tmp_path, key):
+        import base64
+        import gzip
+
+        from cli_tool_audit import audit_cache, cache_record, fingerprint
+
+        record = base64.b64encode(cache_record.encode(self._fresh("one"))).decode()
+        bundle = tmp_path / "bundle.json.gz"
+        with gzip.open(bundle, "wt", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "format": audit_cache.BUNDLE_FORMAT,
+                    "version": audit_cache.BUNDLE_VERSION,
+                    "entries": [{"key": key, "fingerprint": fingerprint.fingerprint_digest("one"), "record": record}],
+                },
+                file,
+            )
+        target = AuditFacade(cache_dir=tmp_path / "cache" / "target")
+        assert target.import_bundle(bundle) == (0, 1)
+        assert not list(tmp_path.rglob("*.rec"))
+
+    def test_import_skips_malformed_entries(self, tmp_path):
+        import base64
+        import gzip
+
+        from cli_tool_audit import audit_cache, cache_record, fingerprint
+
+        source = AuditFacade(cache_dir=tmp_path / "source")
+        source.write_to_cache(_make_tool_config("one"), self._fresh("one"))
+        bundle = tmp_path / "bundle.json.gz"
+        source.export_bundle(bundle)
+        with gzip.open(bundle, "rt", encoding="utf-8") as file:
+            (good,) = json.load(file)["entries"]
+        digest = fingerprint.fingerprint_digest("one")
+        truncated = base64.b64encode(cache_record.encode(self._fresh("one"))[:20]).decode()
+        entries = [
+            "not an object",
+            {"key": good["key"], "fingerprint": digest},
+            {"key": good["key"], "fingerprint": digest, "record": "not base64!"},
+            {"key": good["key"], "fingerprint": digest, "record": truncated},
+            {"key": None, "fingerprint": digest, "record": good["record"]},
+            good,
+        ]
+        with gzip.open(bundle, "wt", encoding="utf-8") as file:
+            json.dump(
+                {"format": audit_cache.BUNDLE_FORMAT, "version": audit_cache.BUNDLE_VERSION, "entries": entries}, file
+            )
+
+        target = AuditFacade(cache_dir=tmp_path / "target")
+        assert target.import_bundle(bundle) == (1, 5)
+        assert target.read_from_cache(_make_tool_config("one")).tool == "one"
+
+    @pytest.mark.parametrize(
+        "content", ['{"entries": []}', "[]", '{"format": "cli_tool_audit-cache-bundle", "version": 4, "entries": {}}']
+    )
+    def test_import_rejects_other_files(self, tmp_path, content):
+        import gzip
+
+        bundle = tmp_path / "bundle.json.gz"
+        with gzip.open(bundle, "wt", encoding="utf-8") as file:
+            file.write(content)
+        with pytest.raises(ValueError):
+            AuditFacade(cache_dir=tmp_path / "target").import_bundle(bundle)
+
+
+class TestMemoryCache:
+    def _fresh(self, tool="mytool"):
+        result = _make_check_result(tool)
+        result.checked_at = datetime.datetime.now()
+        return result
+
+    def test_repeat_audit_skips_disk(self, tmp_path):
+        config = _make_tool_config()
+        facade = AuditFacade(cache_dir=tmp_path)
+        with patch.object(facade.audit_manager, "call_and_check", return_value=self._fresh()):
+            facade.call_and_check(config)
+
+        again = AuditFacade(cache_dir=tmp_path)
+        with patch.object(again, "read_from_cache") as mock_read:
+            result = again.call_and_check(config)
+        mock_read.assert_not_called()
+        assert result.tool == "mytool"
+        assert again.cache_hit
+
+    def test_changed_executable_is_not_remembered(self, tmp_path):
+        memory = MemoryCache()
+        config = _make_tool_config()
+        memory.put(tmp_path, config, "/bin/mytool|1|1", self._fresh())
+        assert memory.get(tmp_path, config, "/bin/mytool|2|1") is None
+        assert len(memory) == 0
+
+    def test_least_recently_used_evicted(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CLI_TOOL_AUDIT_MEMORY_CACHE_SIZE", "2")
+        memory = MemoryCache()
+        for name in ("one", "two"):
+            memory.put(tmp_path, _make_tool_config(name), "fp", self._fresh(name))
+        memory.get(tmp_path, _make_tool_config("one"), "fp")
+        memory.put(tmp_path, _make_tool_config("three"), "fp", self._fresh("three"))
+        assert memory.get(tmp_path, _make_tool_config("two"), "fp") is None
+        assert memory.get(tmp_path, _make_tool_config("one"), "fp") is not None
+
+    def test_expired_result_checked_again(self, tmp_path):
+        config = _make_tool_config()
+        facade = AuditFacade(cache_dir=tmp_path)
+        old = _make_check_result()
+        old.checked_at = datetime.datetime.now() - datetime.timedelta(days=60)
+        with patch.object(facade.audit_manager, "call_and_check", return_value=old):
+            facade.call_and_check(config)
+        with patch.object(facade.audit_manager, "call_and_check", return_value=self._fresh()) as mock_check:
+            facade.call_and_check(config)
+            assert facade.call_and_check(config, allow_stale=True).checked_at is not None
+        mock_check.assert_called_once()
+
+    def test_clear_forgets_memory(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        with patch.object(facade.audit_manager, "call_and_check", return_value=self._fresh()):
+            facade.call_and_check(_make_tool_config())
+        facade.clear()
+        assert MEMORY_CACHE.get(tmp_path, _make_tool_config(), "anything") is None
+        assert facade.read_from_cache(_make_tool_config()) is None
+
+
+class TestWarm:
+    def _fresh(self, tool="mytool"):
+        result = _make_check_result(tool)
+        result.checked_at = datetime.datetime.now()
+        return result
+
+    def test_warm_fills_the_entries_an_audit_reads(self, tmp_path):
+        MEMORY_CACHE.clear()
+        with patch(
+            "cli_tool_audit.audit_manager.AuditManager.call_and_check", return_value=self._fresh()
+        ) as mock_check:
+            stats = AuditFacade(cache_dir=tmp_path).warm([_make_tool_config()])
+        assert (stats.hits, stats.misses) == (0, 1)
+        mock_check.assert_called_once()
+
+        MEMORY_CACHE.clear()
+        with patch("cli_tool_audit.audit_cache.AuditFacade", lambda stats: AuditFacade(tmp_path, stats)):
+            with patch("cli_tool_audit.audit_manager.AuditManager.call_and_check") as mock_audit:
+                result = call_and_compatible.check_tool_wrapper(
+                    ("mytool", _make_tool_config(), threading.Lock(), True)
+                )
+        mock_audit.assert_not_called()
+        assert result.tool == "mytool"
+
+    def test_warm_skips_cached_and_other_os(self, tmp_path):
+        facade = AuditFacade(cache_dir=tmp_path)
+        with patch("cli_tool_audit.audit_manager.AuditManager.call_and_check", return_value=self._fresh()):
+            facade.warm([_make_tool_config()])
+        other_os = CliToolConfig(name="other", if_os="not-this-os")
+        with patch("cli_tool_audit.audit_manager.AuditManager.call_and_check") as mock_check:
+            stats = AuditFacade(cache_dir=tmp_path).warm([_make_tool_config(), other_os])
+        mock_check.assert_not_called()
+        assert (stats.hits, stats.misses) == (1, 0)
+
+    def test_background_warm_request(self, tmp_path, monkeypatch):
+        request = json.dumps(
+            {"cache_dir": str(tmp_path), "warm": True, "tool_configs": [{"tool_config": _make_tool_config()}]},
+            default=custom_json_serializer,
+        )
+        monkeypatch.setattr("sys.stdin", io.StringIO(request))
+        with patch("cli_tool_audit.audit_cache.lower_priority") as mock_lower, patch(
+            "cli_tool_audit.audit_cache.AuditFacade.warm"
+        ) as mock_warm:
+            refresh_from_stdin()
+        mock_lower.assert_called_once()
+        assert mock_warm.call_args[0][0][0].name == "mytool"
+
+    def test_background_warm_removes_marker(self, tmp_path, monkeypatch):
+        (tmp_path / REFRESH_MARKER_NAME).touch()
+        request = json.dumps(
+            {"cache_dir": str(tmp_path), "warm": True, "tool_configs": [{"tool_config": _make_tool_config()}]},
+            default=custom_json_serializer,
+        )
+        monkeypatch.setattr("sys.stdin", io.StringIO(request))
+        with patch("cli_tool_audit.audit_cache.lower_priority"), patch(
+            "cli_tool_audit.audit_cache.AuditFacade.warm", side_effect=RuntimeError("boom")
+        ):
+            with pytest.raises(RuntimeError):
+                refresh_from_stdin()
+        assert not (tmp_path / REFRESH_MARKER_NAME).exists()
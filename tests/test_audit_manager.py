@@ -265,6 +265,7 @@ class TestAuditManagerCallTool:
     def test_timeout_exception(self, mock_run, _mock_modified):
         mock_run.side_effect = subprocess.TimeoutExpired(["tool", "--version"], 15)
         manager = AuditManager()
-        # TimeoutExpired is not caught — it will propagate
-        with pytest.raises(subprocess.TimeoutExpired):
-            manager.call_tool("tool", SchemaType.SEMVER)
+        result = manager.call_tool("tool", SchemaType.SEMVER)
+        assert result.is_available is True
+        assert result.is_broken is True
+        assert result.version is None
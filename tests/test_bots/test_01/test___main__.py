@@ -57,7 +57,7 @@ def test_handle_create_with_exceptions(mocker, exception, expected_message):
     mock_config_manager.create_tool_config.side_effect = exception
 
     # Mock the ConfigManager to use the mocked instance
-    with patch("cli_tool_audit.__main__.config_manager.ConfigManager", return_value=mock_config_manager):
+    with patch("cli_tool_audit.config_manager.ConfigManager", return_value=mock_config_manager):
         # Create an argparse Namespace that simulates command line arguments
         args = Namespace(tool="example_tool", config=str(Path("mock_config.toml")))
 
@@ -75,7 +75,7 @@ def test_handle_create_with_exceptions(mocker, exception, expected_message):
 @pytest.fixture
 def mock_config_manager():
     """Fixture to create a mocked ConfigManager."""
-    with patch("cli_tool_audit.__main__.config_manager.ConfigManager") as MockConfigManager:
+    with patch("cli_tool_audit.config_manager.ConfigManager") as MockConfigManager:
         # Create a mock instance of ConfigManager
         mock_instance = MockConfigManager.return_value
         yield mock_instance
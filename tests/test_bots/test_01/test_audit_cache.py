@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from cli_tool_audit import cache_record
 from cli_tool_audit.audit_cache import AuditFacade
 from cli_tool_audit.json_utils import custom_json_serializer
 from cli_tool_audit.models import CliToolConfig, ToolCheckResult
@@ -22,6 +23,22 @@ def audit_facade(tmp_path):
     return AuditFacade(cache_dir=tmp_path)
 
 
+def _result(status):
+    return ToolCheckResult(
+        tool="test_tool",
+        desired_version="1.0.0",
+        is_needed_for_os=True,
+        is_available=True,
+        is_snapshot=False,
+        found_version="1.0.0",
+        parsed_version="1.0.0",
+        is_compatible=status,
+        is_broken=False,
+        last_modified=None,
+        tool_config=CliToolConfig(name="test_tool"),
+    )
+
+
 @pytest.mark.parametrize(
     "cache_content, expected_result, expected_hit", [(None, None, False)]  # Test for non-existent file
 )
@@ -95,21 +112,15 @@ def test_read_from_cache_file_not_found(audit_facade, fake_tool_config):
 
 
 def test_happy_path_write_to_cache(audit_facade, fake_tool_config):
-    # Create a mock result to write to the cache
-    mock_result = MagicMock(spec=ToolCheckResult)
-    mock_result.__dict__ = {"status": "success"}
-
     # Write to cache
-    audit_facade.write_to_cache(fake_tool_config, mock_result)
+    audit_facade.write_to_cache(fake_tool_config, _result("success"))
 
     # Check that the cache file was created
     cache_filename = audit_facade.get_cache_filename(fake_tool_config)
     assert cache_filename.exists()
 
     # Verify the content of the cache file
-    with open(cache_filename, encoding="utf-8") as f:
-        cached_data = json.load(f)
-        assert cached_data["status"] == "success"
+    assert cache_record.decode(cache_filename.read_bytes()).is_compatible == "success"
 
 
 def test_edge_case_tool_name_with_special_character(audit_facade):
@@ -119,9 +130,7 @@ def test_edge_case_tool_name_with_special_character(audit_facade):
 
     # Write to cache with special character
     cache_filename = audit_facade.get_cache_filename(special_config)
-    mock_result = MagicMock(spec=ToolCheckResult)
-    mock_result.__dict__ = {"status": "success"}
-    audit_facade.write_to_cache(special_config, mock_result)
+    audit_facade.write_to_cache(special_config, _result("success"))
 
     assert cache_filename.exists()  # Verify the file was created
 
@@ -129,11 +138,8 @@ def test_edge_case_tool_name_with_special_character(audit_facade):
 def test_edge_case_multiple_cache_writes(audit_facade, fake_tool_config):
     # Write to cache multiple times
     for i in range(3):
-        mock_result = MagicMock(spec=ToolCheckResult)
-        mock_result.__dict__ = {"status": f"success-{i}"}
-        audit_facade.write_to_cache(fake_tool_config, mock_result)
+        audit_facade.write_to_cache(fake_tool_config, _result(f"success-{i}"))
 
     # Verify the last write has overwritten previous ones
-    with open(audit_facade.get_cache_filename(fake_tool_config), encoding="utf-8") as f:
-        cached_data = json.load(f)
-        assert cached_data["status"] == "success-2"  # Last write in the loop
+    cached = cache_record.decode(audit_facade.get_cache_filename(fake_tool_config).read_bytes())
+    assert cached.is_compatible == "success-2"  # Last write in the loop
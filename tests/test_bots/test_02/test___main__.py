@@ -23,6 +23,11 @@ def test_handle_audit():
         only_errors=False,
         quiet=False,
         fix=False,
+        stale_ok=False,
+        all_instances=False,
+        locked=False,
+        verify_hash=False,
+        watch=False,
     )
 
     with patch("cli_tool_audit.views.report_from_pyproject_toml") as mock_report:
@@ -37,6 +42,10 @@ def test_handle_audit():
             only_errors=False,
             quiet=False,
             show_fix=False,
+            stale_ok=False,
+            all_instances=False,
+            locked=False,
+            verify_hash=False,
         )
 
 
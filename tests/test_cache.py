@@ -1,9 +1,9 @@
-import json
 from unittest.mock import Mock, patch
 
 import pytest
 
-from cli_tool_audit.audit_cache import AuditFacade, custom_json_deserializer
+from cli_tool_audit import cache_record
+from cli_tool_audit.audit_cache import AuditFacade
 from cli_tool_audit.models import CliToolConfig, SchemaType, ToolCheckResult
 
 
@@ -51,14 +51,14 @@ def test_audit_facade_caching(tmp_path, mock_audit_manager):
     assert cache_file.exists()
 
     # Read the cached result directly and verify its content
-    with open(cache_file, encoding="utf-8") as file:
-        # dupe code.
-        hit = ToolCheckResult(**json.load(file, object_hook=custom_json_deserializer))
+    hit = cache_record.decode(cache_file.read_bytes())
     assert not facade.cache_hit
     assert hit == expected_result
 
     # Call and check again - should read from cache this time
     result = facade.call_and_check(tool_config)
     assert facade.cache_hit
-    assert result == expected_result
+    # Cache records keep only the fields that decide how the tool is checked, the caller's config comes back.
+    assert result.tool_config is tool_config
+    assert result.found_version == expected_result.found_version
     mock_audit_manager.call_and_check.assert_called_once()  # Ensure it was called only once
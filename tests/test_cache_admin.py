@@ -0,0 +1,78 @@
+import datetime
+
+from cli_tool_audit.audit_cache import AuditFacade, CacheStats
+from cli_tool_audit.cache_admin import format_bytes, inspect_report, stats_report
+from cli_tool_audit.models import CliToolConfig, SchemaType, ToolCheckResult
+
+
+def _result(tool="mytool", age_days=0.0, is_available=True) -> ToolCheckResult:
+    return ToolCheckResult(
+        tool=tool,
+        desired_version="1.0.0",
+        is_needed_for_os=True,
+        is_available=is_available,
+        is_snapshot=False,
+        found_version="mytool 1.0.0\nCopyright" if is_available else None,
+        parsed_version="1.0.0",
+        is_compatible="Compatible" if is_available else "Can't tell",
+        is_broken=False,
+        last_modified=None,
+        tool_config=CliToolConfig(name=tool, version="1.0.0", schema=SchemaType.SEMVER),
+        checked_at=datetime.datetime.now() - datetime.timedelta(days=age_days),
+        check_duration=0.5,
+    )
+
+
+def _facade(tmp_path, *results) -> AuditFacade:
+    facade = AuditFacade(cache_dir=tmp_path)
+    for result in results:
+        facade.write_to_cache(result.tool_config, result)
+    return facade
+
+
+def test_format_bytes():
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(2048) == "2.0 KB"
+    assert format_bytes(3 * 1024 * 1024) == "3.0 MB"
+
+
+def test_stats_report_counts_entries(tmp_path):
+    facade = _facade(tmp_path, _result("good"), _result("old", age_days=60), _result("gone", is_available=False))
+    report = stats_report(facade)
+    assert "Entries: 3 (1 problems, 1 expired, 0 for executables that changed)" in report
+    assert "No audits have used the cache yet." in report
+
+
+def test_stats_report_sums_history(tmp_path):
+    facade = _facade(tmp_path)
+    facade.record_run(CacheStats(hits=3, misses=1, saved_seconds=1.5, probe_seconds=0.5))
+    facade.record_run(CacheStats(hits=1, misses=3, saved_seconds=0.5, probe_seconds=1.5))
+    report = stats_report(facade)
+    assert "Last 2 runs: 4 hits, 4 misses, 50% hit ratio, 2.0s saved" in report
+    assert "2.0s spent on misses" in report
+
+
+def test_inspect_report(tmp_path):
+    facade = _facade(tmp_path, _result("mytool"), _result("other"))
+    report = inspect_report(facade, "mytool")
+    assert "found:      mytool 1.0.0" in report
+    assert "(fresh), took 0.50s" in report
+    assert "executable: current" in report
+    assert "other" not in report
+
+
+def test_inspect_report_shows_provider(tmp_path):
+    result = _result("mytool")
+    result.version_provider = "pipx"
+    assert "read by:    pipx, not run" in inspect_report(_facade(tmp_path, result), "mytool")
+    assert "read by" not in inspect_report(_facade(tmp_path / "other", _result("mytool")), "mytool")
+
+
+def test_inspect_report_shows_package(tmp_path):
+    result = _result("mytool")
+    result.package_name, result.package_version = "mytool", "1.0.0-2"
+    assert "package:    mytool 1.0.0-2" in inspect_report(_facade(tmp_path, result), "mytool")
+
+
+def test_inspect_report_no_entries(tmp_path):
+    assert inspect_report(_facade(tmp_path), "mytool") == "No cache entries for mytool."
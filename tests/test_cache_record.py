@@ -0,0 +1,99 @@
+"""Tests for cli_tool_audit.cache_record module."""
+
+import datetime
+
+import pytest
+
+from cli_tool_audit import cache_record
+from cli_tool_audit.models import CliToolConfig, SchemaType, ToolCheckResult
+
+
+def _result(**overrides) -> ToolCheckResult:
+    values = {
+        "tool": "mytool",
+        "desired_version": ">=1.0.0",
+        "is_needed_for_os": True,
+        "is_available": True,
+        "is_snapshot": False,
+        "found_version": "mytool 1.2.3 — ünïcode\nsecond line",
+        "parsed_version": "1.2.3",
+        "is_compatible": "Compatible",
+        "is_broken": False,
+        "last_modified": datetime.datetime(2024, 2, 29, 13, 14, 15, 123456),
+        "tool_config": CliToolConfig(
+            name="mytool", version=">=1.0.0", version_switch="-V", schema=SchemaType.SEMVER, if_os="linux"
+        ),
+        "checked_at": datetime.datetime(2026, 10, 1, 8, 0, 0, 1),
+        "check_duration": 0.123456,
+    }
+    values.update(overrides)
+    return ToolCheckResult(**values)
+
+
+def test_round_trip():
+    result = _result()
+    assert cache_record.decode(cache_record.encode(result)) == result
+
+
+def test_round_trip_with_nones():
+    result = _result(
+        found_version=None,
+        parsed_version=None,
+        is_available=False,
+        is_needed_for_os=False,
+        is_broken=True,
+        is_snapshot=True,
+        last_modified=None,
+        checked_at=None,
+        check_duration=None,
+        tool_config=CliToolConfig(name="mytool"),
+    )
+    assert cache_record.decode(cache_record.encode(result)) == result
+
+
+def test_round_trip_with_provider():
+    result = _result(found_version="1.2.3", version_provider="pipx")
+    assert cache_record.decode(cache_record.encode(result)).version_provider == "pipx"
+
+
+def test_round_trip_with_package():
+    result = _result(found_version="git version 2.39.5", package_name="git", package_version="1:2.39.5-0+deb12u2")
+    decoded = cache_record.decode(cache_record.encode(result))
+    assert (decoded.package_name, decoded.package_version) == ("git", "1:2.39.5-0+deb12u2")
+
+
+def test_only_probe_fields_are_kept():
+    config = CliToolConfig(name="mytool", version="1.0", tags=["build"], install_command="pipx install mytool")
+    decoded = cache_record.decode(cache_record.encode(_result(tool_config=config)))
+    assert decoded.tool_config == CliToolConfig(name="mytool", version="1.0")
+
+
+def test_string_schema_is_read_back_as_enum():
+    config = CliToolConfig(name="mytool", schema="snapshot")  # type: ignore[arg-type]
+    decoded = cache_record.decode(cache_record.encode(_result(tool_config=config)))
+    assert decoded.tool_config.schema == SchemaType.SNAPSHOT
+
+
+def test_record_is_smaller_than_indented_json():
+    import json
+
+    from cli_tool_audit.json_utils import custom_json_serializer
+
+    result = _result()
+    as_json = json.dumps(result.__dict__, indent=4, default=custom_json_serializer).encode()
+    assert len(cache_record.encode(result)) < len(as_json) / 2
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b'{"tool": "mytool"}',
+        cache_record.encode(_result())[:-3],
+        b"CTAR\x63" + cache_record.encode(_result())[5:],
+    ],
+    ids=["empty", "json", "truncated", "other version"],
+)
+def test_unreadable_records(data):
+    with pytest.raises(ValueError):
+        cache_record.decode(data)
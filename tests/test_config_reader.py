@@ -93,3 +93,15 @@ make = {version_snapshot = "GNU Make 4.3"}
     result = read_config(config_file)
     assert result["make"].schema == SchemaType.SNAPSHOT
     assert result["make"].version == "GNU Make 4.3"
+
+
+def test_read_config_remembers_until_file_changes(tmp_path):
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text('[tool.cli-tools]\npython = {version = ">=3.11.0"}\n', encoding="utf-8")
+
+    first = read_config(config_file)
+    first["python"].version = "mutated by caller"
+    assert read_config(config_file)["python"].version == ">=3.11.0"
+
+    config_file.write_text('[tool.cli-tools]\npython = {version = ">=3.12.0"}\nnode = {}\n', encoding="utf-8")
+    assert read_config(config_file)["python"].version == ">=3.12.0"
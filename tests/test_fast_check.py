@@ -0,0 +1,91 @@
+"""Tests for cli_tool_audit.fast_check module."""
+
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from cli_tool_audit import fast_check, lockfile, views
+from cli_tool_audit.models import CliToolConfig, SchemaType
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell scripts")
+
+HEAVY_MODULES = ("semver", "packaging", "prettytable", "colorama", "tqdm", "toml", "tomlkit", "cli_tool_audit.views")
+IMPORT_BUDGET_MS = 300
+"""Opt-in ceiling for importing the fast path. It takes well under 100 ms on a slow CI runner, the CLI about 250 ms."""
+
+timed = pytest.mark.skipif(
+    not os.environ.get("CLI_TOOL_AUDIT_IMPORT_BUDGETS"), reason="set CLI_TOOL_AUDIT_IMPORT_BUDGETS=1 to time imports"
+)
+
+
+def test_fast_path_imports_no_heavy_modules(import_times):
+    imported, _total = import_times(["-c", "import cli_tool_audit.fast_check"])
+    assert "cli_tool_audit.lockfile" in imported
+    assert not [name for name in imported if name.split(".")[0] in HEAVY_MODULES or name in HEAVY_MODULES]
+
+
+@timed
+def test_fast_path_imports_within_budget(import_times):
+    runs = [import_times(["-c", "import cli_tool_audit.fast_check"])[0] for _ in range(3)]
+    assert min(run["cli_tool_audit.fast_check"] for run in runs) / 1000 < IMPORT_BUDGET_MS
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch, fresh_path_index):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / "fake_tool"
+    tool.write_text("#!/bin/sh\necho 2.0.0\n", encoding="utf-8")
+    tool.chmod(0o755)
+    config = tmp_path / "pyproject.toml"
+    config.write_text('[tool.cli-tools]\nfake_tool = {version = ">=2.0.0", schema = "semver"}\n', encoding="utf-8")
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.chdir(tmp_path)
+    return config
+
+
+def _lock(config):
+    tools = {"fake_tool": CliToolConfig(name="fake_tool", version=">=2.0.0", schema=SchemaType.SEMVER)}
+    lockfile.write_lock(views.process_tools(tools, no_cache=True), lockfile.lock_path_for(config), config)
+
+
+def test_unchanged_project_answered_from_lock(project):
+    _lock(project)
+    with patch("cli_tool_audit.lockfile.verify", side_effect=AssertionError("parsed the config")):
+        (result,) = fast_check.check(project)
+    assert result.found_version == "2.0.0"
+    assert result.tool_config.schema == SchemaType.SEMVER
+    assert result.tool_config.version == ">=2.0.0"
+    assert fast_check.main(["--config", str(project)]) == 0
+
+
+def test_lock_without_configs_falls_back_to_verify(project):
+    _lock(project)
+    lock_path = lockfile.lock_path_for(project)
+    data = json.loads(lock_path.read_text(encoding="utf-8"))
+    del data["tools"]["fake_tool"]["config"]
+    lock_path.write_text(json.dumps(data), encoding="utf-8")
+    assert lockfile.fast_verify(project) is None
+    (result,) = fast_check.check(project)
+    assert result.tool_config.schema == SchemaType.SEMVER
+
+
+def test_changed_config_falls_back_to_verify(project):
+    _lock(project)
+    project.write_text(project.read_text(encoding="utf-8") + "# edited\n", encoding="utf-8")
+    assert lockfile.fast_verify(project) is None
+    with patch("cli_tool_audit.lockfile.verify", wraps=lockfile.verify) as mock_verify, patch(
+        "cli_tool_audit.audit_manager.AuditManager.call_and_check", side_effect=AssertionError("ran the tool")
+    ):
+        (result,) = fast_check.check(project)
+    mock_verify.assert_called_once()
+    assert result.found_version == "2.0.0"
+
+
+def test_without_lock_checks_every_tool(project, capsys):
+    (project.parent / "bin" / "fake_tool").unlink()
+    assert fast_check.main(["--config", str(project)]) == 1
+    assert "fake_tool" in capsys.readouterr().err
@@ -0,0 +1,144 @@
+"""Tests for cli_tool_audit.fingerprint module."""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from cli_tool_audit.fingerprint import (
+    MISSING,
+    console_script_dist_infos,
+    fingerprint_digest,
+    get_executable_fingerprint,
+    read_shebang_interpreter,
+)
+
+
+def test_missing_tool():
+    assert get_executable_fingerprint("__tool_that_does_not_exist__xyz") == MISSING
+
+
+def test_fingerprint_changes_with_mtime(tmp_path, monkeypatch):
+    name = "fake_tool.exe" if sys.platform == "win32" else "fake_tool"
+    tool = tmp_path / name
+    tool.write_text("#!/bin/sh\necho 1.0.0\n", encoding="utf-8")
+    tool.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path))
+
+    before = get_executable_fingerprint(name)
+    os.utime(tool, (1_000, 1_000))
+    after = get_executable_fingerprint(name)
+
+    assert str(tool) in before
+    assert before != after
+
+
+def test_digest_is_filename_safe():
+    digest = fingerprint_digest("__tool_that_does_not_exist__xyz")
+    assert digest.isalnum()
+    assert len(digest) == 32
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks and shebangs")
+def test_fingerprint_follows_symlinks(tmp_path, monkeypatch, make_script):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    first = make_script(tmp_path / "tool-1.0", "#!/bin/sh\necho 1.0\n")
+    second = make_script(tmp_path / "tool-2.0", "#!/bin/sh\necho 2.0\n")
+    os.utime(first, (1_000, 1_000))
+    os.utime(second, (1_000, 1_000))
+    (bin_dir / "tool").symlink_to(first)
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    before = get_executable_fingerprint("tool")
+    (bin_dir / "tool").unlink()
+    (bin_dir / "tool").symlink_to(second)
+    assert get_executable_fingerprint("tool") != before
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shebangs")
+def test_fingerprint_follows_shebang_interpreter(tmp_path, monkeypatch, make_script):
+    interpreter = make_script(tmp_path / "interp", "#!/bin/sh\n")
+    make_script(tmp_path / "tool", f"#!{interpreter}\n")
+    monkeypatch.setenv("PATH", str(tmp_path))
+
+    before = get_executable_fingerprint("tool")
+    os.utime(interpreter, (1_000, 1_000))
+    assert get_executable_fingerprint("tool") != before
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shebangs")
+def test_read_shebang_interpreter(tmp_path, monkeypatch, make_script):
+    make_script(tmp_path / "python3", "")
+    monkeypatch.setenv("PATH", str(tmp_path))
+    direct = make_script(tmp_path / "direct", "#!/opt/python/bin/python3 -E\n")
+    env = make_script(tmp_path / "env", "#!/usr/bin/env -S PYTHONUTF8=1 python3 -u\n")
+    trampoline = make_script(
+        tmp_path / "trampoline", "#!/bin/sh\n'''exec' \"/long path/python\" \"$0\" \"$@\"\n' '''\n"
+    )
+    binary = tmp_path / "binary"
+    binary.write_bytes(b"\x7fELF")
+
+    assert read_shebang_interpreter(str(direct)) == "/opt/python/bin/python3"
+    assert read_shebang_interpreter(str(env)) == str(tmp_path / "python3")
+    assert read_shebang_interpreter(str(trampoline)) == "/long path/python"
+    assert read_shebang_interpreter(str(binary)) is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shebangs")
+def test_fingerprint_follows_console_script_metadata(tmp_path, monkeypatch, make_script):
+    bin_dir = tmp_path / "venv" / "bin"
+    bin_dir.mkdir(parents=True)
+    python = make_script(bin_dir / "python", "")
+    make_script(bin_dir / "mytool", f"#!{python}\nfrom mytool import main\n")
+    dist_info = tmp_path / "venv" / "lib" / "python3.12" / "site-packages" / "mytool-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "entry_points.txt").write_text("[console_scripts]\nmytool = mytool:main\n", encoding="utf-8")
+    (dist_info / "RECORD").write_text("", encoding="utf-8")
+    (dist_info / "METADATA").write_text("Version: 1.0\n", encoding="utf-8")
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    before = get_executable_fingerprint("mytool")
+    assert str(dist_info / "RECORD") in before
+    os.utime(dist_info / "METADATA", (1_000, 1_000))
+    assert get_executable_fingerprint("mytool") != before
+
+
+def test_console_scripts_of_an_environment_are_indexed_once(tmp_path):
+    site_packages = tmp_path / "venv" / "lib" / "python3.12" / "site-packages"
+    for name, scripts in (("black", "black = black:main\nblackd = blackd:main\n"), ("ruff", "ruff = ruff:main\n")):
+        dist_info = site_packages / f"{name}-1.0.dist-info"
+        dist_info.mkdir(parents=True)
+        (dist_info / "entry_points.txt").write_text(f"[console_scripts]\n{scripts}", encoding="utf-8")
+    (site_packages / "other-1.0.dist-info").mkdir()
+
+    with patch("builtins.open", wraps=open) as mock_open:
+        for script in ("black", "blackd", "ruff", "missing"):
+            console_script_dist_infos(str(tmp_path / "venv" / "bin" / script))
+    assert mock_open.call_count == 3
+    assert console_script_dist_infos(str(tmp_path / "venv" / "bin" / "blackd")) == (
+        str(site_packages / "black-1.0.dist-info"),
+    )
+    assert console_script_dist_infos(str(tmp_path / "venv" / "bin" / "missing")) == ()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks")
+def test_fingerprint_follows_npm_package_json(tmp_path, monkeypatch, make_script):
+    package_dir = tmp_path / "lib" / "node_modules" / "tool"
+    (package_dir / "bin").mkdir(parents=True)
+    script = make_script(package_dir / "bin" / "tool.js", "console.log('1.0.0')\n")
+    package_json = package_dir / "package.json"
+    package_json.write_text('{"version": "1.0.0"}', encoding="utf-8")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "tool").symlink_to(script)
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    before = get_executable_fingerprint("tool")
+    assert str(package_json) in before
+    # npm installs every file with the same modified time, a new version only shows in the contents.
+    stat = package_json.stat()
+    package_json.write_text('{"version": "1.0.1"}', encoding="utf-8")
+    os.utime(package_json, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert get_executable_fingerprint("tool") != before
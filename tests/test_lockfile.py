@@ -0,0 +1,120 @@
+"""Tests for cli_tool_audit.lockfile module."""
+
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cli_tool_audit import lockfile, views
+from cli_tool_audit.models import CliToolConfig, SchemaType
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell scripts")
+
+
+@pytest.fixture
+def tool_dir(tmp_path, monkeypatch, fresh_path_index):
+    directory = tmp_path / "bin"
+    directory.mkdir()
+    monkeypatch.setenv("PATH", str(directory))
+    monkeypatch.chdir(tmp_path)
+    return directory
+
+
+def _config():
+    return {"fake_tool": CliToolConfig(name="fake_tool", version=">=1.0.0", schema=SchemaType.SEMVER)}
+
+
+def _lock(tmp_path):
+    results = views.process_tools(_config(), no_cache=True, disable_progress_bar=True)
+    lock_path = tmp_path / lockfile.LOCK_FILE_NAME
+    lockfile.write_lock(results, lock_path)
+    return lock_path
+
+
+def test_lock_records_executable_and_result(tool_dir, tmp_path, make_script):
+    tool = make_script(tool_dir / "fake_tool", "#!/bin/sh\necho 1.2.3\n")
+    data = json.loads(_lock(tmp_path).read_text(encoding="utf-8"))
+    entry = data["tools"]["fake_tool"]
+    assert entry["path"] == str(tool)
+    assert entry["inode"] == tool.stat().st_ino
+    assert entry["size"] == tool.stat().st_size
+    assert entry["found_version"] == "1.2.3"
+    assert len(entry["sha256"]) == 64
+
+
+def test_unchanged_tool_is_answered_without_running(tool_dir, tmp_path, make_script):
+    make_script(tool_dir / "fake_tool", "#!/bin/sh\necho 1.2.3\n")
+    lock_path = _lock(tmp_path)
+    with patch("subprocess.run", side_effect=AssertionError("ran a tool")):
+        check = lockfile.verify(_config(), lock_path, check_hash=True)
+    assert check.changed == {}
+    (result,) = check.results
+    assert result.parsed_version == "1.2.3"
+    assert result.tool_config == _config()["fake_tool"]
+    assert result.checked_at is not None
+
+
+def test_lock_records_version_provider(tool_dir, tmp_path, make_script):
+    make_script(tool_dir / "fake_tool", "#!/bin/sh\necho 1.2.3\n")
+    lock_path = _lock(tmp_path)
+    data = json.loads(lock_path.read_text(encoding="utf-8"))
+    assert data["tools"]["fake_tool"]["version_provider"] is None
+    assert data["tools"]["fake_tool"]["package_name"] is None
+
+    # Lock files written before the provider and package were recorded are still read.
+    for field in ("version_provider", "package_name", "package_version"):
+        del data["tools"]["fake_tool"][field]
+    lock_path.write_text(json.dumps(data), encoding="utf-8")
+    (result,) = lockfile.verify(_config(), lock_path).results
+    assert result.version_provider is None
+    assert result.package_name is None
+
+
+def test_changed_executable_is_checked_again(tool_dir, tmp_path, make_script):
+    tool = make_script(tool_dir / "fake_tool", "#!/bin/sh\necho 1.2.3\n")
+    lock_path = _lock(tmp_path)
+    make_script(tool_dir / "fake_tool", "#!/bin/sh\necho 1.2.4\n")
+    os.utime(tool, ns=(1, 1))
+    check = lockfile.verify(_config(), lock_path)
+    assert list(check.changed) == ["fake_tool"]
+    assert check.results == []
+
+
+def test_hash_check_catches_same_size_and_time(tool_dir, tmp_path, make_script):
+    tool = make_script(tool_dir / "fake_tool", "#!/bin/sh\necho 1.2.3\n")
+    lock_path = _lock(tmp_path)
+    stat = tool.stat()
+    make_script(tool_dir / "fake_tool", "#!/bin/sh\necho 1.2.4\n")
+    os.utime(tool, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert lockfile.verify(_config(), lock_path).changed == {}
+    assert list(lockfile.verify(_config(), lock_path, check_hash=True).changed) == ["fake_tool"]
+
+
+def test_changed_config_is_checked_again(tool_dir, tmp_path, make_script):
+    make_script(tool_dir / "fake_tool", "#!/bin/sh\necho 1.2.3\n")
+    lock_path = _lock(tmp_path)
+    config = {"fake_tool": CliToolConfig(name="fake_tool", version=">=2.0.0", schema=SchemaType.SEMVER)}
+    assert list(lockfile.verify(config, lock_path).changed) == ["fake_tool"]
+
+
+def test_missing_or_invalid_lock_checks_everything(tool_dir, tmp_path):
+    assert list(lockfile.verify(_config(), tmp_path / "missing.lock").changed) == ["fake_tool"]
+    invalid = tmp_path / "invalid.lock"
+    invalid.write_text('{"format": "something else"}', encoding="utf-8")
+    assert list(lockfile.verify(_config(), invalid).changed) == ["fake_tool"]
+
+
+def test_audit_locked_reports_checked_again(tool_dir, tmp_path, capsys, make_script):
+    tool = make_script(tool_dir / "fake_tool", "#!/bin/sh\necho 1.2.3\n")
+    _lock(tmp_path)
+    os.utime(tool, ns=(1, 1))
+    views.report_from_pyproject_toml(file_path=None, config_as_dict=_config(), locked=True)
+    assert "changed since the lock file: fake_tool" in capsys.readouterr().out
+
+
+def test_lock_path_is_next_to_config():
+    assert lockfile.lock_path_for(Path("project") / "pyproject.toml") == Path("project") / "cli-tools.lock"
+    assert lockfile.lock_path_for(None) == Path("cli-tools.lock")
@@ -72,3 +72,72 @@ def test_demo_command_venv(mock_report_for_venv_tools):
     argv = ["--demo", "venv"]
     app.main(argv)
     mock_report_for_venv_tools.assert_called_once()
+
+
+def test_cache_subcommands(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with patch("cli_tool_audit.cache_admin.stats_report", return_value="report") as mock_stats:
+        app.main(["cache"])
+        app.main(["cache", "stats", "--runs", "3"])
+    assert mock_stats.call_args_list[0].kwargs == {"last_runs": 10}
+    assert mock_stats.call_args_list[1].kwargs == {"last_runs": 3}
+    with patch("cli_tool_audit.audit_cache.AuditFacade.clear", return_value=0) as mock_clear:
+        app.main(["cache", "clear"])
+    mock_clear.assert_called_once()
+    with patch("cli_tool_audit.audit_cache.AuditFacade.prune", return_value=0) as mock_prune:
+        app.main(["cache", "prune"])
+    mock_prune.assert_called_once()
+    with patch("cli_tool_audit.cache_admin.inspect_report", return_value="") as mock_inspect:
+        app.main(["cache", "inspect", "python"])
+    assert mock_inspect.call_args[0][1] == "python"
+
+
+def test_cache_export_and_import(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    app.main(["cache", "export"])
+    assert (tmp_path / "cli-tool-audit-cache.json.gz").exists()
+    app.main(["cache", "import", "cli-tool-audit-cache.json.gz"])
+    app.main(["cache", "import", "missing.json.gz"])
+    output = capsys.readouterr().out
+    assert "Exported 0 cache entries" in output
+    assert "Imported 0 cache entries, skipped 0" in output
+    assert "Error:" in output
+
+
+def test_lock_command(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text('[tool.cli-tools]\npython = {version = ">=3.0.0"}\n', encoding="utf-8")
+    app.main(["lock"])
+    assert "Locked 1 tools in cli-tools.lock" in capsys.readouterr().out
+    assert (tmp_path / "cli-tools.lock").exists()
+
+
+def test_cache_warm(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text('[tool.cli-tools]\npython = {version = ">=3.0.0"}\n', encoding="utf-8")
+    with patch("cli_tool_audit.audit_cache.lower_priority"):
+        app.main(["cache", "warm"])
+        app.main(["cache", "warm"])
+    output = capsys.readouterr().out
+    assert "Warmed the cache for 1 tools: 1 called, 0 already cached." in output
+    assert "Warmed the cache for 1 tools: 0 called, 1 already cached." in output
+    with patch("cli_tool_audit.audit_cache.AuditFacade.refresh_in_background", return_value=True) as mock_refresh:
+        app.main(["cache", "warm", "--background"])
+    assert mock_refresh.call_args.kwargs == {"warm": True}
+
+
+@pytest.mark.parametrize(
+    "extra", [["--format", "json"], ["--locked"], ["--stale-ok"], ["--interval", "0"], ["--interval", "-1"]]
+)
+def test_watch_rejects_ignored_options(extra, capsys):
+    with patch("cli_tool_audit.watch.watch") as mock_watch, pytest.raises(SystemExit) as raised:
+        app.main(["audit", "--watch", *extra])
+    assert raised.value.code == 2
+    assert extra[0] in capsys.readouterr().err
+    mock_watch.assert_not_called()
+
+
+def test_watch_exit_code():
+    with patch("cli_tool_audit.watch.watch", return_value=1) as mock_watch:
+        assert app.main(["audit", "--watch", "--interval", "0.5"]) == 1
+    assert mock_watch.call_args.kwargs["interval"] == 0.5
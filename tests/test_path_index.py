@@ -0,0 +1,118 @@
+"""Tests for cli_tool_audit.path_index module."""
+
+import os
+import shutil
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from cli_tool_audit import path_index
+from cli_tool_audit.path_index import PathIndex
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX executable bits")
+
+
+def test_first_match_in_path_order(tmp_path, make_script):
+    first = make_script(tmp_path / "a" / "tool")
+    make_script(tmp_path / "b" / "tool")
+    index = PathIndex(os.pathsep.join([str(tmp_path / "a"), str(tmp_path / "b")]))
+    path, stat = index.lookup("tool")
+    assert path == str(first)
+    assert stat.st_size == first.stat().st_size
+
+
+def test_skips_non_executables_and_directories(tmp_path, make_script):
+    make_script(tmp_path / "a" / "tool", mode=0o644)
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "tool").mkdir()
+    second = make_script(tmp_path / "c" / "tool")
+    index = PathIndex(os.pathsep.join(str(tmp_path / name) for name in "abc"))
+    assert index.lookup("tool")[0] == str(second)
+
+
+def test_missing_directories_are_ignored(tmp_path):
+    index = PathIndex(str(tmp_path / "does_not_exist"))
+    assert index.lookup("tool") is None
+
+
+def test_new_executable_found_after_miss(tmp_path, monkeypatch, make_script):
+    monkeypatch.setattr(path_index, "REVALIDATE_SECONDS", 0.0)
+    (tmp_path / "a").mkdir()
+    index = PathIndex(str(tmp_path / "a"))
+    assert index.lookup("tool") is None
+    created = make_script(tmp_path / "a" / "tool")
+    os.utime(tmp_path / "a", ns=(1, 1))
+    assert index.lookup("tool")[0] == str(created)
+
+
+def test_path_with_directory_is_checked_directly(tmp_path, make_script):
+    tool = make_script(tmp_path / "a" / "tool")
+    index = PathIndex("")
+    assert index.lookup(str(tool))[0] == str(tool)
+
+
+def test_saved_listings_reused_until_directory_changes(tmp_path, make_script):
+    (tmp_path / "cache").mkdir()
+    index_file = tmp_path / "cache" / "path_index.json"
+    make_script(tmp_path / "a" / "tool")
+    PathIndex(str(tmp_path / "a"), index_file)
+    assert index_file.exists()
+
+    with patch("cli_tool_audit.path_index.os.scandir") as mock_scandir:
+        assert PathIndex(str(tmp_path / "a"), index_file).lookup("tool") is not None
+    mock_scandir.assert_not_called()
+
+    os.utime(tmp_path / "a", ns=(1, 1))
+    with patch("cli_tool_audit.path_index.os.scandir", wraps=os.scandir) as mock_scandir:
+        PathIndex(str(tmp_path / "a"), index_file)
+    mock_scandir.assert_called_once()
+
+
+def test_not_saved_without_cache_root(tmp_path):
+    index_file = tmp_path / "no_cache_here" / "path_index.json"
+    PathIndex(str(tmp_path), index_file)
+    assert not index_file.parent.exists()
+
+
+def test_unreadable_saved_index_is_ignored(tmp_path, make_script):
+    index_file = tmp_path / "path_index.json"
+    index_file.write_text("{not json", encoding="utf-8")
+    tool = make_script(tmp_path / "a" / "tool")
+    assert PathIndex(str(tmp_path / "a"), index_file).lookup("tool")[0] == str(tool)
+
+
+@pytest.mark.parametrize("name", ["sh", "python", "__tool_that_does_not_exist_xyz__"])
+def test_which_agrees_with_shutil(name):
+    assert path_index.which(name) == shutil.which(name)
+
+
+def test_index_rebuilt_when_path_changes(tmp_path, monkeypatch, make_script):
+    tool = make_script(tmp_path / "a" / "tool")
+    monkeypatch.setenv("PATH", str(tmp_path / "a"))
+    assert path_index.which("tool") == str(tool)
+    monkeypatch.setenv("PATH", str(tmp_path / "b"))
+    assert path_index.which("tool") is None
+
+
+def test_recent_miss_trusted_without_rescanning(tmp_path):
+    (tmp_path / "a").mkdir()
+    index = PathIndex(str(tmp_path / "a"))
+    with patch("cli_tool_audit.path_index.os.stat", wraps=os.stat) as mock_stat:
+        assert index.lookup("tool") is None
+    mock_stat.assert_not_called()
+
+
+def test_lookup_all_returns_every_copy_in_path_order(tmp_path, make_script):
+    first = make_script(tmp_path / "a" / "tool")
+    make_script(tmp_path / "b" / "tool", mode=0o644)
+    third = make_script(tmp_path / "c" / "tool")
+    index = PathIndex(os.pathsep.join(str(tmp_path / name) for name in "abc"))
+    assert [path for path, _stat in index.lookup_all("tool")] == [str(first), str(third)]
+    assert index.lookup_all("other") == []
+
+
+def test_cache_root_matches_the_cache():
+    from cli_tool_audit import audit_cache
+
+    assert path_index.CACHE_ROOT_NAME == audit_cache.CACHE_ROOT_NAME
@@ -0,0 +1,92 @@
+"""Tests for cli_tool_audit.providers package."""
+
+import sys
+
+import pytest
+
+import cli_tool_audit.providers as providers
+from cli_tool_audit.audit_manager import AuditManager
+from cli_tool_audit.models import CliToolConfig, SchemaType
+from cli_tool_audit.providers.python_metadata import PythonMetadataProvider, read_metadata_version
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell scripts")
+
+
+def _dist_info(site_packages, name, version, scripts):
+    dist_info = site_packages / f"{name}-{version}.dist-info"
+    dist_info.mkdir(parents=True)
+    entry_points = "".join(f"{script} = {name}:main\n" for script in scripts)
+    (dist_info / "entry_points.txt").write_text(f"[console_scripts]\n{entry_points}", encoding="utf-8")
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n\nVersion: not a header\n", encoding="utf-8"
+    )
+    return dist_info
+
+
+@pytest.fixture
+def venv(tmp_path, monkeypatch, providers_enabled, fresh_path_index, make_script):
+    bin_dir = tmp_path / "venv" / "bin"
+    bin_dir.mkdir(parents=True)
+    python = make_script(bin_dir / "python", "#!/bin/sh\nexit 1\n")
+    # Running the tool would report a different version, answers must come from METADATA.
+    make_script(bin_dir / "mytool", f"#!{python}\necho 9.9.9\n")
+    site_packages = tmp_path / "venv" / "lib" / "python3.12" / "site-packages"
+    _dist_info(site_packages, "mytool", "1.2.3", ["mytool"])
+    monkeypatch.setenv("PATH", str(bin_dir))
+    return bin_dir
+
+
+def test_read_metadata_version_stops_at_body(tmp_path):
+    metadata = tmp_path / "METADATA"
+    metadata.write_text("Name: x\n\nVersion: 1.0\n", encoding="utf-8")
+    assert read_metadata_version(str(metadata)) is None
+    assert read_metadata_version(str(tmp_path / "missing")) is None
+
+
+def test_console_script_version_from_metadata(venv):
+    provided = providers.find_version(str(venv / "mytool"))
+    assert provided == providers.ProvidedVersion(version="1.2.3", provider="python-metadata")
+
+
+def test_symlinked_console_script(venv, tmp_path):
+    link = tmp_path / "mytool"
+    link.symlink_to(venv / "mytool")
+    assert PythonMetadataProvider().find_version(str(link), str(venv / "mytool")) == "1.2.3"
+
+
+def test_script_declared_twice_is_not_answered(venv):
+    _dist_info(venv.parent / "lib" / "python3.12" / "site-packages", "othertool", "4.0", ["mytool"])
+    assert providers.find_version(str(venv / "mytool")) is None
+
+
+def test_non_python_script_is_not_answered(venv, make_script):
+    make_script(venv / "shtool", "#!/bin/sh\necho 1.0.0\n")
+    assert providers.find_version(str(venv / "shtool")) is None
+
+
+def test_providers_can_be_disabled(venv, monkeypatch):
+    monkeypatch.setenv("CLI_TOOL_AUDIT_PROVIDERS", "none")
+    assert providers.find_version(str(venv / "mytool")) is None
+    monkeypatch.setenv("CLI_TOOL_AUDIT_PROVIDERS", "python-metadata")
+    assert providers.find_version(str(venv / "mytool")) is not None
+
+
+def test_audit_uses_provider_without_running_the_tool(venv):
+    result = AuditManager().call_and_check(CliToolConfig(name="mytool", version=">=1.0.0", schema=SchemaType.SEMVER))
+    assert result.found_version == "1.2.3"
+    assert result.is_compatible == "Compatible"
+
+
+def test_snapshot_and_custom_switch_still_run_the_tool(venv, make_script):
+    make_script(venv / "python", "#!/bin/sh\necho 9.9.9\n")
+    make_script(venv / "mytool", "#!" + str(venv / "python") + "\n")
+    snapshot = AuditManager().call_tool("mytool", SchemaType.SNAPSHOT, "--version")
+    custom_switch = AuditManager().call_tool("mytool", SchemaType.SEMVER, "-V")
+    assert snapshot.version == "9.9.9"
+    assert custom_switch.version == "9.9.9"
+
+
+def test_dotted_console_script_name(venv, make_script):
+    _dist_info(venv.parent / "lib" / "python3.12" / "site-packages", "pytest", "8.0.0", ["py.test"])
+    make_script(venv / "py.test", "#!" + str(venv / "python") + "\n")
+    assert providers.find_version(str(venv / "py.test")).version == "8.0.0"
@@ -0,0 +1,59 @@
+"""Tests for cli_tool_audit.providers.cargo module."""
+
+import json
+import os
+
+import pytest
+
+import cli_tool_audit.providers as providers
+from cli_tool_audit.providers.cargo import CargoProvider
+
+SOURCE = "(registry+https://github.com/rust-lang/crates.io-index)"
+
+
+@pytest.fixture
+def cargo_home(tmp_path, monkeypatch, providers_enabled):
+    home = tmp_path / "cargo"
+    (home / "bin").mkdir(parents=True)
+    for binary in ("rg", "fd", "cargo"):
+        (home / "bin" / binary).write_bytes(b"\x7fELF")
+        os.utime(home / "bin" / binary, ns=(1_000_000_000, 1_000_000_000))
+    manifest = {
+        "installs": {
+            f"ripgrep 14.1.0 {SOURCE}": {"bins": ["rg"], "profile": "release"},
+            f"fd-find 9.0.0 {SOURCE}": {"bins": ["fd"], "profile": "release"},
+        }
+    }
+    (home / ".crates2.json").write_text(json.dumps(manifest), encoding="utf-8")
+    os.utime(home / ".crates2.json", ns=(2_000_000_000, 2_000_000_000))
+    monkeypatch.setenv("CARGO_HOME", str(home))
+    return home
+
+
+def test_installed_binaries(cargo_home, provider_version):
+    assert providers.find_version(str(cargo_home / "bin" / "rg")) == providers.ProvidedVersion(
+        version="14.1.0", provider="cargo"
+    )
+    assert provider_version(CargoProvider(), cargo_home / "bin" / "fd") == "9.0.0"
+
+
+def test_rustup_proxy_is_not_answered(cargo_home, provider_version):
+    assert provider_version(CargoProvider(), cargo_home / "bin" / "cargo") is None
+
+
+def test_binary_newer_than_manifest_is_run(cargo_home, provider_version):
+    os.utime(cargo_home / "bin" / "rg", ns=(3_000_000_000, 3_000_000_000))
+    assert provider_version(CargoProvider(), cargo_home / "bin" / "rg") is None
+
+
+def test_binary_outside_cargo_home(cargo_home, tmp_path, provider_version):
+    other = tmp_path / "rg"
+    other.write_bytes(b"\x7fELF")
+    assert provider_version(CargoProvider(), other) is None
+
+
+def test_missing_or_broken_manifest(cargo_home, provider_version):
+    (cargo_home / ".crates2.json").write_text("[]", encoding="utf-8")
+    assert provider_version(CargoProvider(), cargo_home / "bin" / "rg") is None
+    (cargo_home / ".crates2.json").unlink()
+    assert provider_version(CargoProvider(), cargo_home / "bin" / "rg") is None
@@ -0,0 +1,88 @@
+"""Tests for cli_tool_audit.providers.conda module."""
+
+import json
+import os
+import sys
+
+import pytest
+
+import cli_tool_audit.providers as providers
+from cli_tool_audit.providers import conda
+from cli_tool_audit.providers.conda import CondaProvider, conda_prefix_for
+
+
+def _record(prefix, name, version, files):
+    record = {"name": name, "version": version, "build": "h1234_0", "files": files}
+    (prefix / "conda-meta" / f"{name}-{version}-h1234_0.json").write_text(json.dumps(record), encoding="utf-8")
+
+
+@pytest.fixture
+def prefix(tmp_path, providers_enabled):
+    env = tmp_path / "envs" / "data"
+    for directory in ("bin", "Library/bin", "conda-meta", "lib"):
+        (env / directory).mkdir(parents=True)
+    for file_path in ("bin/jq", "bin/xz", "bin/black", "Library/bin/sqlite3.exe"):
+        (env / file_path).write_bytes(b"\x7fELF")
+        os.utime(env / file_path, ns=(1_000_000_000, 1_000_000_000))
+    _record(env, "jq", "1.7.1", ["bin/jq", "share/man/man1/jq.1"])
+    _record(env, "xz", "5.4.6", ["bin/xz", "lib/liblzma.so"])
+    _record(env, "sqlite", "3.45.3", ["Library/bin/sqlite3.exe"])
+    os.utime(env / "conda-meta", ns=(2_000_000_000, 2_000_000_000))
+    return env
+
+
+def test_package_executables(prefix, provider_version):
+    assert providers.find_version(str(prefix / "bin" / "jq")) == providers.ProvidedVersion(
+        version="1.7.1", provider="conda"
+    )
+    assert provider_version(CondaProvider(), prefix / "bin" / "xz") == "5.4.6"
+    assert provider_version(CondaProvider(), prefix / "Library" / "bin" / "sqlite3.exe") == "3.45.3"
+
+
+def test_prefix_layouts(prefix, tmp_path):
+    assert conda_prefix_for(str(prefix / "bin" / "jq")) == prefix
+    assert conda_prefix_for(str(prefix / "Library" / "bin" / "sqlite3.exe")) == prefix
+    assert conda_prefix_for(str(prefix / "python.exe")) == prefix
+    assert conda_prefix_for(str(tmp_path / "bin" / "jq")) is None
+
+
+def test_files_no_package_lists_are_run(prefix, provider_version):
+    # Installed with pip, or written by hand.
+    assert provider_version(CondaProvider(), prefix / "bin" / "black") is None
+
+
+def test_modified_after_last_transaction_is_run(prefix, provider_version):
+    os.utime(prefix / "bin" / "jq", ns=(3_000_000_000, 3_000_000_000))
+    assert provider_version(CondaProvider(), prefix / "bin" / "jq") is None
+
+
+def test_broken_record_is_skipped(prefix, provider_version):
+    (prefix / "conda-meta" / "broken-1.0-0.json").write_text("{", encoding="utf-8")
+    os.utime(prefix / "conda-meta", ns=(2_500_000_000, 2_500_000_000))
+    assert provider_version(CondaProvider(), prefix / "bin" / "jq") == "1.7.1"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks")
+def test_link_into_environment(prefix, tmp_path, provider_version):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "jq").symlink_to(prefix / "bin" / "jq")
+    assert provider_version(CondaProvider(), bin_dir / "jq") == "1.7.1"
+
+
+def test_index_is_saved_and_reused(prefix, tmp_path, provider_version):
+    (tmp_path / ".cli_tool_audit_cache").mkdir()
+    os.utime(prefix / "conda-meta", ns=(2_600_000_000, 2_600_000_000))
+    assert provider_version(CondaProvider(), prefix / "bin" / "xz") == "5.4.6"
+    assert list((tmp_path / ".cli_tool_audit_cache").glob("conda_index_*.json"))
+
+    # A new process reads the saved index instead of the records.
+    conda._load_index.cache_clear()
+    for record in (prefix / "conda-meta").glob("xz-*.json"):
+        record.write_text("{", encoding="utf-8")
+    os.utime(prefix / "conda-meta", ns=(2_600_000_000, 2_600_000_000))
+    assert provider_version(CondaProvider(), prefix / "bin" / "xz") == "5.4.6"
+
+    # Until conda changes the environment.
+    os.utime(prefix / "conda-meta", ns=(2_700_000_000, 2_700_000_000))
+    assert provider_version(CondaProvider(), prefix / "bin" / "xz") is None
@@ -0,0 +1,145 @@
+"""Tests for cli_tool_audit.providers.dpkg module."""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+import cli_tool_audit.providers as providers
+import cli_tool_audit.views as views
+from cli_tool_audit.audit_manager import AuditManager
+from cli_tool_audit.models import CliToolConfig, SchemaType
+from cli_tool_audit.providers import InstalledPackage, dpkg
+from cli_tool_audit.providers.dpkg import DpkgProvider, upstream_version
+
+STATUS = """Package: git
+Status: install ok installed
+Priority: optional
+Version: 1:2.39.5-0+deb12u2
+Description: fast, scalable, distributed revision control system
+ Git is popular.
+
+Package: jq
+Status: install ok installed
+Architecture: amd64
+Version: 1.6-2.1
+
+Package: removed-tool
+Status: deinstall ok config-files
+Version: 3.0-1
+"""
+
+
+@pytest.fixture
+def admin(tmp_path, monkeypatch, providers_enabled):
+    root = tmp_path / "root"
+    (root / "usr" / "bin").mkdir(parents=True)
+    for tool in ("git", "jq", "removed-tool", "local-tool"):
+        (root / "usr" / "bin" / tool).write_bytes(b"\x7fELF")
+        os.utime(root / "usr" / "bin" / tool, ns=(1_000_000_000, 1_000_000_000))
+    admin_dir = tmp_path / "dpkg"
+    (admin_dir / "info").mkdir(parents=True)
+    (admin_dir / "status").write_text(STATUS, encoding="utf-8")
+    os.utime(admin_dir / "status", ns=(2_000_000_000, 2_000_000_000))
+    lists = {
+        "git.list": ["/.", "/usr", "/usr/bin", "/usr/bin/git", "/usr/share/doc/git/copyright"],
+        "jq:amd64.list": ["/usr/bin/jq"],
+        "removed-tool.list": ["/usr/bin/removed-tool"],
+    }
+    for name, files in lists.items():
+        lines = [f"{root}{file}" if file.startswith("/usr") else file for file in files]
+        (admin_dir / "info" / name).write_text("\n".join(lines) + "\n", encoding="utf-8")
+    (admin_dir / "info" / "git.md5sums").write_text("", encoding="utf-8")
+    monkeypatch.setenv("DPKG_ADMINDIR", str(admin_dir))
+    return root
+
+
+@pytest.mark.parametrize(
+    "version,expected",
+    [
+        ("1:2.39.5-0+deb12u2", "2.39.5"),
+        ("4.3-4.1", "4.3"),
+        ("1.6", "1.6"),
+        ("1:9.2p1-2+deb12u3", "9.2p1"),
+        ("2.0.0~rc1-1", "2.0.0-rc1"),
+        ("1.34+dfsg-1.2", "1.34"),
+        ("0.99.4+really0.99.3-1", "0.99.3"),
+        ("3.1+ds1-2", "3.1"),
+        ("2.4.1+repack-1", "2.4.1"),
+        ("1.2~dfsg-3", "1.2"),
+        ("5.0+really4.9+dfsg-1", "4.9"),
+    ],
+)
+def test_upstream_version(version, expected):
+    assert upstream_version(version) == expected
+
+
+def test_package_executables(admin, provider_version):
+    assert providers.find_version(str(admin / "usr" / "bin" / "git")) == providers.ProvidedVersion(
+        version="2.39.5", provider="dpkg", package=InstalledPackage(name="git", version="1:2.39.5-0+deb12u2")
+    )
+    assert provider_version(DpkgProvider(), admin / "usr" / "bin" / "jq") == "1.6"
+
+
+def test_unowned_and_removed(admin, provider_version):
+    assert provider_version(DpkgProvider(), admin / "usr" / "bin" / "local-tool") is None
+    assert provider_version(DpkgProvider(), admin / "usr" / "bin" / "removed-tool") is None
+
+
+def test_modified_after_install_is_run(admin, provider_version):
+    os.utime(admin / "usr" / "bin" / "git", ns=(3_000_000_000, 3_000_000_000))
+    assert provider_version(DpkgProvider(), admin / "usr" / "bin" / "git") is None
+
+
+def test_no_database(admin, tmp_path, monkeypatch, provider_version):
+    monkeypatch.setenv("DPKG_ADMINDIR", str(tmp_path / "missing"))
+    assert provider_version(DpkgProvider(), admin / "usr" / "bin" / "git") is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell scripts")
+def test_audit_answers_without_running_and_reports_the_package(admin, monkeypatch, fresh_path_index):
+    calls = admin.parent / "calls.txt"
+    git = admin / "usr" / "bin" / "git"
+    git.write_text(f"#!/bin/sh\necho run >> {calls}\necho git version 2.39.5\n", encoding="utf-8")
+    git.chmod(0o755)
+    os.utime(git, ns=(1_000_000_000, 1_000_000_000))
+    monkeypatch.setenv("PATH", str(admin / "usr" / "bin"))
+
+    result = AuditManager().call_and_check(CliToolConfig(name="git", version=">=2.0.0", schema=SchemaType.SEMVER))
+    assert not calls.exists()
+    assert (result.found_version, result.version_provider) == ("2.39.5", "dpkg")
+    assert (result.package_name, result.package_version) == ("git", "1:2.39.5-0+deb12u2")
+    table = views.pretty_print_results([result], truncate_long_versions=False, include_docs=False)
+    assert "git 1:2.39.5-0+deb12u2" in table.get_string()
+
+    # A snapshot needs the tool's own output, so it is run and no package is reported.
+    result = AuditManager().call_and_check(CliToolConfig(name="git", version="", schema=SchemaType.SNAPSHOT))
+    assert calls.exists()
+    assert result.package_name is None
+
+
+def test_index_is_saved_and_reused(admin, tmp_path, provider_version):
+    (tmp_path / ".cli_tool_audit_cache").mkdir()
+    os.utime(tmp_path / "dpkg" / "status", ns=(2_500_000_000, 2_500_000_000))
+    assert provider_version(DpkgProvider(), admin / "usr" / "bin" / "jq") == "1.6"
+    assert (tmp_path / ".cli_tool_audit_cache" / dpkg.INDEX_NAME).is_file()
+
+    # A new process reads the saved index instead of the list files.
+    dpkg._load_index.cache_clear()
+    (tmp_path / "dpkg" / "info" / "jq:amd64.list").unlink()
+    assert provider_version(DpkgProvider(), admin / "usr" / "bin" / "jq") == "1.6"
+
+    # Until dpkg changes the status file.
+    os.utime(tmp_path / "dpkg" / "status", ns=(2_600_000_000, 2_600_000_000))
+    assert provider_version(DpkgProvider(), admin / "usr" / "bin" / "jq") is None
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux" or not os.path.isfile("/var/lib/dpkg/info/coreutils.list"), reason="needs dpkg"
+)
+def test_real_coreutils(monkeypatch, providers_enabled):
+    monkeypatch.delenv("DPKG_ADMINDIR", raising=False)
+    # Packages list /bin/ls even where /bin is a link to /usr/bin.
+    ls = shutil.which("ls", path="/usr/bin:/bin")
+    assert dpkg.owning_package(os.path.realpath(ls)).name == "coreutils"
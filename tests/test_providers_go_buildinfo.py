@@ -0,0 +1,134 @@
+"""Tests for cli_tool_audit.providers.go_buildinfo module."""
+
+import shutil
+import struct
+
+import pytest
+
+import cli_tool_audit.providers as providers
+from cli_tool_audit.providers.go_buildinfo import GoBuildInfoProvider, main_module_version, read_build_info
+
+BASE_ADDRESS = 0x400000
+BLOB_OFFSET = 0x100
+START = b"0w\xaf\x0c\x92t\x08\x02A\xe1\xc1\x07\xe6\xd6\x18\xe6"
+END = b"\xf92C1\x86\x18 r\x00\x82B\x10A\x16\xd8\xf2"
+
+
+def _modinfo(version="v1.6.2"):
+    return (
+        START
+        + (
+            "path\tgithub.com/example/tool/cmd/tool\n"
+            f"mod\tgithub.com/example/tool\t{version}\th1:abc=\n"
+            "dep\tgolang.org/x/sys\tv0.15.0\th1:def=\n"
+            "build\t-compiler=gc\n"
+        ).encode()
+        + END
+    )
+
+
+def _varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _inline_blob(version="v1.6.2"):
+    header = b"\xff Go buildinf:" + bytes([8, 2]) + bytes(16)
+    go_version = b"go1.22.1"
+    modinfo = _modinfo(version)
+    return header + _varint(len(go_version)) + go_version + _varint(len(modinfo)) + modinfo
+
+
+def _pointer_blob():
+    # Go 1.13 to 1.17: the header points to two string headers, which point to the data.
+    go_version = b"go1.16.15"
+    modinfo = _modinfo("v0.9.0")
+    headers_address = BASE_ADDRESS + BLOB_OFFSET + 32
+    data_address = headers_address + 32
+    header = b"\xff Go buildinf:" + bytes([8, 0])
+    header += struct.pack("<QQ", headers_address, headers_address + 16)
+    string_headers = struct.pack("<QQ", data_address, len(go_version))
+    string_headers += struct.pack("<QQ", data_address + len(go_version), len(modinfo))
+    return header + string_headers + go_version + modinfo
+
+
+def _elf(path, blob, with_sections=True):
+    """Write a minimal 64 bit little endian ELF file with one writable segment holding the blob."""
+    body = bytearray(BLOB_OFFSET)
+    body += blob
+    names = b"\0.shstrtab\0.go.buildinfo\0"
+    names_offset = len(body)
+    body += names
+    while len(body) % 8:
+        body.append(0)
+    section_offset = len(body) if with_sections else 0
+    section_count = 3 if with_sections else 0
+    if with_sections:
+        body += bytes(64)
+        body += struct.pack("<IIQQQQIIQQ", 1, 3, 0, 0, names_offset, len(names), 0, 0, 1, 0)
+        body += struct.pack("<IIQQQQIIQQ", 11, 1, 3, BASE_ADDRESS + BLOB_OFFSET, BLOB_OFFSET, len(blob), 0, 0, 16, 0)
+    ident = b"\x7fELF" + bytes([2, 1, 1]) + bytes(9)
+    header = ident + struct.pack(
+        "<HHIQQQIHHHHHH", 2, 62, 1, BASE_ADDRESS, 64, section_offset, 0, 64, 56, 1, 64, section_count, 1
+    )
+    program_header = struct.pack("<IIQQQQQQ", 1, 6, 0, BASE_ADDRESS, BASE_ADDRESS, len(body), len(body), 0x1000)
+    body[: len(header) + len(program_header)] = header + program_header
+    path.write_bytes(bytes(body))
+    path.chmod(0o755)
+    return path
+
+
+def test_inline_build_info(tmp_path, providers_enabled):
+    tool = _elf(tmp_path / "tool", _inline_blob())
+    go_version, modinfo = read_build_info(str(tool))
+    assert go_version == "go1.22.1"
+    assert modinfo.startswith("path\tgithub.com/example/tool/cmd/tool\n")
+    assert providers.find_version(str(tool)) == providers.ProvidedVersion(version="1.6.2", provider="go-buildinfo")
+
+
+def test_stripped_section_headers(tmp_path, provider_version):
+    tool = _elf(tmp_path / "tool", _inline_blob(), with_sections=False)
+    assert provider_version(GoBuildInfoProvider(), tool) == "1.6.2"
+
+
+def test_pointer_build_info(tmp_path, provider_version):
+    tool = _elf(tmp_path / "tool", _pointer_blob())
+    assert read_build_info(str(tool))[0] == "go1.16.15"
+    assert provider_version(GoBuildInfoProvider(), tool) == "0.9.0"
+
+
+@pytest.mark.parametrize(
+    "version",
+    ["(devel)", "v0.0.0-20240102030405-abcdefabcdef", "v1.2.4-0.20240102030405-abcdefabcdef", "v1.2.3+dirty"],
+)
+def test_unreleased_builds_are_run(tmp_path, version, provider_version):
+    assert provider_version(GoBuildInfoProvider(), _elf(tmp_path / "tool", _inline_blob(version))) is None
+
+
+def test_not_go(tmp_path, provider_version):
+    script = tmp_path / "script"
+    script.write_text("#!/bin/sh\necho 1.0\n", encoding="utf-8")
+    assert provider_version(GoBuildInfoProvider(), script) is None
+    short = tmp_path / "short"
+    short.write_bytes(b"\x7fELF")
+    assert provider_version(GoBuildInfoProvider(), short) is None
+    assert provider_version(GoBuildInfoProvider(), _elf(tmp_path / "c_program", b"no build info here")) is None
+
+
+def test_main_module_version():
+    assert main_module_version("path\texample.com/x\nmod\texample.com/x\tv2.0.1\th1:x=\n") == "2.0.1"
+    assert main_module_version("path\tcommand-line-arguments\n") is None
+
+
+@pytest.mark.skipif(shutil.which("go-junit-report") is None, reason="needs a Go binary")
+def test_real_go_binary():
+    build_info = read_build_info(shutil.which("go-junit-report"))
+    assert build_info is not None
+    assert build_info[0].startswith("go1.")
@@ -0,0 +1,69 @@
+"""Tests for cli_tool_audit.providers.jdk module."""
+
+import os
+import sys
+
+import pytest
+
+import cli_tool_audit.providers as providers
+from cli_tool_audit.audit_manager import AuditManager
+from cli_tool_audit.models import CliToolConfig, SchemaType
+from cli_tool_audit.providers.jdk import JdkProvider, jdk_home_for
+
+RELEASE = 'IMPLEMENTOR="Eclipse Adoptium"\nJAVA_VERSION="17.0.6"\nJAVA_VERSION_DATE="2023-01-17"\n'
+
+
+def _jdk(root, tools=("java", "javac", "jshell", "native-image"), release=RELEASE):
+    (root / "bin").mkdir(parents=True)
+    for tool in tools:
+        (root / "bin" / tool).write_text("#!/bin/sh\nexit 1\n", encoding="utf-8")
+        (root / "bin" / tool).chmod(0o755)
+    if release is not None:
+        (root / "release").write_text(release, encoding="utf-8")
+    return root
+
+
+def test_jdk_tools_share_the_release_file(tmp_path, providers_enabled, provider_version):
+    jdk = _jdk(tmp_path / "jdk-17")
+    assert providers.find_version(str(jdk / "bin" / "java")) == providers.ProvidedVersion(
+        version="17.0.6", provider="jdk"
+    )
+    assert provider_version(JdkProvider(), jdk / "bin" / "javac") == "17.0.6"
+    assert provider_version(JdkProvider(), jdk / "bin" / "jshell") == "17.0.6"
+
+
+def test_other_tools_in_the_jdk_are_not_answered(tmp_path, provider_version):
+    jdk = _jdk(tmp_path / "graalvm")
+    assert provider_version(JdkProvider(), jdk / "bin" / "native-image") is None
+
+
+def test_jdk8_jre(tmp_path, provider_version):
+    jdk = _jdk(tmp_path / "jdk8", release='JAVA_VERSION="1.8.0_292"\n')
+    jre = _jdk(jdk / "jre", tools=("java",), release=None)
+    assert jdk_home_for(str(jre / "bin" / "java")) == jdk
+    assert provider_version(JdkProvider(), jre / "bin" / "java") == "1.8.0_292"
+
+
+def test_no_release_file(tmp_path, provider_version):
+    jdk = _jdk(tmp_path / "jdk", release=None)
+    assert provider_version(JdkProvider(), jdk / "bin" / "java") is None
+
+
+def test_release_file_is_read_again_when_changed(tmp_path, provider_version):
+    jdk = _jdk(tmp_path / "jdk")
+    assert provider_version(JdkProvider(), jdk / "bin" / "java") == "17.0.6"
+    (jdk / "release").write_text('JAVA_VERSION="21.0.2"\n', encoding="utf-8")
+    os.utime(jdk / "release", ns=(1_000_000_000, 1_000_000_000))
+    assert provider_version(JdkProvider(), jdk / "bin" / "java") == "21.0.2"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks")
+def test_audit_follows_link_to_the_jdk(tmp_path, monkeypatch, providers_enabled, fresh_path_index):
+    jdk = _jdk(tmp_path / "jvm" / "java-17")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "java").symlink_to(jdk / "bin" / "java")
+    monkeypatch.setenv("PATH", str(bin_dir))
+    result = AuditManager().call_and_check(CliToolConfig(name="java", version=">=17.0.0", schema=SchemaType.SEMVER))
+    assert result.found_version == "17.0.6"
+    assert result.is_compatible == "Compatible"
@@ -0,0 +1,69 @@
+"""Tests for cli_tool_audit.providers.npm module."""
+
+import json
+import os
+import sys
+
+import pytest
+
+import cli_tool_audit.providers as providers
+from cli_tool_audit.fingerprint import node_package_dir
+from cli_tool_audit.providers.npm import NpmProvider
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="npm links executables with .cmd shims on Windows")
+
+
+def _package(node_modules, name, version, bins):
+    package_dir = node_modules / name
+    (package_dir / "bin").mkdir(parents=True)
+    for target in (bins.values() if isinstance(bins, dict) else [bins]):
+        script = package_dir / target
+        script.write_text("#!/usr/bin/env node\n", encoding="utf-8")
+        script.chmod(0o755)
+    (package_dir / "package.json").write_text(json.dumps({"name": name, "version": version, "bin": bins}))
+    return package_dir
+
+
+def _link(bin_dir, name, target):
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    link = bin_dir / name
+    link.symlink_to(os.path.relpath(target, bin_dir))
+    return str(link)
+
+
+def test_global_install(tmp_path, provider_version):
+    node_modules = tmp_path / "lib" / "node_modules"
+    package_dir = _package(node_modules, "typescript", "5.4.2", {"tsc": "bin/tsc", "tsserver": "bin/tsserver"})
+    assert provider_version(NpmProvider(), _link(tmp_path / "bin", "tsc", package_dir / "bin" / "tsc")) == "5.4.2"
+    tsserver = _link(tmp_path / "bin", "tsserver", package_dir / "bin" / "tsserver")
+    assert provider_version(NpmProvider(), tsserver) == "5.4.2"
+
+
+def test_project_install_with_string_bin(tmp_path, providers_enabled):
+    node_modules = tmp_path / "node_modules"
+    package_dir = _package(node_modules, "prettier", "3.2.5", "bin/prettier.cjs")
+    link = _link(node_modules / ".bin", "prettier", package_dir / "bin" / "prettier.cjs")
+    assert providers.find_version(link) == providers.ProvidedVersion(version="3.2.5", provider="npm")
+
+
+def test_scoped_and_nested_packages(tmp_path, provider_version):
+    node_modules = tmp_path / "node_modules"
+    scoped = _package(node_modules, "@angular/cli", "17.3.0", {"ng": "bin/ng.js"})
+    nested = _package(scoped / "node_modules", "semver", "7.6.0", {"semver": "bin/semver.js"})
+    assert node_package_dir(str(scoped / "bin" / "ng.js")) == str(scoped)
+    assert provider_version(NpmProvider(), str(scoped / "bin" / "ng.js")) == "17.3.0"
+    assert provider_version(NpmProvider(), str(nested / "bin" / "semver.js")) == "7.6.0"
+
+
+def test_undeclared_file_is_not_answered(tmp_path, provider_version):
+    package_dir = _package(tmp_path / "node_modules", "tool", "1.0.0", {"tool": "bin/tool"})
+    helper = package_dir / "bin" / "helper"
+    helper.write_text("#!/usr/bin/env node\n", encoding="utf-8")
+    assert provider_version(NpmProvider(), str(helper)) is None
+    assert provider_version(NpmProvider(), str(tmp_path / "not_in_node_modules")) is None
+
+
+def test_broken_package_json_is_not_answered(tmp_path, provider_version):
+    package_dir = _package(tmp_path / "node_modules", "tool", "1.0.0", {"tool": "bin/tool"})
+    (package_dir / "package.json").write_text("{", encoding="utf-8")
+    assert provider_version(NpmProvider(), str(package_dir / "bin" / "tool")) is None
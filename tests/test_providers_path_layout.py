@@ -0,0 +1,79 @@
+"""Tests for cli_tool_audit.providers.path_layout module."""
+
+import sys
+
+import pytest
+
+import cli_tool_audit.providers as providers
+from cli_tool_audit.audit_manager import AuditManager
+from cli_tool_audit.models import CliToolConfig, SchemaType
+from cli_tool_audit.providers.path_layout import version_from_path
+
+NIX_HASH = "0c9vq5h8v1w7bkqz2zxg7b9lqjw0n1xa"
+
+
+@pytest.mark.parametrize(
+    "real_path,expected",
+    [
+        ("/opt/homebrew/Cellar/git/2.42.0/bin/git", ("homebrew", "2.42.0")),
+        ("/home/linuxbrew/.linuxbrew/Cellar/jq/1.7.1_1/bin/jq", ("homebrew", "1.7.1")),
+        (f"/nix/store/{NIX_HASH}-ripgrep-14.1.0/bin/rg", ("nix", "14.1.0")),
+        (f"/nix/store/{NIX_HASH}-curl-8.4.0-bin/bin/curl", ("nix", "8.4.0")),
+        (f"/nix/store/{NIX_HASH}-python3.11-black-23.10.1/bin/black", ("nix", "23.10.1")),
+        ("/home/me/.asdf/installs/nodejs/20.11.0/bin/node", ("asdf", "20.11.0")),
+        ("/home/me/.asdf/installs/python/3.12.1/bin/python3.12", ("asdf", "3.12.1")),
+        ("/home/me/.local/share/mise/installs/go/1.22.0/bin/go", ("mise", "1.22.0")),
+        ("/home/me/.asdf/installs/golang/1.22.0/go/bin/go", ("asdf", "1.22.0")),
+        ("/home/me/.local/share/mise/installs/go/1.22.0/go/bin/go", ("mise", "1.22.0")),
+        ("/home/me/.nvm/versions/node/v20.11.0/bin/node", ("nvm", "20.11.0")),
+        ("C:\\Users\\me\\.asdf\\installs\\nodejs\\20.11.0\\bin\\node.exe", ("asdf", "20.11.0")),
+    ],
+)
+def test_version_from_path(real_path, expected):
+    assert version_from_path(real_path) == expected
+
+
+@pytest.mark.parametrize(
+    "real_path",
+    [
+        # Not a release.
+        "/opt/homebrew/Cellar/git/HEAD-1a2b3c4/bin/git",
+        # A wrapper around a Python environment, not a Python package.
+        f"/nix/store/{NIX_HASH}-python3-3.11.6-env/bin/python3",
+        # Installed with pip, gem or npm into the runtime's directory.
+        "/home/me/.asdf/installs/python/3.12.1/bin/pip",
+        "/home/me/.asdf/installs/ruby/3.3.0/bin/rubocop",
+        "/home/me/.asdf/installs/golang/1.22.0/packages/bin/golangci-lint",
+        "/home/me/.nvm/versions/node/v20.11.0/lib/node_modules/npm/bin/npm-cli.js",
+        "/usr/local/bin/git",
+    ],
+)
+def test_paths_that_do_not_say(real_path):
+    assert version_from_path(real_path) is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks")
+def test_audit_records_the_provider(tmp_path, monkeypatch, providers_enabled, fresh_path_index):
+    formula = tmp_path / "Cellar" / "fake_tool" / "2.42.0" / "bin"
+    formula.mkdir(parents=True)
+    (formula / "fake_tool").write_text("#!/bin/sh\nexit 1\n", encoding="utf-8")
+    (formula / "fake_tool").chmod(0o755)
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "fake_tool").symlink_to(formula / "fake_tool")
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    assert providers.find_version(str(bin_dir / "fake_tool")) == providers.ProvidedVersion(
+        version="2.42.0", provider="path-layout:homebrew"
+    )
+    result = AuditManager().call_and_check(
+        CliToolConfig(name="fake_tool", version=">=2.0.0", schema=SchemaType.SEMVER)
+    )
+    assert result.found_version == "2.42.0"
+    assert result.version_provider == "path-layout:homebrew"
+
+    monkeypatch.setenv("CLI_TOOL_AUDIT_PROVIDERS", "none")
+    result = AuditManager().call_and_check(
+        CliToolConfig(name="fake_tool", version=">=2.0.0", schema=SchemaType.SEMVER)
+    )
+    assert result.version_provider is None
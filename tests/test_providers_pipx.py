@@ -0,0 +1,92 @@
+"""Tests for cli_tool_audit.providers.pipx module."""
+
+import json
+import os
+import sys
+
+import pytest
+
+import cli_tool_audit.providers as providers
+import cli_tool_audit.providers.pipx as pipx
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="symlinks")
+
+
+def _venv(pipx_home, package, version, apps, injected=None):
+    venv_dir = pipx_home / "venvs" / package
+    (venv_dir / "bin").mkdir(parents=True)
+    for app in apps + [app for _version, injected_apps in (injected or {}).values() for app in injected_apps]:
+        script = venv_dir / "bin" / app
+        script.write_text("#!/bin/sh\nexit 1\n", encoding="utf-8")
+        script.chmod(0o755)
+    metadata = {
+        "main_package": {"package": package, "package_version": version, "apps": apps, "apps_of_dependencies": []},
+        "injected_packages": {
+            name: {"package": name, "package_version": injected_version, "apps": injected_apps}
+            for name, (injected_version, injected_apps) in (injected or {}).items()
+        },
+        "pipx_metadata_version": "0.5",
+    }
+    (venv_dir / "pipx_metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+    return venv_dir
+
+
+@pytest.fixture
+def pipx_home(tmp_path, monkeypatch, providers_enabled):
+    home = tmp_path / "pipx"
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PIPX_HOME", str(home))
+    monkeypatch.setenv("PIPX_BIN_DIR", str(bin_dir))
+    return home
+
+
+def _link(pipx_home, venv_dir, app):
+    link = pipx_home.parent / "bin" / app
+    link.symlink_to(venv_dir / "bin" / app)
+    return str(link)
+
+
+def test_linked_apps_and_injected_packages(pipx_home):
+    venv_dir = _venv(pipx_home, "black", "24.1.0", ["black", "blackd"], injected={"isort": ("5.13.2", ["isort"])})
+    assert providers.find_version(_link(pipx_home, venv_dir, "blackd")) == providers.ProvidedVersion(
+        version="24.1.0", provider="pipx"
+    )
+    assert providers.find_version(_link(pipx_home, venv_dir, "isort")).version == "5.13.2"
+
+
+def test_upgrade_is_read_again(pipx_home):
+    venv_dir = _venv(pipx_home, "ruff", "0.3.0", ["ruff"])
+    link = _link(pipx_home, venv_dir, "ruff")
+    assert providers.find_version(link).version == "0.3.0"
+    metadata_path = venv_dir / "pipx_metadata.json"
+    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    metadata["main_package"]["package_version"] = "0.4.0"
+    metadata_path.write_text(json.dumps(metadata), encoding="utf-8")
+    os.utime(metadata_path, ns=(1_000_000_000, 1_000_000_000))
+    assert providers.find_version(link).version == "0.4.0"
+
+
+def test_not_a_pipx_app(pipx_home, tmp_path):
+    venv_dir = _venv(pipx_home, "black", "24.1.0", ["black"])
+    other = venv_dir / "bin" / "python"
+    other.write_text("", encoding="utf-8")
+    assert pipx.PipxProvider().find_version(str(other), str(other)) is None
+    assert pipx.PipxProvider().find_version(str(tmp_path / "x"), str(tmp_path / "x")) is None
+
+
+def test_copied_windows_apps_are_found_by_name(pipx_home, monkeypatch):
+    _venv(pipx_home, "httpie", "3.2.2", ["http.exe", "https.exe"])
+    copy = pipx_home.parent / "bin" / "http.exe"
+    copy.write_text("", encoding="utf-8")
+    monkeypatch.setattr(pipx.sys, "platform", "win32")
+    assert pipx.PipxProvider().find_version(str(copy), str(copy)) == "3.2.2"
+
+
+def test_pipx_homes_defaults(tmp_path, monkeypatch):
+    monkeypatch.delenv("PIPX_HOME", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    assert pipx.pipx_homes() == []
+    (tmp_path / "data" / "pipx").mkdir(parents=True)
+    assert pipx.pipx_homes() == [tmp_path / "data" / "pipx"]
@@ -0,0 +1,137 @@
+"""Tests for cli_tool_audit.server and cli_tool_audit.client modules."""
+
+import os
+import socket
+import subprocess  # nosec
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from cli_tool_audit import audit_cache, client, server
+from cli_tool_audit.__main__ import main
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets")
+
+
+@pytest.fixture
+def running_server(tmp_path, monkeypatch, enable_network, fresh_path_index):  # pylint: disable=unused-argument
+    # enable_network lifts pytest-network's block on socket.connect, the socket is local.
+    # Socket paths are limited to about 104 bytes, tmp_path can be longer.
+    socket_dir = Path(tempfile.mkdtemp(prefix="cta"))
+    path = socket_dir / "audit.sock"
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setenv("CLI_TOOL_AUDIT_SOCKET", str(path))
+    monkeypatch.chdir(tmp_path)
+    audit_cache.MEMORY_CACHE.clear()
+    thread = threading.Thread(target=server.serve, args=(path,), daemon=True)
+    thread.start()
+    for _ in range(100):
+        if path.exists():
+            break
+        thread.join(0.05)
+    yield path
+    if thread.is_alive():
+        client.request({"command": "shutdown"}, path)
+        thread.join(5)
+    socket_dir.rmdir()
+
+
+@pytest.fixture
+def project(tmp_path, make_script):
+    """Configure fake_tool, returning a function that installs a version of it and the file it logs runs to."""
+
+    def install(version):
+        calls = tmp_path / "calls.txt"
+        make_script(tmp_path / "bin" / "fake_tool", f"#!/bin/sh\necho run >> {calls}\necho {version}\n")
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.cli-tools]\nfake_tool = {version = ">=2.0.0", schema = "semver"}\n', encoding="utf-8"
+        )
+        return calls
+
+    return install
+
+
+def test_ping(running_server):
+    answer = client.request({"command": "ping"}, running_server)
+    assert answer["ok"]
+    assert answer["pid"] == os.getpid()
+
+
+def test_audit_answers_repeat_requests_from_memory(running_server, tmp_path, project):
+    calls = project("2.1.0")
+    message = client.audit_request(tmp_path / "pyproject.toml")
+    first = client.request(message, running_server)
+    second = client.request(message, running_server)
+    assert first["ok"] and not first["failed"]
+    assert first["problems"] == []
+    assert second["results"][0]["found_version"] == "2.1.0"
+    assert calls.read_text(encoding="utf-8").count("run") == 1
+
+
+def test_audit_refuses_other_environments(running_server, tmp_path, project):
+    calls = project("2.1.0")
+    message = client.audit_request(tmp_path / "pyproject.toml")
+    answer = client.request({**message, "path": "/elsewhere/bin"}, running_server)
+    assert not answer["ok"] and "PATH" in answer["error"]
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    answer = client.request({**message, "cwd": str(other_dir)}, running_server)
+    assert not answer["ok"] and str(other_dir) in answer["error"]
+    assert not client.request({"command": "audit", "config": message["config"]}, running_server)["ok"]
+    assert not calls.exists()
+
+
+def test_socket_is_private(running_server):
+    assert running_server.stat().st_mode & 0o777 == 0o600
+
+
+def test_unknown_command_and_bad_request(running_server):
+    assert client.request({"command": "dance"}, running_server) == {"ok": False, "error": "Unknown command 'dance'"}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(running_server))
+        connection.sendall(b"not json\n")
+        answer = connection.makefile("rb").readline()
+    assert b'"ok": false' in answer
+
+
+def test_client_prints_problems(running_server, tmp_path, capsys, project):
+    project("1.0.0")
+    client.main(["--config", str(tmp_path / "pyproject.toml")])
+    assert "fake_tool: Outdated" in capsys.readouterr().out
+
+
+def test_shutdown_stops_server_and_removes_socket(running_server):
+    assert client.main(["--stop"]) == 0
+    for _ in range(100):
+        if not running_server.exists():
+            break
+        threading.Event().wait(0.05)
+    assert not running_server.exists()
+    assert client.main(["--ping"]) == 2
+
+
+def test_second_server_refuses_to_start(running_server, capsys):
+    assert server.serve(running_server) == 1
+    assert "already running" in capsys.readouterr().out
+    assert main(["serve", "--socket", str(running_server)]) == 1
+
+
+def test_socket_path(tmp_path, monkeypatch, project):
+    monkeypatch.delenv("CLI_TOOL_AUDIT_SOCKET", raising=False)
+    assert client.socket_path(Path("/project")) == Path("/project/.cli_tool_audit_cache/audit.sock")
+    long_root = Path("/" + "x" * 120)
+    assert client.socket_path(long_root).parent == Path(tempfile.gettempdir())
+    assert client.CACHE_ROOT_NAME == audit_cache.CACHE_ROOT_NAME
+
+
+def test_client_does_not_import_the_package(source_root):
+    code = "import sys, cli_tool_audit.client; print(sorted(m for m in sys.modules if m.startswith('cli_tool_audit')))"
+    output = subprocess.run(  # nosec
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=source_root
+    )
+    assert output.stdout.strip() == "['cli_tool_audit', 'cli_tool_audit.__about__', 'cli_tool_audit.client']"
@@ -0,0 +1,100 @@
+"""Tests for cli_tool_audit.shadowing module."""
+
+import json
+import os
+import sys
+
+import pytest
+
+from cli_tool_audit import shadowing, views
+from cli_tool_audit.models import CliToolConfig, SchemaType
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell scripts")
+
+
+@pytest.fixture
+def on_path(tmp_path, monkeypatch, fresh_path_index):
+    def set_path(*directories):
+        monkeypatch.setenv("PATH", os.pathsep.join(str(tmp_path / name) for name in directories))
+
+    monkeypatch.chdir(tmp_path)
+    return set_path
+
+
+def test_shadowed_copy_is_reported(tmp_path, on_path, make_script):
+    make_script(tmp_path / "old" / "fake_tool", "#!/bin/sh\necho 1.0.0\n")
+    make_script(tmp_path / "new" / "fake_tool", "#!/bin/sh\necho 2.0.0\n")
+    on_path("old", "new")
+    config = CliToolConfig(name="fake_tool", version=">=2.0.0", schema=SchemaType.SEMVER)
+
+    (report,) = shadowing.audit_all_instances({"fake_tool": config})
+
+    assert [instance.path for instance in report.instances] == [
+        str(tmp_path / "old" / "fake_tool"),
+        str(tmp_path / "new" / "fake_tool"),
+    ]
+    assert report.result.is_problem()
+    assert report.result.tool == "fake_tool"
+    assert report.is_shadowed()
+    assert report.passing_instances() == [report.instances[1]]
+
+
+def test_first_copy_passing_is_not_shadowed(tmp_path, on_path, make_script):
+    make_script(tmp_path / "new" / "fake_tool", "#!/bin/sh\necho 2.0.0\n")
+    make_script(tmp_path / "old" / "fake_tool", "#!/bin/sh\necho 1.0.0\n")
+    on_path("new", "old")
+    config = CliToolConfig(name="fake_tool", version=">=2.0.0", schema=SchemaType.SEMVER)
+
+    (report,) = shadowing.audit_all_instances({"fake_tool": config})
+
+    assert not report.result.is_problem()
+    assert not report.is_shadowed()
+
+
+def test_symlinks_to_one_file_are_checked_once(tmp_path, on_path, make_script):
+    real = make_script(tmp_path / "real" / "fake_tool", "#!/bin/sh\necho 2.0.0\n")
+    (tmp_path / "links").mkdir()
+    (tmp_path / "links" / "fake_tool").symlink_to(real)
+    on_path("links", "real")
+    config = CliToolConfig(name="fake_tool", version=">=2.0.0", schema=SchemaType.SEMVER)
+
+    (report,) = shadowing.audit_all_instances({"fake_tool": config})
+
+    assert report.instances[1].duplicate_of == 1
+    assert report.instances[1].result is report.instances[0].result
+
+
+def test_missing_tool_gets_usual_result(on_path):
+    on_path("empty")
+    (report,) = shadowing.audit_all_instances({"fake_tool": CliToolConfig(name="fake_tool", version=">=1.0.0")})
+    assert report.instances == []
+    assert not report.result.is_available
+
+
+def test_report_names_the_shadowing_copy(tmp_path, on_path, capsys, make_script):
+    make_script(tmp_path / "old" / "fake_tool", "#!/bin/sh\necho 1.0.0\n")
+    make_script(tmp_path / "new" / "fake_tool", "#!/bin/sh\necho 2.0.0\n")
+    on_path("old", "new")
+    config = CliToolConfig(name="fake_tool", version=">=2.0.0", schema=SchemaType.SEMVER)
+
+    views.report_from_pyproject_toml(file_path=None, config_as_dict={"fake_tool": config}, all_instances=True)
+
+    output = capsys.readouterr().out
+    assert "would pass" in output
+    assert f"{tmp_path / 'old' / 'fake_tool'} (" in output
+
+
+def test_json_report_lists_instances(tmp_path, on_path, capsys, make_script):
+    make_script(tmp_path / "old" / "fake_tool", "#!/bin/sh\necho 1.0.0\n")
+    on_path("old")
+    config = CliToolConfig(name="fake_tool", version=">=1.0.0", schema=SchemaType.SEMVER)
+
+    exit_code = views.report_from_pyproject_toml(
+        file_path=None, config_as_dict={"fake_tool": config}, file_format="json", all_instances=True
+    )
+
+    data = json.loads(capsys.readouterr().out)
+    assert exit_code == 0
+    assert data[0]["tool"] == "fake_tool"
+    assert data[0]["shadowed"] is False
+    assert data[0]["instances"][0]["path"] == str(tmp_path / "old" / "fake_tool")
@@ -0,0 +1,66 @@
+"""Cold start imports of the CLI."""
+
+import os
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell scripts")
+
+VERSION_BUDGET_MS = 300
+"""Opt-in ceiling for all imports of `--version`. It takes about 85 ms here, importing every subsystem took 255 ms."""
+JSON_BUDGET_MS = 500
+"""Opt-in ceiling for all imports of `audit --format json`. It takes about 200 ms here, it took about 260 ms."""
+RENDERING_MODULES = ("prettytable", "colorama", "tqdm")
+DEMO_MODULES = (
+    "cli_tool_audit.view_npm_stress_test",
+    "cli_tool_audit.view_pipx_stress_test",
+    "cli_tool_audit.view_venv_stress_test",
+)
+VERSION_HEAVY_MODULES = (
+    RENDERING_MODULES + DEMO_MODULES + ("semver", "packaging", "toml", "tomlkit", "cli_tool_audit.views")
+)
+
+timed = pytest.mark.skipif(
+    not os.environ.get("CLI_TOOL_AUDIT_IMPORT_BUDGETS"), reason="set CLI_TOOL_AUDIT_IMPORT_BUDGETS=1 to time imports"
+)
+
+
+def _heavy(imported: dict[str, int], heavy: tuple[str, ...]) -> list[str]:
+    return [name for name in imported if name in heavy or name.split(".")[0] in heavy]
+
+
+@pytest.fixture
+def project(tmp_path):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / "fake_tool"
+    tool.write_text("#!/bin/sh\necho 2.0.0\n", encoding="utf-8")
+    tool.chmod(0o755)
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.cli-tools]\nfake_tool = {version = ">=2.0.0", schema = "semver"}\n', encoding="utf-8"
+    )
+    return tmp_path
+
+
+def test_version_imports_no_subsystem(import_times):
+    imported, _total = import_times(["-m", "cli_tool_audit", "--version"])
+    assert not _heavy(imported, VERSION_HEAVY_MODULES)
+
+
+def test_audit_json_imports_no_renderers(project, import_times):
+    imported, _total = import_times(["-m", "cli_tool_audit", "audit", "--format", "json"], cwd=project)
+    assert "cli_tool_audit.views" in imported
+    assert not _heavy(imported, RENDERING_MODULES + DEMO_MODULES)
+
+
+@timed
+def test_version_imports_within_budget(import_times):
+    runs = [import_times(["-m", "cli_tool_audit", "--version"]) for _ in range(3)]
+    assert min(total for _times, total in runs) / 1000 < VERSION_BUDGET_MS
+
+
+@timed
+def test_audit_json_imports_within_budget(project, import_times):
+    runs = [import_times(["-m", "cli_tool_audit", "audit", "--format", "json"], cwd=project) for _ in range(3)]
+    assert min(total for _times, total in runs) / 1000 < JSON_BUDGET_MS
@@ -7,7 +7,9 @@ import pytest
 
 from cli_tool_audit.models import CliToolConfig, SchemaType, ToolCheckResult
 from cli_tool_audit.views import (
+    format_age,
     pretty_print_results,
+    process_tools,
     report_from_pyproject_toml,
     should_show_progress_bar,
     summarize_failures,
@@ -247,3 +249,64 @@ class TestReportFormats:
     def test_raises_when_no_file_path_and_no_dict(self):
         with pytest.raises(TypeError):
             report_from_pyproject_toml(file_path=None, config_as_dict=None)
+
+
+# ---------------------------------------------------------------------------
+# format_age and stale results
+# ---------------------------------------------------------------------------
+
+
+class TestFormatAge:
+    def test_unknown(self):
+        assert format_age(None) == "?"
+
+    def test_units(self):
+        assert format_age(5) == "5s"
+        assert format_age(125) == "2m"
+        assert format_age(3 * 3600 + 5) == "3h"
+        assert format_age(2 * 86400) == "2d"
+
+    def test_age_column(self):
+        import datetime
+
+        result = _result()
+        result.checked_at = datetime.datetime.now() - datetime.timedelta(minutes=5)
+        table = pretty_print_results([result], truncate_long_versions=True, include_docs=False, include_age=True)
+        assert "Age" in table.field_names
+        assert "5m" in table.get_string()
+
+
+class TestProcessToolsStaleOk:
+    def test_expired_results_refreshed_in_background(self):
+        import datetime
+
+        fresh = _result("fresh")
+        fresh.checked_at = datetime.datetime.now()
+        stale = _result("stale")
+        stale.checked_at = datetime.datetime.now() - datetime.timedelta(days=90)
+        by_tool = {"fresh": fresh, "stale": stale}
+        tools = {name: CliToolConfig(name=name) for name in by_tool}
+
+        with (
+            patch(
+                "cli_tool_audit.call_and_compatible.check_tool_wrapper",
+                side_effect=lambda info, **_kwargs: by_tool[info[0]],
+            ) as mock_wrapper,
+            patch("cli_tool_audit.audit_cache.AuditFacade") as mock_facade,
+        ):
+            mock_facade.is_expired.side_effect = lambda result: result.tool == "stale"
+            process_tools(tools, stale_ok=True, disable_progress_bar=True)
+
+        assert all(call.kwargs["stale_ok"] for call in mock_wrapper.call_args_list)
+        assert all(call.args[0][3] for call in mock_wrapper.call_args_list), "cache forced on"
+        mock_facade.return_value.refresh_in_background.assert_called_once_with([stale.tool_config])
+
+
+def test_validate_passes_force_cache(tmp_path):
+    from cli_tool_audit.views import validate
+
+    config = tmp_path / "pyproject.toml"
+    config.write_text('[tool.cli-tools]\nmytool = {version = ">=1.0.0"}\n', encoding="utf-8")
+    with patch("cli_tool_audit.views.process_tools", return_value=[]) as mock_process:
+        validate(config, disable_progress_bar=True, force_cache=True)
+    assert mock_process.call_args.kwargs["force_cache"] is True
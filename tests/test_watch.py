@@ -0,0 +1,96 @@
+"""Tests for cli_tool_audit.watch module."""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from cli_tool_audit import watch
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell scripts")
+
+CONFIG = """[tool.cli-tools]
+fake_tool = {version = ">=2.0.0", schema = "semver"}
+other_tool = {version = ">=1.0.0", schema = "semver"}
+"""
+
+
+def _install_fresh(make_script, directory, name, version):
+    path = make_script(directory / name, f"#!/bin/sh\necho {version}\n")
+    # A fresh mtime on the directory and file, even within the file system's timestamp resolution.
+    os.utime(directory, ns=(0, path.stat().st_mtime_ns + 10**9))
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch, fresh_path_index, make_script):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    _install_fresh(make_script, bin_dir, "fake_tool", "1.0.0")
+    _install_fresh(make_script, bin_dir, "other_tool", "1.0.0")
+    config = tmp_path / "pyproject.toml"
+    config.write_text(CONFIG, encoding="utf-8")
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.chdir(tmp_path)
+    return config
+
+
+def test_quiet_poll_checks_nothing(project):
+    watcher = watch.Watcher(project)
+    changed, _removed = watcher.poll()
+    assert sorted(result.tool for result in changed) == ["fake_tool", "other_tool"]
+    with (
+        patch("cli_tool_audit.audit_manager.AuditManager.call_and_check") as mock_check,
+        patch("cli_tool_audit.fingerprint.get_executable_fingerprint") as mock_fingerprint,
+    ):
+        assert watcher.poll() == ([], [])
+    mock_check.assert_not_called()
+    mock_fingerprint.assert_not_called()
+
+
+def test_only_changed_executable_is_checked_again(project, make_script):
+    watcher = watch.Watcher(project)
+    watcher.poll()
+    assert watcher.results["fake_tool"].is_problem()
+    _install_fresh(make_script, project.parent / "bin", "fake_tool", "2.0.0")
+    with patch("cli_tool_audit.views.process_tools", wraps=watch.views.process_tools) as mock_process:
+        changed, _removed = watcher.poll()
+    assert list(mock_process.call_args[0][0]) == ["fake_tool"]
+    assert [result.found_version for result in changed] == ["2.0.0"]
+    assert not watcher.results["fake_tool"].is_problem()
+
+
+def test_config_changes(project):
+    watcher = watch.Watcher(project)
+    watcher.poll()
+    project.write_text('[tool.cli-tools]\nfake_tool = {version = ">=1.0.0", schema = "semver"}\n', encoding="utf-8")
+    changed, removed = watcher.poll()
+    assert removed == ["other_tool"]
+    assert [result.tool for result in changed] == ["fake_tool"]
+    assert watcher.failed() is False
+
+
+def test_watch_prints_changed_rows(project, capsys, make_script):
+    def upgrade(_interval):
+        _install_fresh(make_script, project.parent / "bin", "fake_tool", "2.0.0")
+
+    assert watch.watch(project, interval=0, max_polls=3, sleep=upgrade) == 0
+    output = capsys.readouterr().out
+    assert "Watching" in output
+    assert output.count("changed:") == 1
+    assert output.split("changed:")[1].count("other_tool") == 0
+
+
+def test_changed_stat_is_fingerprinted_again(project):
+    watcher = watch.Watcher(project)
+    watcher.poll()
+    other = project.parent / "bin" / "other_tool"
+    os.utime(other, ns=(0, other.stat().st_mtime_ns + 10**9))
+    with patch(
+        "cli_tool_audit.fingerprint.get_executable_fingerprint", wraps=watch.fingerprint.get_executable_fingerprint
+    ) as mock_fingerprint:
+        changed, _removed = watcher.poll()
+    assert [call.args[0] for call in mock_fingerprint.call_args_list] == ["other_tool"]
+    # Same version, so nothing to print.
+    assert changed == []